@@ -10,6 +10,7 @@ refactors toward a full shared library.
 from .core import (
     BaseScene,
     BaseThreeDScene,
+    CompositeScene,
     NarrativeHelper,
     PacingController,
     MinimalismHelper,
@@ -20,6 +21,7 @@ from .core import (
     show_conflict,
     show_solution,
     show_validation,
+    subtitle_channel,
 )
 from .layout import (
     ensure_safe_bounds,
@@ -44,9 +46,13 @@ from .components import (
     SmartBox,
     FocusArrow,
     NeonLine,
+    TraceCurve,
+    NumericLabel,
 )
 from .utils import (
     safer_text,
+    cached_text,
+    RESOLVED_FONT,
     make_highlight_rect,
     get_quality_config,
     apply_wave_effect,
@@ -54,6 +60,7 @@ from .utils import (
     gradient_color,
     lagged_fade_in,
     wiggle_effect,
+    redraw_on_change,
     QUALITY_CONFIG,
     DEFAULT_QUALITY,
     Quality,
@@ -65,11 +72,20 @@ from .utils import (
     SUBTITLE_CORNER_RADIUS,
     OPACITY_GHOST,
 )
+from .animations import StaggeredReveal
+from .camera import LayerCacheCamera, CachedThreeDCamera
+from .renderer import DryRunRenderer, HoldFrameRenderer
+from .timeline import Timeline
+from .fields import HeightField
+from .surfaces import MeshSurface, LODSurface, GradientColoring, axes_grid_func, colormap_lut
+from .telemetry import RenderTelemetry
+from .imaging import convolve_normalized, pixel_grid
 
 __all__ = [
     # core
     "BaseScene",
     "BaseThreeDScene",
+    "CompositeScene",
     "NarrativeHelper",
     "PacingController",
     "MinimalismHelper",
@@ -80,6 +96,7 @@ __all__ = [
     "show_conflict",
     "show_solution",
     "show_validation",
+    "subtitle_channel",
     # layout
     "ensure_safe_bounds",
     "SAFE_RECT",
@@ -101,8 +118,12 @@ __all__ = [
     "SmartBox",
     "FocusArrow",
     "NeonLine",
+    "TraceCurve",
+    "NumericLabel",
     # utils
     "safer_text",
+    "cached_text",
+    "RESOLVED_FONT",
     "make_highlight_rect",
     "get_quality_config",
     "apply_wave_effect",
@@ -110,6 +131,7 @@ __all__ = [
     "gradient_color",
     "lagged_fade_in",
     "wiggle_effect",
+    "redraw_on_change",
     "QUALITY_CONFIG",
     "DEFAULT_QUALITY",
     "Quality",
@@ -122,6 +144,29 @@ __all__ = [
     "OPACITY_GHOST",
     "MathTexSafe",
     "safe_mathtex",
+    # animations
+    "StaggeredReveal",
+    # camera
+    "LayerCacheCamera",
+    "CachedThreeDCamera",
+    # renderer
+    "HoldFrameRenderer",
+    "DryRunRenderer",
+    # timeline
+    "Timeline",
+    # fields
+    "HeightField",
+    # surfaces
+    "MeshSurface",
+    "LODSurface",
+    "GradientColoring",
+    "axes_grid_func",
+    "colormap_lut",
+    # telemetry
+    "RenderTelemetry",
+    # imaging
+    "convolve_normalized",
+    "pixel_grid",
 ]
 
 # 项目版本标识（与 pyproject 同步维护）
@@ -0,0 +1,227 @@
+"""
+批量动画原语：用一次向量化插值替代成百上千个子动画对象。
+"""
+
+from typing import Callable, Optional, Sequence, Union
+import numpy as np
+from manim import (
+    Animation,
+    Mobject,
+    VMobject,
+    smooth,
+)
+
+# 速率函数查找表的采样数：逐元素调用 rate_func 会退化为 Python 循环
+_RATE_LUT_SAMPLES = 1025
+
+ScalarOrSeq = Union[float, Sequence[float], None]
+
+
+def _per_element(value: ScalarOrSeq, count: int) -> Optional[np.ndarray]:
+    """标量广播为逐元素数组；序列长度须与元素数一致。"""
+    if value is None:
+        return None
+    arr = np.asarray(value, dtype=float)
+    if arr.ndim == 0:
+        return np.full(count, float(arr))
+    if len(arr) != count:
+        raise ValueError(f"逐元素参数长度 {len(arr)} 与元素数 {count} 不一致")
+    return arr
+
+
+class StaggeredReveal(Animation):
+    """
+    向量化错峰显现：对一组子物体施加 LaggedStart 式的错峰进度，
+    但全部透明度 / 线宽 / 缩放 / 位移 / 描绘进度在一次 NumPy 运算中完成。
+
+    - group 的直接子物体即“元素”（与 LaggedStart(*[... for x in group]) 一一对应），
+      无子物体时整体视为单个元素；
+    - 每个元素的时间窗与 Animation.get_sub_alpha 相同：起点 index * lag_ratio；
+    - rate_func 作用于每个元素的局部进度（等价于各子动画自带的速率函数）；
+    - 目标值可为标量或逐元素序列；None 表示保持元素构建时的原值。
+
+    用法：
+        self.play(StaggeredReveal(edge_preview, lag_ratio=0.12, target_opacity=0.85, target_width=3.2))
+        self.play(StaggeredReveal(credits, lag_ratio=0.2, shift=UP * 0.2), run_time=2.2)
+        self.play(StaggeredReveal(tangents, lag_ratio=0.2, draw=True, start_opacity=None))
+    """
+
+    def __init__(
+        self,
+        group: Mobject,
+        lag_ratio: float = 0.1,
+        rate_func: Callable[[float], float] = smooth,
+        start_opacity: ScalarOrSeq = 0.0,
+        target_opacity: ScalarOrSeq = None,
+        start_width: ScalarOrSeq = None,
+        target_width: ScalarOrSeq = None,
+        start_scale: ScalarOrSeq = 1.0,
+        shift: Optional[np.ndarray] = None,
+        draw: bool = False,
+        **kwargs,
+    ):
+        kwargs.setdefault("introducer", True)
+        super().__init__(group, lag_ratio=lag_ratio, rate_func=rate_func, **kwargs)
+        self.start_opacity = start_opacity
+        self.target_opacity = target_opacity
+        self.start_width = start_width
+        self.target_width = target_width
+        self.start_scale = start_scale
+        self.shift = None if shift is None else np.asarray(shift, dtype=float)
+        self.draw = draw
+
+    # ------------------------------------------------------------------
+    # 生命周期
+    # ------------------------------------------------------------------
+    def create_starting_mobject(self) -> Mobject:
+        # 起始状态已打包进缓冲区，无需整组深拷贝
+        return self.mobject
+
+    def begin(self) -> None:
+        self._pack()
+        super().begin()
+
+    def finish(self) -> None:
+        super().finish()
+        self._unpack()
+
+    def _pack(self):
+        elements = list(self.mobject.submobjects) or [self.mobject]
+        n_elem = len(elements)
+        self._n_elem = n_elem
+
+        leaves, leaf_elem = [], []
+        for idx, elem in enumerate(elements):
+            for leaf in elem.family_members_with_points():
+                if isinstance(leaf, VMobject):
+                    leaves.append(leaf)
+                    leaf_elem.append(idx)
+        self._leaves = leaves
+        self._leaf_elem = np.asarray(leaf_elem, dtype=int)
+        self._centers = np.array([elem.get_center() for elem in elements])
+
+        def stack(arrays, width):
+            sizes = np.array([len(a) for a in arrays], dtype=int)
+            owner = np.repeat(self._leaf_elem, sizes)
+            bounds = np.concatenate([[0], np.cumsum(sizes)]).astype(int)
+            data = np.concatenate(arrays).astype(float) if arrays else np.zeros((0, width))
+            return data, owner, bounds
+
+        self._p0, self._p_elem, self._p_bounds = stack([leaf.points for leaf in leaves], 3)
+        self._points = self._p0.copy()
+
+        # 颜色数组：填充 / 描边 / 背景描边，与 set_opacity 的作用范围一致
+        self._rgba = {}
+        for name in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            arrays = [np.array(getattr(leaf, name, np.zeros((1, 4))), dtype=float) for leaf in leaves]
+            data, owner, bounds = stack(arrays, 4)
+            self._rgba[name] = (data, data[:, 3].copy(), owner, bounds)
+
+        self._opacity_from = _per_element(self.start_opacity, n_elem)
+        self._opacity_to = _per_element(self.target_opacity, n_elem)
+
+        w0 = np.array([leaf.get_stroke_width() for leaf in leaves], dtype=float)
+        w_from = _per_element(self.start_width, n_elem)
+        w_to = _per_element(self.target_width, n_elem)
+        self._w_from = w0 if w_from is None else w_from[self._leaf_elem]
+        self._w_to = w0 if w_to is None else w_to[self._leaf_elem]
+        self._animate_width = w_from is not None or w_to is not None
+
+        self._scale_from = _per_element(self.start_scale, n_elem)
+        if self.draw:
+            self._prepare_draw()
+
+        # 叶子数组改为缓冲区视图：此后每帧只写整块缓冲区
+        for leaf, a, b in zip(leaves, self._p_bounds[:-1], self._p_bounds[1:]):
+            leaf.points = self._points[a:b]
+        for name, (data, _, _, bounds) in self._rgba.items():
+            for leaf, a, b in zip(leaves, bounds[:-1], bounds[1:]):
+                setattr(leaf, name, data[a:b])
+
+        grid = np.linspace(0.0, 1.0, _RATE_LUT_SAMPLES)
+        self._lut_x = grid
+        self._lut_y = np.array([self.rate_func(x) for x in grid], dtype=float)
+
+    def _unpack(self):
+        # 结束后断开视图，避免后续 set_points/set_fill 与缓冲区互相干扰
+        for leaf in self._leaves:
+            leaf.points = np.array(leaf.points)
+            for name in self._rgba:
+                setattr(leaf, name, np.array(getattr(leaf, name)))
+
+    def _prepare_draw(self):
+        # 每 4 个点一段三次贝塞尔；记录每段在所属叶子中的序号与段数
+        nppc = 4
+        curve_leaf = np.repeat(np.arange(len(self._leaves)), np.diff(self._p_bounds) // nppc)
+        n_curves = np.bincount(curve_leaf, minlength=len(self._leaves))
+        first = np.concatenate([[0], np.cumsum(n_curves)[:-1]]).astype(int)
+        self._curve_leaf = curve_leaf
+        self._curve_local = np.arange(len(curve_leaf)) - first[curve_leaf]
+        self._curve_count = n_curves[curve_leaf]
+        self._curve_first = first[curve_leaf]
+
+    # ------------------------------------------------------------------
+    # 插值
+    # ------------------------------------------------------------------
+    def _element_alphas(self, alpha: float) -> np.ndarray:
+        n = self._n_elem
+        full_length = (n - 1) * self.lag_ratio + 1
+        raw = np.clip(alpha * full_length - np.arange(n) * self.lag_ratio, 0.0, 1.0)
+        return np.interp(raw, self._lut_x, self._lut_y)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self._leaves:
+            return
+        a = self._element_alphas(alpha)
+
+        for data, base_alpha, owner, _ in self._rgba.values():
+            start = base_alpha if self._opacity_from is None else self._opacity_from[owner]
+            end = base_alpha if self._opacity_to is None else self._opacity_to[owner]
+            data[:, 3] = start + (end - start) * a[owner]
+
+        if self._animate_width:
+            widths = self._w_from + (self._w_to - self._w_from) * a[self._leaf_elem]
+            for leaf, w in zip(self._leaves, widths):
+                leaf.stroke_width = w
+
+        points = self._partial_points(a) if self.draw else self._p0
+        owner = self._p_elem
+        centers = self._centers[owner]
+        if self._scale_from is not None:
+            s = self._scale_from + (1.0 - self._scale_from) * a
+            points = centers + s[owner, None] * (points - centers)
+        if self.shift is not None:
+            points = points - (1.0 - a[owner, None]) * self.shift
+        self._points[:] = points
+
+    def _partial_points(self, a: np.ndarray) -> np.ndarray:
+        """等价于逐叶子 pointwise_become_partial(0, alpha) 的整体向量化版本。"""
+        curves = self._p0.reshape(-1, 4, 3)
+        if not len(curves):
+            return self._p0
+        leaf_alpha = a[self._leaf_elem][self._curve_leaf]
+        u = np.clip(leaf_alpha * self._curve_count - self._curve_local, 0.0, 1.0)[:, None]
+
+        # de Casteljau 截取 [0, u] 段
+        p0, p1, p2, p3 = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+        q0 = p0
+        q1 = p0 + u * (p1 - p0)
+        p12 = p1 + u * (p2 - p1)
+        q2 = q1 + u * (p12 - q1)
+        p23 = p2 + u * (p3 - p2)
+        p123 = p12 + u * (p23 - p12)
+        q3 = q2 + u * (p123 - q2)
+        out = np.stack([q0, q1, q2, q3], axis=1)
+
+        # 尚未开始的段塌缩到当前描绘端点（与 Create 一致）
+        idx = np.arange(len(curves))
+        started = np.where(u[:, 0] > 0, idx, -1)
+        last = np.maximum.accumulate(started)
+        pending = last < self._curve_first
+        tail = np.where(pending[:, None], curves[self._curve_first, 0], out[np.maximum(last, 0), 3])
+        idle = u[:, 0] <= 0
+        out[idle] = tail[idle, None, :]
+        return out.reshape(-1, 3)
+
+
+__all__ = ["StaggeredReveal"]
@@ -0,0 +1,197 @@
+"""
+相机扩展：按 LayerManager 分层缓存静态背景位图；3D 相机静止时复用深度排序、着色与投影。
+"""
+
+import hashlib
+import weakref
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from manim import Camera, Mobject, ThreeDCamera
+
+from manim_lib.core import LayerManager
+
+# 参与指纹的逐物体状态：几何 + 颜色（VMobject / PMobject / ImageMobject）
+_STATE_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas", "pixel_array")
+_STATE_SCALARS = ("z_index", "stroke_width", "background_stroke_width", "sheen_factor")
+
+
+class LayerCacheCamera(Camera):
+    """
+    2D 相机：z_index <= cache_layer 的物体只在内容变化时光栅化一次。
+
+    - 仅当画布刚被 reset() 到纯背景时启用（渲染器的逐帧/逐 play 静态帧都走这条路径）；
+    - 静态层按 z 序排在最底部，先恢复缓存位图，再在其上绘制其余动态层；
+    - 缓存键覆盖相机取景、背景以及每个静态物体的点、颜色、线宽与 z_index，
+      任一变化即自动失效重绘；
+    - 背景按像素内容计入键：换了背景数组（init_background、直接赋值）时重新摘要一次，
+      同一数组对象以弱引用识别，不会因新数组复用旧数组的 id 而误命中；原地改写背景像素后需 invalidate_layer_cache()。
+    """
+
+    cache_layer: float = LayerManager.L_BG
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_background = False
+        self._layer_key: Optional[bytes] = None
+        self._layer_pixels: Optional[np.ndarray] = None
+        self._background_ref: Optional[weakref.ref] = None
+        self._background_digest = b""
+        self.layer_cache_hits = 0
+        self.layer_cache_misses = 0
+
+    def reset(self):
+        super().reset()
+        self._on_background = True
+        return self
+
+    def set_frame_to_background(self, background):
+        super().set_frame_to_background(background)
+        self._on_background = False
+
+    def invalidate_layer_cache(self):
+        self._layer_key = None
+        self._layer_pixels = None
+        self._background_ref = None
+
+    def _background_key(self) -> bytes:
+        background = self.background
+        if self._background_ref is None or self._background_ref() is not background:
+            self._background_ref = weakref.ref(background)
+            self._background_digest = hashlib.blake2b(np.ascontiguousarray(background).tobytes(), digest_size=16).digest()
+        return self._background_digest
+
+    def _fingerprint(self, mobjects: List[Mobject]) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        frame = [*self.frame_center, self.frame_width, self.frame_height, self.pixel_width, self.pixel_height]
+        digest.update(np.asarray(frame, dtype=float).tobytes())
+        digest.update(self._background_key())
+        for mob in mobjects:
+            scalars = [id(mob)] + [float(np.sum(getattr(mob, name, 0.0))) for name in _STATE_SCALARS]
+            scalars.extend(getattr(mob, "sheen_direction", ()))
+            digest.update(np.asarray(scalars, dtype=float).tobytes())
+            for name in _STATE_ARRAYS:
+                arr = getattr(mob, name, None)
+                if isinstance(arr, np.ndarray):
+                    digest.update(np.ascontiguousarray(arr).tobytes())
+        return digest.digest()
+
+    def capture_mobjects(self, mobjects: Iterable[Mobject], **kwargs):
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        if self._on_background and self.use_z_index:
+            # z 序已排好：静态层是列表的前缀
+            split = 0
+            while split < len(mobjects) and mobjects[split].z_index <= self.cache_layer:
+                split += 1
+            if split:
+                self._capture_static(mobjects[:split])
+                mobjects = mobjects[split:]
+        self._on_background = False
+        super().capture_mobjects(mobjects, include_submobjects=False)
+
+    def _capture_static(self, static: List[Mobject]):
+        key = self._fingerprint(static)
+        if key == self._layer_key:
+            self.set_pixel_array(self._layer_pixels)
+            self.layer_cache_hits += 1
+            return
+        super().capture_mobjects(static, include_submobjects=False)
+        self._layer_key = key
+        self._layer_pixels = np.array(self.pixel_array)
+        self.layer_cache_misses += 1
+
+
+class CachedThreeDCamera(ThreeDCamera):
+    """
+    3D 相机：机位不变时，逐物体缓存深度键、明暗着色结果与投影后的点。
+
+    - 视角键 = 旋转矩阵 + frame_center + 焦距 + 缩放 + 光源位置，每次截帧时检查，变化即整体失效；
+    - 每个缓存项以物体当前 points（着色另加 rgbas）的字节内容校验，
+      只有移动过的物体（如扫描框）重新计算，其余直接复用；
+    - 着色缓存每个物体每个颜色槽（填充 / 描边 / 背景描边）只留最近一份，淡入淡出时逐帧覆盖而非累积；
+    - fixed_orientation 物体的投影依赖中心回调，不缓存；缓存以弱引用挂在物体上，随物体释放。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._view_key: Optional[bytes] = None
+        self._z_cache: "weakref.WeakKeyDictionary[Mobject, tuple]" = weakref.WeakKeyDictionary()
+        self._shade_cache: "weakref.WeakKeyDictionary[Mobject, Dict[str, tuple]]" = weakref.WeakKeyDictionary()
+        self._projection_cache: "weakref.WeakKeyDictionary[Mobject, tuple]" = weakref.WeakKeyDictionary()
+        self.view_cache_hits = 0
+        self.view_cache_misses = 0
+
+    def invalidate_view_cache(self):
+        self._z_cache.clear()
+        self._shade_cache.clear()
+        self._projection_cache.clear()
+
+    def _check_view(self):
+        view = np.concatenate(
+            [
+                self.get_rotation_matrix().ravel(),
+                self.frame_center,
+                [self.get_focal_distance(), self.get_zoom(), float(self.exponential_projection)],
+                self.light_source.points[0],
+            ]
+        ).tobytes()
+        if view != self._view_key:
+            self._view_key = view
+            self.invalidate_view_cache()
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        # capture_mobjects 已先 reset_rotation_matrix，这里即本帧机位
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        self._check_view()
+        rot_z = self.get_rotation_matrix()[2]
+
+        def z_key(mob):
+            if not getattr(mob, "shade_in_3d", False):
+                return np.inf
+            if getattr(mob, "z_index_group", mob) is not mob:
+                return np.dot(mob.get_z_index_reference_point(), rot_z)
+            state = mob.points.tobytes()
+            cached = self._z_cache.get(mob)
+            if cached is not None and cached[0] == state:
+                self.view_cache_hits += 1
+                return cached[1]
+            self.view_cache_misses += 1
+            z = np.dot(mob.get_z_index_reference_point(), rot_z)
+            self._z_cache[mob] = (state, z)
+            return z
+
+        return sorted(mobjects, key=z_key)
+
+    def get_stroke_rgbas(self, vmobject, background=False):
+        slot = "background_stroke" if background else "stroke"
+        return self.modified_rgbas(vmobject, vmobject.get_stroke_rgbas(background), slot=slot)
+
+    def get_fill_rgbas(self, vmobject):
+        return self.modified_rgbas(vmobject, vmobject.get_fill_rgbas(), slot="fill")
+
+    def modified_rgbas(self, vmobject, rgbas, slot: str = "fill"):
+        if not self.should_apply_shading or not vmobject.shade_in_3d or vmobject.get_num_points() == 0:
+            return rgbas
+        state = vmobject.points.tobytes()
+        colors = rgbas.tobytes()
+        slots: Dict[str, tuple] = self._shade_cache.setdefault(vmobject, {})
+        cached = slots.get(slot)
+        if cached is not None and cached[0] == state and cached[1] == colors:
+            return cached[2]
+        shaded = super().modified_rgbas(vmobject, rgbas)
+        slots[slot] = (state, colors, shaded)
+        return shaded
+
+    def transform_points_pre_display(self, mobject, points):
+        if mobject in self.fixed_in_frame_mobjects or mobject in self.fixed_orientation_mobjects:
+            return super().transform_points_pre_display(mobject, points)
+        state = points.tobytes()
+        cached = self._projection_cache.get(mobject)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        projected = super().transform_points_pre_display(mobject, points)
+        self._projection_cache[mobject] = (state, projected)
+        return projected
+
+
+__all__ = ["LayerCacheCamera", "CachedThreeDCamera"]
@@ -2,11 +2,14 @@
 可复用视觉组件（去版本化）。
 """
 
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from manim import (
     Scene,
-    Text,
+    MathTex,
     VGroup,
+    VMobject,
+    ValueTracker,
     BackgroundRectangle,
     SurroundingRectangle,
     Arrow,
@@ -15,25 +18,39 @@ from manim import (
     GREY_C,
     WHITE,
     FadeIn,
+    FadeOut,
+    Transform,
     Create,
     Mobject,
     ORIGIN,
     DOWN,
+    LEFT,
 )
 
 from manim_lib.style import PALETTE
 from manim_lib.layout import SAFE_RECT
+from manim_lib.utils import cached_text
 
 
 class SubtitleManager:
     """
     影院级字幕管理器：智能断行、稳定背景条、底部固定。
+
+    - persistent_bar=True：背景条只创建一次，换字幕时原地变形并与文字交叉淡化，
+      旧字幕随即移出场景与 fixed-in-frame 注册表；
+    - prerender()：在场景开头按内容预排版本场景全部字幕（可选线程池），
+      show() 时只做一次拷贝。
     """
 
-    def __init__(self, scene: Scene):
+    BAR_MIN_WIDTH = 8.0
+
+    def __init__(self, scene: Scene, persistent_bar: bool = False):
         self.scene = scene
+        self.persistent_bar = persistent_bar
         self.current_subtitle: Optional[Mobject] = None
         self.current_bg: Optional[Mobject] = None
+        self._prebuilt: Dict[tuple, Mobject] = {}
+        self._bar: Optional[Mobject] = None
 
     def _smart_break_text(self, text: str, max_chars: int = 24) -> str:
         if len(text) <= max_chars:
@@ -62,22 +79,15 @@ class SubtitleManager:
             read_time += 1.0
         return max(3.0, read_time)
 
-    def show(
-        self,
-        text: str,
-        duration: Optional[float] = None,
-        color: str = WHITE,
-        font_size: float = 28,
-        wait_after: float = None,
-        fade_in: bool = True,
-    ):
-        from manim_lib.core import PacingController  # lazy import to avoid cycle
+    # ------------------------------------------------------------------
+    # 构建与预渲染
+    # ------------------------------------------------------------------
+    def _key(self, text: str, color, font_size: float) -> tuple:
+        return (self._smart_break_text(text), float(font_size), str(color))
 
+    def _build_subtitle(self, text: str, color, font_size: float) -> Mobject:
         formatted = self._smart_break_text(text)
-        try:
-            subtitle = Text(formatted, font_size=font_size, color=color, font="SimHei", line_spacing=1.2)
-        except Exception:
-            subtitle = Text(formatted, font_size=font_size, color=color, line_spacing=1.2)
+        subtitle = cached_text(formatted, font_size=font_size, color=color, line_spacing=1.2)
 
         max_w = SAFE_RECT["width"] - 1.0
         if subtitle.width > max_w:
@@ -87,7 +97,15 @@ class SubtitleManager:
 
         subtitle.move_to(ORIGIN)
         subtitle.to_edge(DOWN, buff=0.5)
+        return subtitle
+
+    def _subtitle(self, text: str, color, font_size: float) -> Mobject:
+        key = self._key(text, color, font_size)
+        if key not in self._prebuilt:
+            self._prebuilt[key] = self._build_subtitle(text, color, font_size)
+        return self._prebuilt[key].copy()
 
+    def _make_bg(self, subtitle: Mobject) -> Mobject:
         bg = BackgroundRectangle(
             subtitle,
             color=BLACK,
@@ -96,19 +114,114 @@ class SubtitleManager:
             stroke_width=0,
             corner_radius=0.1,
         )
-        if bg.width < 8.0:
-            bg.stretch_to_fit_width(8.0)
+        if bg.width < self.BAR_MIN_WIDTH:
+            bg.stretch_to_fit_width(self.BAR_MIN_WIDTH)
+        return bg
 
-        group = VGroup(bg, subtitle)
-        self.scene.add_fixed_in_frame_mobjects(group)
+    @staticmethod
+    def collect_texts(*scene_classes) -> List[str]:
+        """静态扫描各场景 construct 源码中 `xxx.show("...")` 的字面量字幕（去重、保序）。"""
+        import ast
+        import inspect
+        import textwrap
+
+        texts: List[str] = []
+        for cls in scene_classes:
+            try:
+                source = textwrap.dedent(inspect.getsource(cls.construct))
+            except (OSError, TypeError):
+                continue
+            for node in ast.walk(ast.parse(source)):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "show"
+                    and node.args
+                    and isinstance(node.args[0], ast.Constant)
+                    and isinstance(node.args[0].value, str)
+                ):
+                    texts.append(node.args[0].value)
+        return list(dict.fromkeys(texts))
 
-        if fade_in:
-            self.scene.play(FadeIn(group, shift=DOWN * -0.1), run_time=0.5)
+    def prerender(
+        self,
+        texts: Sequence[str],
+        color: str = WHITE,
+        font_size: float = 28,
+        workers: int = 0,
+        keep_others: bool = False,
+    ) -> int:
+        """
+        预排版字幕并按内容缓存；workers > 0 时用线程池并行构建。返回新构建的条数。
+        keep_others=False 时释放不在本次列表中的旧模板（通道跨分场景复用时避免累积）。
+        """
+        if not keep_others:
+            wanted = {self._key(t, color, font_size) for t in texts}
+            self._prebuilt = {k: v for k, v in self._prebuilt.items() if k in wanted}
+        pending = list(dict.fromkeys(t for t in texts if self._key(t, color, font_size) not in self._prebuilt))
+        if workers > 0 and len(pending) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                built = list(pool.map(lambda t: self._build_subtitle(t, color, font_size), pending))
         else:
-            self.scene.add(group)
+            built = [self._build_subtitle(t, color, font_size) for t in pending]
+        for text, subtitle in zip(pending, built):
+            self._prebuilt[self._key(text, color, font_size)] = subtitle
+        return len(pending)
 
-        self.current_subtitle = subtitle
-        self.current_bg = bg
+    # ------------------------------------------------------------------
+    # 场景注册
+    # ------------------------------------------------------------------
+    def _fix_in_frame(self, *mobjects: Mobject):
+        # 2D 场景没有 fixed-in-frame 概念，直接 add 即可
+        if hasattr(self.scene, "add_fixed_in_frame_mobjects"):
+            self.scene.add_fixed_in_frame_mobjects(*mobjects)
+        else:
+            self.scene.add(*mobjects)
+
+    def _unfix(self, *mobjects: Mobject):
+        if hasattr(self.scene, "remove_fixed_in_frame_mobjects"):
+            self.scene.remove_fixed_in_frame_mobjects(*mobjects)
+
+    def _evict(self, *mobjects: Optional[Mobject]):
+        mobjects = [m for m in mobjects if m is not None]
+        if mobjects:
+            self.scene.remove(*mobjects)
+            self._unfix(*mobjects)
+
+    # ------------------------------------------------------------------
+    # 显示 / 清除
+    # ------------------------------------------------------------------
+    def show(
+        self,
+        text: str,
+        duration: Optional[float] = None,
+        color: str = WHITE,
+        font_size: float = 28,
+        wait_after: float = None,
+        fade_in: bool = True,
+    ):
+        from manim_lib.core import PacingController  # lazy import to avoid cycle
+
+        subtitle = self._subtitle(text, color, font_size)
+        if self.persistent_bar:
+            self._show_on_bar(subtitle, fade_in)
+        else:
+            bg = self._make_bg(subtitle)
+            # 分别注册 bg 与 subtitle（不注册外层 VGroup）：_evict 逐出的正是这两个物体，
+            # 外层组若进了 fixed-in-frame 注册表就会一直留在里面，连带引用旧字幕
+            self._fix_in_frame(bg, subtitle)
+
+            if fade_in:
+                self.scene.play(FadeIn(VGroup(bg, subtitle), shift=DOWN * -0.1), run_time=0.5)
+            else:
+                self.scene.add(bg, subtitle)
+
+            # 新字幕已完全覆盖旧字幕：逐出旧的一组，避免在场物体随旁白增长
+            self._evict(self.current_bg, self.current_subtitle)
+            self.current_subtitle = subtitle
+            self.current_bg = bg
 
         if duration is None:
             duration = self._calculate_duration(text)
@@ -117,13 +230,39 @@ class SubtitleManager:
         else:
             PacingController.slow_wait(self.scene, wait_after)
 
+    def _show_on_bar(self, subtitle: Mobject, fade_in: bool):
+        target = self._make_bg(subtitle)
+        old = self.current_subtitle
+        if self._bar is None:
+            self._bar = target
+        if old is None:
+            # 背景条不在画面上：静默变形到新尺寸后与文字一起淡入
+            self._bar.become(target)
+            self._fix_in_frame(self._bar, subtitle)
+            if fade_in:
+                self.scene.play(FadeIn(VGroup(self._bar, subtitle), shift=DOWN * -0.1), run_time=0.5)
+        else:
+            self._fix_in_frame(subtitle)
+            if fade_in:
+                self.scene.play(
+                    Transform(self._bar, target),
+                    FadeOut(old),
+                    FadeIn(subtitle, shift=DOWN * -0.1),
+                    run_time=0.5,
+                )
+            else:
+                self._bar.become(target)
+            self._evict(old)
+
+        self.current_subtitle = subtitle
+        self.current_bg = self._bar
+
     def clear(self, fade_out: bool = True):
         if self.current_subtitle and self.current_bg:
             group = VGroup(self.current_bg, self.current_subtitle)
             if fade_out:
-                self.scene.play(FadeIn(group, shift=DOWN * 0.0).reverse(), run_time=0.3)  # 简单淡出
-            else:
-                self.scene.remove(group)
+                self.scene.play(FadeOut(group), run_time=0.3)  # 简单淡出
+            self._evict(self.current_bg, self.current_subtitle)
             self.current_subtitle = None
             self.current_bg = None
 
@@ -180,5 +319,281 @@ class NeonLine:
         return VGroup(shadow, line)
 
 
-__all__ = ["SubtitleManager", "SmartBox", "FocusArrow", "NeonLine"]
+# 数值标签可用的字形：数字、正负号、小数点、千分位
+_NUMERIC_GLYPHS = "0123456789-+.,"
+
+
+def _is_slot(part: str) -> bool:
+    return part.startswith("{:") and part.endswith("}")
+
+
+class _GlyphAtlas:
+    """
+    字形图集：数字/符号与固定前缀在一次 MathTex 编译中生成，记录每个字形的
+    宽度、相对基线的纵向偏移，以及 TeX 排版的笔位偏移与推进宽度。同参数全进程共享。
+    """
+
+    _atlases: Dict[tuple, "_GlyphAtlas"] = {}
+
+    @classmethod
+    def get(cls, fragments: Sequence[str], font_size: float, color) -> "_GlyphAtlas":
+        key = (tuple(fragments), float(font_size), str(color))
+        if key not in cls._atlases:
+            cls._atlases[key] = cls(fragments, font_size, color)
+        return cls._atlases[key]
+
+    def __init__(self, fragments: Sequence[str], font_size: float, color):
+        self.font_size = font_size
+        self.color = color
+        chars = list(_NUMERIC_GLYPHS)
+        keys = [("char", c) for c in chars] + [("frag", f) for f in fragments]
+        # 参考串 0 x₁ 0 x₂ 0 … 0：每个字形 / 片段夹在两个 “0” 之间排版，
+        # 由相邻 “0” 的左缘量出 TeX 的推进宽度（含字形两侧留白与片段前后间距）
+        tex_parts = []
+        for kind, item in keys:
+            tex_parts += ["{0}", "{" + item + "}" if kind == "char" else item]
+        tex_parts.append("{0}")
+        subs = MathTex(*tex_parts, font_size=font_size, color=color).submobjects
+
+        zero = 2 * chars.index("0") + 1
+        baseline = subs[zero].get_bottom()[1]
+        zero_advance = subs[zero].get_left()[0] - subs[zero - 1].get_left()[0]
+
+        # key -> (字形, 宽度, 中心相对基线的偏移, 墨迹左缘相对笔位的偏移, 推进宽度)
+        # 笔位以 “0” 的墨迹左缘为准；纯间距片段（如 \;）没有路径，只有推进宽度
+        self.glyphs: Dict[tuple, Tuple[VMobject, float, float, float, float]] = {}
+        for i, key in enumerate(keys):
+            before, mob, after = subs[2 * i], subs[2 * i + 1], subs[2 * i + 2]
+            pen = before.get_left()[0] + zero_advance
+            advance = after.get_left()[0] - pen
+            if mob.width > 0:
+                self.glyphs[key] = (mob, mob.width, mob.get_center()[1] - baseline, mob.get_left()[0] - pen, advance)
+            else:
+                self.glyphs[key] = (mob, 0.0, 0.0, 0.0, advance)
+
+
+class NumericLabel(VGroup):
+    """
+    免 LaTeX 的数值标签：数字、符号与固定前缀的字形只编译一次（字形图集），
+    之后每次 set_value 只拷贝、按 TeX 推进宽度摆放缓存的字形路径，不再触发 latex/dvisvgm 子进程。
+
+    - 字符串参数为固定 TeX 片段；形如 "{:.2f}" 的参数为数值槽；
+    - 格式化结果相同则直接返回，静止等待零开销；
+    - 图集外的字符（如 "{:.3g}" 产生的 e、nan、inf）退回整串 MathTex 重排，不中断渲染；
+    - 更新时保持 align 一侧与基线不动（例如 to_edge(UR) 后用 align=RIGHT），
+      颜色、透明度与 z_index 沿用更新前的字形。
+
+    用法：
+        slope_text = NumericLabel("f'(", "{:.1f}", r") \approx ", "{:.2f}", font_size=28)
+        slope_text.add_updater(lambda m: m.set_value(t.get_value(), slope(t.get_value())))
+    """
+
+    def __init__(
+        self,
+        *parts: str,
+        values: Optional[Sequence[float]] = None,
+        font_size: float = 28,
+        color=WHITE,
+        align: np.ndarray = LEFT,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.parts = parts
+        self.align = np.asarray(align, dtype=float)
+        n_slots = sum(1 for p in parts if _is_slot(p))
+        self._atlas = _GlyphAtlas.get([p for p in parts if not _is_slot(p)], font_size, color)
+        self._keys: List[tuple] = []
+        # 与 submobjects 一一对应：(参考宽度, 中心相对基线的偏移)，用于推回当前缩放与基线
+        self._metrics: List[Tuple[float, float]] = []
+        self.set_value(*(values if values is not None else [0.0] * n_slots))
+        self.move_to(ORIGIN)
+
+    def _texts(self, values: Sequence[float]) -> List[Tuple[bool, str]]:
+        it = iter(values)
+        return [(True, part.format(next(it))) if _is_slot(part) else (False, part) for part in self.parts]
+
+    @staticmethod
+    def _tokens(texts: Sequence[Tuple[bool, str]]) -> List[tuple]:
+        tokens = []
+        for is_slot, text in texts:
+            if is_slot:
+                tokens.extend(("char", c) for c in text)
+            else:
+                tokens.append(("frag", text))
+        return tokens
+
+    def _layout(self, keys: Sequence[tuple]) -> Tuple[List[VMobject], List[Tuple[float, float]]]:
+        pieces, metrics, cursor = [], [], 0.0
+        for key in keys:
+            mob, width, y_off, offset, advance = self._atlas.glyphs[key]
+            if width > 0:
+                piece = mob.copy()
+                piece.move_to(np.array([cursor + offset + width / 2, y_off, 0.0]))
+                pieces.append(piece)
+                metrics.append((width, y_off))
+            cursor += advance
+        return pieces, metrics
+
+    def _typeset(self, texts: Sequence[Tuple[bool, str]]) -> Tuple[List[VMobject], List[Tuple[float, float]]]:
+        """图集外字符的退路：整串 MathTex 重排，前置一个 “0” 对齐到图集的基线。"""
+        parts = ["{" + text.replace("%", r"\%") + "}" if is_slot else text for is_slot, text in texts]
+        tex = MathTex("{0}", *parts, font_size=self._atlas.font_size, color=self._atlas.color)
+        ref = tex.submobjects[0]
+        tex.shift(np.array([-ref.get_left()[0], -ref.get_bottom()[1], 0.0]))
+        pieces = [mob for mob in tex.submobjects[1:] if mob.width > 0]
+        return pieces, [(mob.width, mob.get_center()[1]) for mob in pieces]
+
+    def set_value(self, *values: float) -> "NumericLabel":
+        texts = self._texts(values)
+        keys = self._tokens(texts)
+        if keys == self._keys:
+            return self
+
+        # 以旧字形推回当前基线、缩放与对齐点，保证 to_edge/shift/scale 之后原位更新
+        scale, anchor, template = 1.0, None, None
+        if self.submobjects:
+            for (ref_w, y_off), child in zip(self._metrics, self.submobjects):
+                if ref_w > 1e-6 and child.width > 1e-6:
+                    scale = child.width / ref_w
+                    baseline = child.get_center()[1] - y_off * scale
+                    break
+            else:
+                baseline = self.get_center()[1]
+            anchor = (self.get_critical_point(self.align)[0], baseline)
+            template = self.submobjects[0]
+
+        if all(key in self._atlas.glyphs for key in keys):
+            pieces, metrics = self._layout(keys)
+        else:
+            pieces, metrics = self._typeset(texts)
+        if template is not None:
+            # 换下的是子物体：标签上设置过的颜色 / 透明度 / z_index 需要转给新字形
+            for piece in pieces:
+                piece.match_style(template)
+                piece.z_index = template.z_index
+
+        self.remove(*self.submobjects)
+        self.add(*pieces)
+        self._keys = keys
+        self._metrics = metrics
+        if anchor is not None:
+            self.scale(scale, about_point=ORIGIN)
+            self.shift(np.array([anchor[0] - self.get_critical_point(self.align)[0], anchor[1], 0.0]))
+        return self
+
+    def track(self, *trackers: ValueTracker, mapping: Optional[Callable[..., Sequence[float]]] = None) -> "NumericLabel":
+        """绑定 tracker；mapping 把 tracker 取值映射为各槽的数值（缺省为原值）。"""
+
+        def _follow(mob):
+            values = [t.get_value() for t in trackers]
+            mob.set_value(*(mapping(*values) if mapping is not None else values))
+
+        self.add_updater(_follow)
+        _follow(self)
+        return self
+
+
+class TraceCurve(VMobject):
+    """
+    追加式曲线：“边扫边画”的轨迹。
+    只对 [上次 x, 新 x] 区间补采样，点缓冲区按倍增预留容量，
+    每帧代价与新增采样数成正比，而非像 always_redraw(axes.plot) 那样从 x_start 重绘。
+    """
+
+    def __init__(
+        self,
+        axes,
+        func: Callable[[float], float],
+        x_start: float = 0.0,
+        step: Optional[float] = None,
+        color: str = PALETTE["MATH_FUNC"],
+        stroke_width: float = 3.0,
+        **kwargs,
+    ):
+        super().__init__(color=color, stroke_width=stroke_width, **kwargs)
+        self.axes = axes
+        self.func = func
+        self.x_start = float(x_start)
+        if step is None:
+            x_min, x_max = axes.x_range[0], axes.x_range[1]
+            step = (x_max - x_min) / 200
+        self.step = float(step)
+        # 已提交的网格采样数（不含头部段）
+        self._n_grid = 1
+        self._head_x = self.x_start
+        self._buffer = np.zeros((64, 3))
+        self._n_points = 0
+        self._last_anchor = self._sample(self.x_start)
+
+    def _sample(self, x: float) -> np.ndarray:
+        return np.asarray(self.axes.c2p(x, self.func(x)), dtype=float)
+
+    def _reserve(self, n_points: int):
+        if n_points <= len(self._buffer):
+            return
+        capacity = len(self._buffer)
+        while capacity < n_points:
+            capacity *= 2
+        grown = np.zeros((capacity, 3))
+        grown[: self._n_points] = self._buffer[: self._n_points]
+        self._buffer = grown
+
+    def _sync_buffer(self):
+        # 外部 set_points/Transform/copy 会替换 points，此时簿记失效，从起点重新累积
+        if self.points.base is not self._buffer or len(self.points) != self._n_points:
+            self._n_grid = 1
+            self._n_points = 0
+            self._last_anchor = self._sample(self.x_start)
+
+    def _write_segments(self, start_idx: int, anchors: np.ndarray):
+        """从第 start_idx 段起，把折线锚点写成直线型三次贝塞尔段。"""
+        a, b = anchors[:-1], anchors[1:]
+        segs = np.stack([a, a + (b - a) / 3, a + 2 * (b - a) / 3, b], axis=1).reshape(-1, 3)
+        begin = start_idx * 4
+        self._reserve(begin + len(segs))
+        self._buffer[begin : begin + len(segs)] = segs
+        self._n_points = begin + len(segs)
+
+    def grow_to(self, x: float) -> "TraceCurve":
+        """把曲线推进（或回退）到 x：只补采样新增网格点，并刷新末端头部段。"""
+        self._sync_buffer()
+        x = max(float(x), self.x_start)
+        n_target = int(np.floor((x - self.x_start) / self.step)) + 1
+        if n_target < self._n_grid:
+            # 回退：截断即可，无需重新采样
+            self._n_grid = n_target
+            self._last_anchor = self._buffer[(n_target - 1) * 4 - 1] if n_target > 1 else self._sample(self.x_start)
+        elif n_target > self._n_grid:
+            xs = self.x_start + self.step * np.arange(self._n_grid, n_target)
+            anchors = np.vstack([self._last_anchor] + [self._sample(xv) for xv in xs])
+            self._write_segments(self._n_grid - 1, anchors)
+            self._n_grid = n_target
+            self._last_anchor = anchors[-1]
+        n_committed = (self._n_grid - 1) * 4
+        self._n_points = n_committed
+
+        grid_x = self.x_start + self.step * (self._n_grid - 1)
+        if x - grid_x > 1e-9:
+            self._write_segments(self._n_grid - 1, np.vstack([self._last_anchor, self._sample(x)]))
+        if self._n_points == 0:
+            # 至少保留一个退化段，保证 VMobject 点数为 4 的倍数
+            self._write_segments(0, np.vstack([self._last_anchor, self._last_anchor]))
+        self._head_x = x
+        self.points = self._buffer[: self._n_points]
+        return self
+
+    def track(self, tracker: ValueTracker, color_source: Optional[Mobject] = None) -> "TraceCurve":
+        """绑定扫描进度（及可选的取色来源），作为 always_redraw(axes.plot) 的增量替代。"""
+
+        def _follow(mob):
+            mob.grow_to(tracker.get_value())
+            if color_source is not None:
+                mob.set_stroke(color=color_source.get_color())
+
+        self.add_updater(_follow)
+        _follow(self)
+        return self
+
+
+__all__ = ["SubtitleManager", "SmartBox", "FocusArrow", "NeonLine", "TraceCurve", "NumericLabel"]
 
@@ -2,30 +2,83 @@
 核心场景抽象与叙事辅助（去版本化）。
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence, Tuple, Union
+import numpy as np
 from manim import (
     Scene,
     ThreeDScene,
+    ThreeDCamera,
     VGroup,
+    VMobject,
     FadeOut,
     Write,
     Create,
     Mobject,
+    ORIGIN,
+    GREY_C,
+    logger,
 )
 
 from manim_lib.style import PALETTE, BG_COLOR
 from manim_lib.components import SubtitleManager, SmartBox
 from manim_lib.layout import default_axis_config
+from manim_lib.telemetry import RenderTelemetry
+
+
+# =============================================================================
+# 字幕通道
+# =============================================================================
+def subtitle_channel(scene: Scene) -> SubtitleManager:
+    """
+    每个场景实例唯一的字幕通道（常驻背景条，旧字幕随换随释放）。
+    FullSobelVideo 串联各分场景时共用同一实例，故整段渲染只有一条字幕在场。
+    """
+    channel = getattr(scene, "_subtitle_channel", None)
+    if channel is None:
+        channel = SubtitleManager(scene, persistent_bar=True)
+        scene._subtitle_channel = channel
+    return channel
 
 
 # =============================================================================
 # 基础场景
 # =============================================================================
 class BaseScene(Scene):
+    # 无更新器的 wait 只编码一帧，由编码器重复（见 HoldFrameRenderer）
+    hold_static_frames = True
+
     def __init__(self, *args, **kwargs):
+        from manim_lib.camera import LayerCacheCamera  # local import to avoid cycle
+        from manim_lib.renderer import hold_frame_renderer
+
+        # 背景层（L_BG 及以下）位图跨帧、跨 play 复用
+        kwargs.setdefault("camera_class", LayerCacheCamera)
+        if self.hold_static_frames and kwargs.get("renderer") is None:
+            kwargs["renderer"] = hold_frame_renderer(kwargs["camera_class"], kwargs.get("skip_animations", False))
         super().__init__(*args, **kwargs)
         self.math_group = VGroup()
         self.ui_group = VGroup()
+        # 设置环境变量 SOBEL_TELEMETRY 后逐 play / wait 记录耗时（见 manim_lib.telemetry）
+        self.telemetry = RenderTelemetry.from_env()
+
+    def play(self, *args, **kwargs):
+        if self.telemetry is None:
+            return super().play(*args, **kwargs)
+        with self.telemetry.measure(self, args):
+            super().play(*args, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.telemetry is not None:
+            self.telemetry.finish()
+
+    @property
+    def subtitles(self) -> SubtitleManager:
+        return subtitle_channel(self)
+
+    def add_fixed_in_frame_mobjects(self, *mobjects: Mobject):
+        # 2D 相机下所有物体本就固定在画面中；兼容按 3D 场景写法编写、又单独渲染的分场景
+        self.add(*mobjects)
 
     def clear_scene(self, fade_out: bool = True, run_time: float = 1.0):
         if fade_out:
@@ -62,10 +115,35 @@ class BaseScene(Scene):
 
 
 class BaseThreeDScene(ThreeDScene):
+    hold_static_frames = True
+
     def __init__(self, *args, **kwargs):
+        from manim_lib.camera import CachedThreeDCamera  # local import to avoid cycle
+        from manim_lib.renderer import hold_frame_renderer
+
+        # 机位静止时复用逐面深度排序、着色与投影
+        kwargs.setdefault("camera_class", CachedThreeDCamera)
+        if self.hold_static_frames and kwargs.get("renderer") is None:
+            kwargs["renderer"] = hold_frame_renderer(kwargs["camera_class"], kwargs.get("skip_animations", False))
         super().__init__(*args, **kwargs)
         self.math_group = VGroup()
         self.ui_group = VGroup()
+        self.telemetry = RenderTelemetry.from_env()
+
+    def play(self, *args, **kwargs):
+        if self.telemetry is None:
+            return super().play(*args, **kwargs)
+        with self.telemetry.measure(self, args):
+            super().play(*args, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.telemetry is not None:
+            self.telemetry.finish()
+
+    @property
+    def subtitles(self) -> SubtitleManager:
+        return subtitle_channel(self)
 
     def clear_scene(self, fade_out: bool = True, run_time: float = 1.0):
         if fade_out:
@@ -109,6 +187,96 @@ class BaseThreeDScene(ThreeDScene):
         return mobject.animate.scale(scale, about_point=target_point).shift(shift_to - target_point)
 
 
+class CompositeScene(BaseThreeDScene):
+    """
+    串联多个分场景的总场景：2D 分场景切到平面相机，只有 3D 分场景（BaseThreeDScene 子类）走 3D 相机。
+
+    - 只在 3D 相机处于默认机位（旋转为单位阵、zoom 为 1、frame_center 在原点）时切换：
+      此时投影只剩透视因子 d/(d-z)，对 z=0 的平面内容为 1，非 3D 物体的深度键全为 inf（稳定排序），
+      换用平面相机只省去投影、排序与着色开销；
+    - 前一个 3D 分场景改过机位而未复位时，后续 2D 分场景继续用 3D 相机，画面与单相机时一致，
+      但与单独渲染（render_segments.py 分段）时不同，因此会记一条警告；3D 分场景应在结束前复位机位；
+    - fixed-in-frame / fixed-orientation 始终登记在 3D 相机上，与单相机时的状态完全一致；
+    - OpenGL 渲染下不切换，行为同 BaseThreeDScene。
+
+    用法：
+        class FullVideo(CompositeScene):
+            def construct(self):
+                self.run_sub_scenes(SceneA, SceneB3D, SceneC)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        camera = getattr(self.renderer, "camera", None)
+        self._camera_3d = camera if isinstance(camera, ThreeDCamera) else None
+        self._camera_2d = None
+
+    def _flat_camera(self):
+        if self._camera_2d is None:
+            from manim_lib.camera import LayerCacheCamera  # local import to avoid cycle
+
+            self._camera_2d = LayerCacheCamera()
+        # 背景沿用 3D 相机（分场景可能改过 background_color）
+        self._camera_2d.background_color = self._camera_3d.background_color
+        self._camera_2d.background = self._camera_3d.background
+        return self._camera_2d
+
+    def use_camera(self, three_d: bool):
+        """切换当前相机；须在两次 play 之间调用。"""
+        if self._camera_3d is None:
+            return
+        self.renderer.camera = self._camera_3d if three_d else self._flat_camera()
+
+    def _at_default_view(self) -> bool:
+        camera = self._camera_3d
+        return (
+            np.allclose(camera.generate_rotation_matrix(), np.identity(3))
+            and np.isclose(camera.get_zoom(), 1.0)
+            and np.allclose(camera.frame_center, ORIGIN)
+        )
+
+    def run_sub_scenes(self, *scene_classes):
+        for scene_class in scene_classes:
+            flat = self._camera_3d is not None and not issubclass(scene_class, ThreeDScene) and self._at_default_view()
+            self.use_camera(not flat)
+            scene_class.construct(self)
+            if self._camera_3d is not None and not self._at_default_view():
+                logger.warning(
+                    f"{scene_class.__name__} 结束时 3D 相机未复位：后续分场景在总场景与分段渲染中的画面将不一致"
+                )
+        self.use_camera(True)
+
+    def _on_flat_camera(self) -> bool:
+        return self._camera_3d is not None and self.renderer.camera is not self._camera_3d
+
+    def get_moving_mobjects(self, *animations):
+        if self._on_flat_camera():
+            return Scene.get_moving_mobjects(self, *animations)
+        return super().get_moving_mobjects(*animations)
+
+    def add_fixed_in_frame_mobjects(self, *mobjects: Mobject):
+        if not self._on_flat_camera():
+            return super().add_fixed_in_frame_mobjects(*mobjects)
+        self.add(*mobjects)
+        self._camera_3d.add_fixed_in_frame_mobjects(*mobjects)
+
+    def remove_fixed_in_frame_mobjects(self, *mobjects: Mobject):
+        if not self._on_flat_camera():
+            return super().remove_fixed_in_frame_mobjects(*mobjects)
+        self._camera_3d.remove_fixed_in_frame_mobjects(*mobjects)
+
+    def add_fixed_orientation_mobjects(self, *mobjects: Mobject, **kwargs):
+        if not self._on_flat_camera():
+            return super().add_fixed_orientation_mobjects(*mobjects, **kwargs)
+        self.add(*mobjects)
+        self._camera_3d.add_fixed_orientation_mobjects(*mobjects, **kwargs)
+
+    def remove_fixed_orientation_mobjects(self, *mobjects: Mobject):
+        if not self._on_flat_camera():
+            return super().remove_fixed_orientation_mobjects(*mobjects)
+        self._camera_3d.remove_fixed_orientation_mobjects(*mobjects)
+
+
 # =============================================================================
 # 叙事 / 节奏 / 极简辅助
 # =============================================================================
@@ -151,21 +319,21 @@ class NarrativeHelper:
 
     @staticmethod
     def show_conflict(scene: Scene, text: str, visual_element, wait_after=2.0):
-        hud = SubtitleManager(scene)
+        hud = subtitle_channel(scene)
         hud.show(text, wait_after=1.0)
         scene.play(Create(visual_element), run_time=2.0)
         PacingController.slow_wait(scene, wait_after)
 
     @staticmethod
     def show_solution(scene: Scene, text: str, solution_element, wait_after=3.0):
-        hud = SubtitleManager(scene)
+        hud = subtitle_channel(scene)
         hud.show(text, wait_after=1.0)
         scene.play(Write(solution_element), run_time=3.0)
         PacingController.slow_wait(scene, wait_after)
 
     @staticmethod
     def show_validation(scene: Scene, text: str, validation_element, wait_after=2.0):
-        hud = SubtitleManager(scene)
+        hud = subtitle_channel(scene)
         hud.show(text, wait_after=1.0)
         scene.play(Create(validation_element), run_time=2.0)
         PacingController.slow_wait(scene, wait_after)
@@ -215,7 +383,14 @@ class MinimalismHelper:
 
 
 class LayerManager:
-    """影院级层级管理"""
+    """
+    影院级层级管理。
+
+    分层按“整族一次遍历”进行：迭代展开 mobject 及其后代（去重），
+    z_index 直接写属性，不再逐成员调用递归的 set_z_index。
+    不缓存族成员：判断缓存是否仍有效本身就要遍历一遍子物体，且同数量替换子物体
+    （如 NumericLabel.set_value）无法靠结构签名识别。
+    """
 
     L_BG = -10
     L_PASSIVE = 0
@@ -224,12 +399,36 @@ class LayerManager:
     L_LABEL = 30
     L_UI = 100
 
+    @staticmethod
+    def family(mobject: Mobject) -> List[Mobject]:
+        """mobject 及其全部后代（去重，先序）。"""
+        members, seen, stack = [], set(), [mobject]
+        while stack:
+            mob = stack.pop()
+            if id(mob) in seen:
+                continue
+            seen.add(id(mob))
+            members.append(mob)
+            stack.extend(reversed(mob.submobjects))
+        return members
+
     @staticmethod
     def set_layer(mobject: Mobject, layer_z: int):
-        for mob in mobject.family_members_with_points():
-            mob.set_z_index(layer_z)
+        for mob in LayerManager.family(mobject):
+            mob.z_index = layer_z
         return mobject
 
+    @staticmethod
+    def set_layers(assignments: Union[Dict[Mobject, int], Sequence[Tuple[Mobject, int]]]):
+        """
+        批量分层：{mob: z} 或 [(mob, z), ...]，按顺序一次写入（共享成员以后者为准）。
+        用法：
+            LayerManager.set_layers({axes: LayerManager.L_BG, graph: LayerManager.L_ACTIVE})
+        """
+        items = assignments.items() if isinstance(assignments, dict) else assignments
+        for mobject, layer_z in items:
+            LayerManager.set_layer(mobject, layer_z)
+
     @staticmethod
     def to_background(mobject: Mobject, opacity: float = 0.2):
         LayerManager.set_layer(mobject, LayerManager.L_BG)
@@ -243,14 +442,34 @@ class LayerManager:
         return mobject
 
     @staticmethod
-    def focus_on(scene: Scene, target_mobjects: List[Mobject], context_mobjects: List[Mobject]):
-        scene.play(
-            *[
-                mobj.animate.set_opacity(0.15).set_z_index(LayerManager.L_BG)
-                for mobj in context_mobjects
-            ],
-            run_time=1.0,
-        )
+    def focus_on(
+        scene: Scene,
+        target_mobjects: List[Mobject],
+        context_mobjects: List[Mobject],
+        dim_opacity: float = 0.15,
+        run_time: float = 1.0,
+    ):
+        """
+        聚焦：上下文整体压暗并沉到背景层，目标提到高亮层。
+        全部矢量上下文合成一个向量化透明度动画（不拷贝整组），非矢量物体退回 .animate。
+        """
+        from manim_lib.animations import StaggeredReveal  # local import to keep core light
+
+        LayerManager.set_layers([(mob, LayerManager.L_BG) for mob in context_mobjects])
+        vector_context = [mob for mob in context_mobjects if isinstance(mob, VMobject)]
+        animations = [mob.animate.set_opacity(dim_opacity) for mob in context_mobjects if not isinstance(mob, VMobject)]
+        if vector_context:
+            animations.append(
+                StaggeredReveal(
+                    VGroup(*vector_context),
+                    lag_ratio=0.0,
+                    start_opacity=None,
+                    target_opacity=dim_opacity,
+                    introducer=False,
+                )
+            )
+        if animations:
+            scene.play(*animations, run_time=run_time)
         for t in target_mobjects:
             LayerManager.to_foreground(t)
 
@@ -285,10 +504,12 @@ def show_validation(scene: Scene, text: str, validation_element, wait_after: flo
 __all__ = [
     "BaseScene",
     "BaseThreeDScene",
+    "CompositeScene",
     "NarrativeHelper",
     "PacingController",
     "MinimalismHelper",
     "LayerManager",
+    "subtitle_channel",
     "slow_wait",
     "slow_play",
     "ask_question",
@@ -0,0 +1,83 @@
+"""
+标量场工具：一次采样、预求导数、双线性查表。
+"""
+
+import hashlib
+from typing import Callable, Sequence, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class HeightField:
+    """
+    高度场 h(u, v)：在细网格上只采样一次，并用二阶中心差分预先求出 ∂h/∂u、∂h/∂v。
+    之后曲面、扫描框与示波器都从同一张表做双线性插值，逐帧不再重复求值。
+
+    - func 需支持 NumPy 广播（不支持时自动逐点回退）；
+    - 查询点超出范围时夹到边界；
+    - key 由采样内容决定，可作为网格缓存的键。
+
+    用法：
+        field = HeightField(height, u_range=[0, cols], v_range=[0, rows])
+        z = field(u, v)
+        slope = field.du(u, v)
+    """
+
+    def __init__(
+        self,
+        func: Callable[[ArrayLike, ArrayLike], ArrayLike],
+        u_range: Sequence[float],
+        v_range: Sequence[float],
+        resolution: Union[int, Tuple[int, int]] = 512,
+    ):
+        nu, nv = (resolution, resolution) if np.isscalar(resolution) else resolution
+        self.u_min, self.u_max = float(u_range[0]), float(u_range[1])
+        self.v_min, self.v_max = float(v_range[0]), float(v_range[1])
+        self.u_samples = np.linspace(self.u_min, self.u_max, int(nu) + 1)
+        self.v_samples = np.linspace(self.v_min, self.v_max, int(nv) + 1)
+        self.step_u = self.u_samples[1] - self.u_samples[0]
+        self.step_v = self.v_samples[1] - self.v_samples[0]
+
+        U, V = np.meshgrid(self.u_samples, self.v_samples, indexing="ij")
+        try:
+            values = np.broadcast_to(np.asarray(func(U, V), dtype=float), U.shape)
+        except (TypeError, ValueError):
+            values = np.vectorize(func, otypes=[float])(U, V)
+        self.values = np.array(values)
+        self.du_values, self.dv_values = np.gradient(self.values, self.u_samples, self.v_samples, edge_order=2)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array([self.u_min, self.u_max, self.v_min, self.v_max], dtype=float).tobytes())
+        digest.update(self.values.tobytes())
+        self.key = digest.hexdigest()
+
+    def _lookup(self, table: np.ndarray, u: ArrayLike, v: ArrayLike) -> ArrayLike:
+        fu = np.clip((np.asarray(u, dtype=float) - self.u_min) / self.step_u, 0.0, len(self.u_samples) - 1)
+        fv = np.clip((np.asarray(v, dtype=float) - self.v_min) / self.step_v, 0.0, len(self.v_samples) - 1)
+        i = np.minimum(fu.astype(int), len(self.u_samples) - 2)
+        j = np.minimum(fv.astype(int), len(self.v_samples) - 2)
+        a, b = fu - i, fv - j
+        out = (
+            table[i, j] * (1 - a) * (1 - b)
+            + table[i + 1, j] * a * (1 - b)
+            + table[i, j + 1] * (1 - a) * b
+            + table[i + 1, j + 1] * a * b
+        )
+        return float(out) if np.ndim(out) == 0 else out
+
+    def __call__(self, u: ArrayLike, v: ArrayLike) -> ArrayLike:
+        return self._lookup(self.values, u, v)
+
+    def du(self, u: ArrayLike, v: ArrayLike) -> ArrayLike:
+        return self._lookup(self.du_values, u, v)
+
+    def dv(self, u: ArrayLike, v: ArrayLike) -> ArrayLike:
+        return self._lookup(self.dv_values, u, v)
+
+    def gradient_magnitude(self, u: ArrayLike, v: ArrayLike) -> ArrayLike:
+        return np.hypot(self.du(u, v), self.dv(u, v))
+
+
+__all__ = ["HeightField"]
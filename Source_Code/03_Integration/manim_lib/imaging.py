@@ -0,0 +1,52 @@
+"""
+小图像工具：示意用的卷积与像素方块图（Scene 3.5 / Scene 4.6 共用）。
+"""
+
+import numpy as np
+from manim import BLACK, GREY_B, RIGHT, UP, WHITE, Square, SurroundingRectangle, VGroup, interpolate_color
+
+
+def convolve_normalized(vals: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    边缘复制填充后逐点相关（与核逐元素相乘求和），再按最大绝对值归一化到 0-1（0.5 为零响应）。
+    """
+    h, w = vals.shape
+    kh, kw = kernel.shape
+    pad = kh // 2
+    padded = np.pad(vals, pad, mode="edge")
+    out = np.zeros_like(vals)
+    for i in range(h):
+        for j in range(w):
+            patch = padded[i:i + kh, j:j + kw]
+            out[i, j] = np.sum(patch * kernel)
+    m = np.max(np.abs(out)) or 1.0
+    return (out / m + 1) / 2
+
+
+def pixel_grid(
+    vals: np.ndarray,
+    cell: float,
+    box_color=GREY_B,
+    with_box: bool = True,
+    box_stroke_width: float = 1,
+    box_stroke_opacity: float = 0.3,
+) -> VGroup:
+    """
+    灰度值矩阵 → 方块图（每个值一个 Square，0 黑 1 白，以原点为中心）。
+    with_box=True 时返回 VGroup(外框, 方块组)，否则只返回方块组。
+    """
+    g = VGroup()
+    rows, cols = vals.shape
+    for i in range(rows):
+        for j in range(cols):
+            sq = Square(side_length=cell, stroke_width=0, fill_opacity=1)
+            sq.set_fill(interpolate_color(BLACK, WHITE, vals[i, j]))
+            sq.move_to(RIGHT * (j - cols / 2) * cell + UP * (rows / 2 - i) * cell)
+            g.add(sq)
+    if with_box:
+        box = SurroundingRectangle(g, color=box_color, stroke_width=box_stroke_width, stroke_opacity=box_stroke_opacity)
+        return VGroup(box, g)
+    return g
+
+
+__all__ = ["convolve_normalized", "pixel_grid"]
@@ -0,0 +1,131 @@
+"""
+渲染器扩展：静止等待只光栅化、只经管道写入一帧，其余时长交给编码器重复；
+空跑（config.dry_run）时换用完全不光栅化的渲染器。
+"""
+
+import os
+import subprocess
+import tempfile
+from typing import List, Optional, Tuple
+
+import numpy as np
+from manim import __version__ as MANIM_VERSION
+from manim import config
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.file_ops import is_png_format, is_webm_format, write_to_movie
+
+
+class HoldFrameRenderer(CairoRenderer):
+    """
+    静帧保持：manim 判定为 frozen frame 的 wait（无更新器、无动画）
+    只向管道写入一帧；play 结束后用与 open_movie_pipe 相同的编码参数，
+    让 ffmpeg 循环这一原始帧 N 次重写本段分段文件。
+
+    - 输入帧序列与逐帧管道完全相同，编码结果逐字节一致；
+    - 少于 min_hold_frames 的短等待、PNG 序列 / 透明 / webm 输出仍走原逻辑。
+    """
+
+    min_hold_frames = 12
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._holds: List[Tuple[str, np.ndarray, int]] = []
+        self.held_frames = 0
+
+    def _can_hold(self) -> bool:
+        return (
+            write_to_movie()
+            and not is_png_format()
+            and not is_webm_format()
+            and not config["transparent"]
+            and hasattr(self.file_writer, "open_movie_pipe")
+        )
+
+    def freeze_current_frame(self, duration: float):
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+        if self.skip_animations or num_frames < self.min_hold_frames or not self._can_hold():
+            return super().freeze_current_frame(duration)
+
+        frame = self.get_frame()
+        self.add_frame(frame)
+        self.time += (num_frames - 1) * dt
+        self.held_frames += num_frames - 1
+        self._holds.append((self.file_writer.partial_movie_files[self.num_plays], frame, num_frames))
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        # 分段文件此时已由 end_animation 关闭，可安全覆盖
+        while self._holds:
+            self._encode_hold(*self._holds.pop())
+
+    def _encode_hold(self, file_path: str, frame: np.ndarray, num_frames: int):
+        height, width = frame.shape[:2]
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        with tempfile.NamedTemporaryFile(suffix=".rgba", delete=False) as raw:
+            raw.write(frame.tobytes())
+        try:
+            command = [
+                config.ffmpeg_executable,
+                "-y",
+                "-stream_loop", "-1",
+                "-f", "rawvideo",
+                "-s", "%dx%d" % (width, height),
+                "-pix_fmt", "rgba",
+                "-r", str(fps),
+                "-i", raw.name,
+                "-frames:v", str(num_frames),
+                "-an",
+                "-loglevel", config["ffmpeg_loglevel"].lower(),
+                "-metadata", f"comment=Rendered with Manim Community v{MANIM_VERSION}",
+                "-vcodec", "libx264",
+                "-pix_fmt", "yuv420p",
+                file_path,
+            ]
+            subprocess.run(command, check=True)
+        finally:
+            os.unlink(raw.name)
+
+
+class DryRunRenderer(CairoRenderer):
+    """
+    空跑渲染器：construct 照常执行、play 照常计数与计时，但从不光栅化。
+
+    skip_animations 下 manim 仍会在每个 play 烘一次静态底图、按 ignore_skipping=True 画一次终态，
+    静帧等待也会取一次帧；这里把 update_frame / save_static_frame_data / render /
+    freeze_current_frame 全部置空，名义时长由 play 中的 skip 分支照常累加。
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["skip_animations"] = True
+        super().__init__(*args, **kwargs)
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        return None
+
+    def render(self, scene, time, moving_mobjects):
+        pass
+
+    def freeze_current_frame(self, duration: float):
+        pass
+
+
+def hold_frame_renderer(camera_class, skip_animations: bool = False) -> Optional[CairoRenderer]:
+    """
+    Cairo 渲染时返回静帧保持渲染器，config.dry_run 时返回空跑渲染器；
+    OpenGL 渲染下返回 None（交回 manim 默认）。
+    """
+    if str(config.renderer).lower().endswith("opengl"):
+        return None
+    if config.dry_run:
+        return DryRunRenderer(camera_class=camera_class)
+    return HoldFrameRenderer(camera_class=camera_class, skip_animations=skip_animations)
+
+
+__all__ = ["HoldFrameRenderer", "DryRunRenderer", "hold_frame_renderer"]
@@ -0,0 +1,264 @@
+"""
+3D 曲面构建：向量化细分、进程内网格缓存、多细节层次（LOD）切换与按场着色。
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Union
+
+import numpy as np
+from manim import Surface, ThreeDVMobject, ValueTracker, VGroup, color_to_rgb
+
+from manim_lib.fields import HeightField
+from manim_lib.style import PALETTE
+
+GridFunc = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def axes_grid_func(axes, z_func: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> GridFunc:
+    """线性坐标轴上的 (U, V) → 世界坐标：一次矩阵运算代替逐点 c2p。"""
+    origin = np.asarray(axes.c2p(0, 0, 0), dtype=float)
+    ex = np.asarray(axes.c2p(1, 0, 0), dtype=float) - origin
+    ey = np.asarray(axes.c2p(0, 1, 0), dtype=float) - origin
+    ez = np.asarray(axes.c2p(0, 0, 1), dtype=float) - origin
+
+    def grid(U: np.ndarray, V: np.ndarray) -> np.ndarray:
+        W = np.asarray(z_func(U, V), dtype=float)
+        return origin + U[..., None] * ex + V[..., None] * ey + W[..., None] * ez
+
+    return grid
+
+
+class MeshSurface(Surface):
+    """
+    Surface 的向量化版本：
+
+    - 顶点网格一次求值（给出 grid_func 时整体广播计算，否则每个顶点只调用一次 func，
+      而非 manim 默认的每面 16 个贝塞尔点各调用一次）；
+    - 各面直接写入直线段贝塞尔点（等价于 set_points_as_corners），不再逐点 apply_function；
+    - 给出 cache_key 时，面片点阵按 (cache_key, u_range, v_range, resolution) 进程内缓存，
+      重复构建只剩对象组装（函数对象的 id 可能被复用，故不作为默认键）。
+
+    face.u_index / v_index / u1 / u2 / v1 / v2 与 manim Surface 保持一致。
+    """
+
+    _mesh_cache: Dict[tuple, np.ndarray] = {}
+
+    def __init__(
+        self,
+        func: Callable[[float, float], np.ndarray],
+        u_range: Sequence[float] = (0, 1),
+        v_range: Sequence[float] = (0, 1),
+        resolution=32,
+        grid_func: Optional[GridFunc] = None,
+        cache_key: Optional[Hashable] = None,
+        **kwargs,
+    ):
+        self._grid_func = grid_func
+        self._cache_key = cache_key
+        self._skip_uv_mapping = True
+        super().__init__(func, u_range=u_range, v_range=v_range, resolution=resolution, **kwargs)
+
+    def _face_points(self, u_values: np.ndarray, v_values: np.ndarray) -> np.ndarray:
+        key = (self._cache_key, tuple(self.u_range), tuple(self.v_range), len(u_values), len(v_values))
+        if self._cache_key is not None and key in self._mesh_cache:
+            return self._mesh_cache[key]
+
+        if self._grid_func is not None:
+            U, V = np.meshgrid(u_values, v_values, indexing="ij")
+            grid = np.asarray(self._grid_func(U, V), dtype=float)
+        else:
+            grid = np.array([[self.func(u, v) for v in v_values] for u in u_values], dtype=float)
+
+        # 每面四角 + 回到起点，逐边生成 [a, a+(b-a)/3, a+2(b-a)/3, b]
+        corners = np.stack(
+            [grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:], grid[:-1, :-1]],
+            axis=-2,
+        )
+        a, b = corners[..., :-1, :], corners[..., 1:, :]
+        edges = np.stack([a, a + (b - a) / 3, a + 2 * (b - a) / 3, b], axis=-2)
+        face_points = edges.reshape(len(u_values) - 1, len(v_values) - 1, 16, 3)
+        if self._cache_key is not None:
+            self._mesh_cache[key] = face_points
+        return face_points
+
+    def _setup_in_uv_space(self) -> None:
+        u_values, v_values = self._get_u_values_and_v_values()
+        self.u_values, self.v_values = u_values, v_values
+        face_points = self._face_points(u_values, v_values)
+        faces = VGroup()
+        for i in range(len(u_values) - 1):
+            for j in range(len(v_values) - 1):
+                face = ThreeDVMobject()
+                face.points = face_points[i, j].copy()
+                faces.add(face)
+                face.u_index = i
+                face.v_index = j
+                face.u1, face.u2 = u_values[i : i + 2]
+                face.v1, face.v2 = v_values[j : j + 2]
+        faces.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        faces.set_stroke(
+            color=self.stroke_color,
+            width=self.stroke_width,
+            opacity=self.stroke_opacity,
+        )
+        self.add(*faces)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+
+    def apply_function(self, function, **kwargs):
+        # Surface.__init__ 随后会把 uv 平面映射到 func；顶点已直接生成在世界坐标中，跳过这一次
+        if self._skip_uv_mapping:
+            self._skip_uv_mapping = False
+            return self
+        return super().apply_function(function, **kwargs)
+
+    def face_centers(self):
+        """各面中心的 (u, v)，顺序与 submobjects 一致（u 主序）。"""
+        uc = (self.u_values[:-1] + self.u_values[1:]) / 2
+        vc = (self.v_values[:-1] + self.v_values[1:]) / 2
+        U, V = np.meshgrid(uc, vc, indexing="ij")
+        return U.ravel(), V.ravel()
+
+    @classmethod
+    def clear_cache(cls):
+        cls._mesh_cache.clear()
+
+
+class LODSurface(VGroup):
+    """
+    多细节层次曲面：fine / coarse 两套 MeshSurface，同一时刻只挂载其一。
+    相机或扫描框运动时切到 coarse，静止停留时切回 fine；set_style 同步到所有层级。
+
+    用法：
+        terrain = LODSurface(func, u_range, v_range, resolution=48, grid_func=..., cache_key=...)
+        terrain.use("coarse")
+        self.play(scan_tracker.animate.set_value(...))
+        terrain.use("fine")
+    """
+
+    def __init__(
+        self,
+        func: Callable[[float, float], np.ndarray],
+        u_range: Sequence[float] = (0, 1),
+        v_range: Sequence[float] = (0, 1),
+        resolution=32,
+        coarse_factor: float = 0.5,
+        **kwargs,
+    ):
+        super().__init__()
+        fine_res = np.atleast_1d(resolution).astype(int)
+        coarse_res = np.maximum(4, np.round(fine_res * coarse_factor)).astype(int)
+        self.levels = {
+            "fine": MeshSurface(func, u_range, v_range, resolution=tuple(fine_res), **kwargs),
+            "coarse": MeshSurface(func, u_range, v_range, resolution=tuple(coarse_res), **kwargs),
+        }
+        self.level = "fine"
+        self.add(self.levels["fine"])
+
+    @property
+    def current(self) -> MeshSurface:
+        return self.levels[self.level]
+
+    def use(self, level: str):
+        if level not in self.levels:
+            raise ValueError(f"未知细节层级：{level}（可选 {list(self.levels)}）")
+        if level != self.level:
+            self.remove(self.current)
+            self.level = level
+            self.add(self.current)
+        return self
+
+    def set_style(self, **kwargs):
+        for surface in self.levels.values():
+            surface.set_style(**kwargs)
+        return self
+
+
+def colormap_lut(colors: Sequence, size: int = 256) -> np.ndarray:
+    """多色标等距分段线性插值，得到 (size, 3) 的 RGB 查找表。"""
+    stops = np.array([color_to_rgb(c) for c in colors], dtype=float)
+    x = np.linspace(0.0, 1.0, size)
+    xp = np.linspace(0.0, 1.0, len(stops))
+    return np.stack([np.interp(x, xp, stops[:, k]) for k in range(3)], axis=-1)
+
+
+class GradientColoring:
+    """
+    按梯度大小给曲面逐面着色（默认蓝 → 琥珀，对应 PALETTE 的 MATH_FUNC → MATH_ERROR）。
+
+    - 高度场只采样一次；各面中心的 |∇h| 在构造时一次向量化求出并归一化；
+    - 每个面的 fill_rgbas 绑定为同一块缓冲区的视图，apply() 只做查表 + 一次整体写入，
+      可逐帧驱动阈值动画；若面颜色被动画 / set_fill 替换，下次 apply() 自动重新绑定；
+    - 传入 LODSurface 时所有细节层级同步着色，归一化共用同一上限。
+
+    用法：
+        coloring = GradientColoring(surface, field)
+        coloring.apply()                       # 连续色谱
+        coloring.track(threshold_tracker)      # 阈值以下为底色，以上渐变到高亮
+    """
+
+    def __init__(
+        self,
+        surface: Union[MeshSurface, "LODSurface"],
+        field: Union[HeightField, Callable],
+        colors: Optional[Sequence] = None,
+        opacity: Optional[float] = None,
+        vmax: Optional[float] = None,
+        lut_size: int = 256,
+    ):
+        self.surface = surface
+        levels = list(surface.levels.values()) if isinstance(surface, LODSurface) else [surface]
+        if not isinstance(field, HeightField):
+            field = HeightField(field, levels[0].u_range, levels[0].v_range)
+        self.lut = colormap_lut(colors or (PALETTE["MATH_FUNC"], PALETTE["MATH_ERROR"]), lut_size)
+
+        magnitudes = [np.asarray(field.gradient_magnitude(*mesh.face_centers()), dtype=float) for mesh in levels]
+        if vmax is None:
+            vmax = max(float(m.max()) for m in magnitudes)
+        vmax = vmax if vmax > 0 else 1.0
+
+        self._faces: List[list] = []
+        self._values: List[np.ndarray] = []
+        self._buffers: List[np.ndarray] = []
+        for mesh, mag in zip(levels, magnitudes):
+            faces = list(mesh.submobjects)
+            buffer = np.zeros((len(faces), 1, 4))
+            buffer[:, 0, 3] = opacity if opacity is not None else [f.fill_rgbas[0, 3] for f in faces]
+            self._faces.append(faces)
+            self._values.append(np.clip(mag / vmax, 0.0, 1.0))
+            self._buffers.append(buffer)
+        self._bound = [False] * len(levels)
+
+    def _bind(self, index: int) -> None:
+        faces, buffer = self._faces[index], self._buffers[index]
+        if self._bound[index] and all(f.fill_rgbas.base is buffer for f in faces):
+            return
+        for k, face in enumerate(faces):
+            face.fill_rgbas = buffer[k]
+        self._bound[index] = True
+
+    def apply(self, threshold: Optional[float] = None, softness: float = 0.08) -> "GradientColoring":
+        """threshold 为 None 时按归一化梯度连续着色；否则在阈值附近 softness 宽度内过渡。"""
+        top = len(self.lut) - 1
+        for index, values in enumerate(self._values):
+            if threshold is not None:
+                values = np.clip((values - threshold) / max(softness, 1e-6) + 0.5, 0.0, 1.0)
+            self._buffers[index][:, 0, :3] = self.lut[np.rint(values * top).astype(int)]
+            self._bind(index)
+        return self
+
+    def track(self, tracker: ValueTracker, softness: float = 0.08) -> "GradientColoring":
+        """绑定阈值 tracker：取值不变的帧跳过写入。"""
+        last = [None]
+
+        def _follow(mob):
+            value = tracker.get_value()
+            if value != last[0]:
+                last[0] = value
+                self.apply(value, softness)
+
+        self.surface.add_updater(_follow)
+        _follow(self.surface)
+        return self
+
+
+__all__ = ["MeshSurface", "LODSurface", "GradientColoring", "axes_grid_func", "colormap_lut"]
@@ -0,0 +1,142 @@
+"""
+渲染遥测：按 play / wait 记录调用位置、名义时长、帧数、耗时与场景规模（按需开启）。
+
+开启方式（环境变量指向 JSON Lines 输出文件）：
+    SOBEL_TELEMETRY=telemetry.jsonl manim -ql sobel_v15_full.py Scene4Vision
+场景结束时在同目录写出 <文件>.summary.txt（按耗时排序的汇总表），并打印前若干行。
+已有的 JSONL 也可单独汇总：
+    python -m manim_lib.telemetry telemetry.jsonl --top 30
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+ENV_VAR = "SOBEL_TELEMETRY"
+
+_LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _manim_dir() -> str:
+    import manim
+
+    return os.path.dirname(os.path.abspath(manim.__file__))
+
+
+class RenderTelemetry:
+    """逐 play 采集并追加写入 JSON Lines；不开启时基类完全不经过这里。"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open("a", encoding="utf-8")
+        self._skip_dirs = (_LIB_DIR, _manim_dir(), contextmanager.__code__.co_filename)
+        self.records: List[dict] = []
+
+    @classmethod
+    def from_env(cls) -> Optional["RenderTelemetry"]:
+        path = os.environ.get(ENV_VAR)
+        return cls(path) if path else None
+
+    def _caller(self):
+        """第一个不在 manim / manim_lib / contextlib 内的栈帧，即场景源码中的调用处。"""
+        frame = sys._getframe(1)
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if not filename.startswith(self._skip_dirs):
+                return f"{os.path.basename(filename)}:{frame.f_lineno}", frame.f_code.co_name
+            frame = frame.f_back
+        return "?", "?"
+
+    @contextmanager
+    def measure(self, scene, animations: Iterable):
+        from manim import Wait
+
+        animations = list(animations)
+        renderer = scene.renderer
+        location, function = self._caller()
+        kind = "wait" if len(animations) == 1 and isinstance(animations[0], Wait) else "play"
+        time_before = getattr(renderer, "time", 0.0)
+        held_before = getattr(renderer, "held_frames", 0)
+        started = time.perf_counter()
+        yield
+        wall_time = time.perf_counter() - started
+
+        skipped = getattr(renderer, "skip_animations", False)
+        fps = scene.camera.frame_rate
+        frames = 0 if skipped else int(round((getattr(renderer, "time", 0.0) - time_before) * fps))
+        family = scene.get_mobject_family_members()
+        record = {
+            "scene": type(scene).__name__,
+            "index": len(self.records),
+            "kind": kind,
+            "location": location,
+            "function": function,
+            "duration": float(getattr(scene, "duration", 0.0) or 0.0),
+            "frames": frames,
+            "held_frames": getattr(renderer, "held_frames", 0) - held_before,
+            "wall_time": wall_time,
+            "mobjects": len(scene.mobjects),
+            "family": len(family),
+            "points": int(sum(len(m.points) for m in family)),
+        }
+        self.records.append(record)
+        self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._stream.flush()
+
+    def finish(self, top: int = 15):
+        self._stream.close()
+        table = format_summary(self.records)
+        self.path.with_name(self.path.name + ".summary.txt").write_text(table + "\n", encoding="utf-8")
+        print("\n".join(table.splitlines()[: top + 2]))
+
+
+def load_records(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as stream:
+        return [json.loads(line) for line in stream if line.strip()]
+
+
+def format_summary(records: List[dict], top: Optional[int] = None) -> str:
+    """按调用位置聚合，耗时降序：位置 / 类型 / 次数 / 总耗时 / 名义时长 / 帧数 / 每帧毫秒 / 最大点数。"""
+    groups: Dict[tuple, dict] = defaultdict(lambda: {"calls": 0, "wall": 0.0, "duration": 0.0, "frames": 0, "points": 0})
+    for r in records:
+        g = groups[(r["location"], r["kind"])]
+        g["calls"] += 1
+        g["wall"] += r["wall_time"]
+        g["duration"] += r["duration"]
+        g["frames"] += r["frames"] - r.get("held_frames", 0)
+        g["points"] = max(g["points"], r["points"])
+    rows = sorted(groups.items(), key=lambda item: item[1]["wall"], reverse=True)
+    total = sum(g["wall"] for _, g in rows) or 1.0
+    lines = [
+        f"{'location':<32}{'kind':<6}{'calls':>6}{'wall_s':>9}{'share':>7}{'dur_s':>8}{'frames':>8}{'ms/frame':>10}{'points':>10}",
+        "-" * 96,
+    ]
+    for (location, kind), g in rows[:top]:
+        per_frame = 1000 * g["wall"] / g["frames"] if g["frames"] else 0.0
+        lines.append(
+            f"{location:<32}{kind:<6}{g['calls']:>6}{g['wall']:>9.2f}{g['wall'] / total:>7.1%}"
+            f"{g['duration']:>8.1f}{g['frames']:>8}{per_frame:>10.1f}{g['points']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="汇总渲染遥测 JSON Lines")
+    parser.add_argument("path", help="SOBEL_TELEMETRY 写出的 .jsonl 文件")
+    parser.add_argument("--top", type=int, default=None, help="只显示耗时最高的前 N 行")
+    args = parser.parse_args()
+    print(format_summary(load_records(args.path), args.top))
+
+
+__all__ = ["RenderTelemetry", "format_summary", "load_records", "ENV_VAR"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+时间线编译：把逐步 self.play 循环收集为带精确时刻的关键步骤表，编译成一个动画一次播放。
+
+每条轨道有自己的生效区间 [t0, t1]：播放时只驱动区间内的轨道，结束的轨道落到终态后不再触碰；
+Cairo 渲染下按“正在变化的物体”重分 moving / static，已完成的物体烘进静态底图。
+"""
+
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from manim import (
+    Animation,
+    Group,
+    Mobject,
+    ValueTracker,
+    VMobject,
+    linear,
+    smooth,
+)
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+from manim_lib.animations import _RATE_LUT_SAMPLES
+
+RateFunc = Callable[[float], float]
+
+
+def _progress(t: float, t0: float, t1: float) -> float:
+    if t1 <= t0:
+        return 1.0 if t >= t0 else 0.0
+    return min(1.0, max(0.0, (t - t0) / (t1 - t0)))
+
+
+class _MoveTrack:
+    """单个物体的移动关键帧：中心点在相邻目标之间按各自 rate_func 插值。"""
+
+    hidden_until_start = False
+
+    def __init__(self, mobject: Mobject):
+        self.mobject = mobject
+        self.mobjects = [mobject]
+        self.starts: List[float] = []
+        self.steps: List[Tuple[float, float, np.ndarray, np.ndarray, RateFunc]] = []
+
+    @property
+    def t0(self) -> float:
+        return self.steps[0][0]
+
+    @property
+    def t1(self) -> float:
+        return self.steps[-1][1]
+
+    def add(self, t0: float, t1: float, target, rate_func: RateFunc):
+        if self.steps and t0 < self.steps[-1][1] - 1e-9:
+            raise ValueError("同一物体的 move 步骤在时间上重叠")
+        origin = self.steps[-1][3] if self.steps else self.mobject.get_center()
+        self.starts.append(t0)
+        self.steps.append((t0, t1, origin, np.asarray(target, dtype=float), rate_func))
+
+    def begin(self):
+        pass
+
+    def finish(self):
+        pass
+
+    def apply(self, t: float):
+        i = bisect_right(self.starts, t) - 1
+        if i < 0:
+            point = self.steps[0][2]
+        else:
+            t0, t1, p0, p1, rate_func = self.steps[i]
+            point = p0 + rate_func(_progress(t, t0, t1)) * (p1 - p0)
+        self.mobject.move_to(point)
+
+
+class _RevealTrack:
+    """FadeIn(scale=...) 的轻量等价：点集围绕中心缩放、透明度从 0 升至原值。"""
+
+    hidden_until_start = True
+
+    def __init__(self, mobject: Mobject, t0: float, t1: float, scale: float, rate_func: RateFunc):
+        self.mobject = mobject
+        self.mobjects = [mobject]
+        self.t0, self.t1 = t0, t1
+        self.scale = scale
+        self.rate_func = rate_func
+
+    def begin(self):
+        self.center = self.mobject.get_center()
+        self.leaves = []
+        for leaf in self.mobject.family_members_with_points():
+            alphas = {}
+            if isinstance(leaf, VMobject):
+                for name in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+                    alphas[name] = np.array(getattr(leaf, name))[:, 3]
+            self.leaves.append((leaf, leaf.points.copy(), alphas))
+
+    def finish(self):
+        pass
+
+    def apply(self, t: float):
+        r = self.rate_func(_progress(t, self.t0, self.t1))
+        s = self.scale + (1.0 - self.scale) * r
+        for leaf, points, alphas in self.leaves:
+            leaf.points = points.copy() if r >= 1.0 else self.center + s * (points - self.center)
+            for name, base in alphas.items():
+                getattr(leaf, name)[:, 3] = base * r
+
+
+class _TrackerTrack:
+    """ValueTracker 的瞬时赋值序列：任意时刻取最后一次已生效的值。"""
+
+    hidden_until_start = False
+    mobjects: List[Mobject] = []  # tracker 本身不绘制，依赖它的物体靠更新器进入 moving
+
+    def __init__(self, tracker: ValueTracker):
+        self.tracker = tracker
+        self.initial = tracker.get_value()
+        self.starts: List[float] = []
+        self.values: List[float] = []
+
+    @property
+    def t0(self) -> float:
+        return self.starts[0]
+
+    @property
+    def t1(self) -> float:
+        return self.starts[-1]
+
+    def add(self, t0: float, value: float):
+        # 保持时间有序（相同时刻以后写入者为准）
+        i = bisect_right(self.starts, t0)
+        self.starts.insert(i, t0)
+        self.values.insert(i, value)
+
+    def begin(self):
+        pass
+
+    def finish(self):
+        pass
+
+    def apply(self, t: float):
+        i = bisect_right(self.starts, t) - 1
+        value = self.initial if i < 0 else self.values[i]
+        if self.tracker.get_value() != value:
+            self.tracker.set_value(value)
+
+
+class _WipeTrack:
+    """
+    批量 reveal：每个物体按各自起点做 FadeIn(scale=...)，
+    全部叶子的点与透明度打包进共享缓冲区，每帧一次向量化写入。
+    """
+
+    _ALPHA_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+    hidden_until_start = True
+
+    def __init__(self, mobjects: Sequence[Mobject], starts: np.ndarray, cell_time: float, scale: float, rate_func: RateFunc):
+        self.mobjects = list(mobjects)
+        self.starts = np.asarray(starts, dtype=float)
+        self.cell_time = cell_time
+        self.scale = scale
+        self.rate_func = rate_func
+        self.t0 = float(self.starts.min())
+        self.t1 = float(self.starts.max()) + cell_time
+
+    def begin(self):
+        leaves, owner = [], []
+        for idx, mob in enumerate(self.mobjects):
+            for leaf in mob.family_members_with_points():
+                leaves.append(leaf)
+                owner.append(idx)
+        self.leaves = leaves
+        owner = np.asarray(owner, dtype=int)
+        sizes = np.array([len(leaf.points) for leaf in leaves], dtype=int)
+        bounds = np.concatenate([[0], np.cumsum(sizes)]).astype(int)
+
+        self.p0 = np.concatenate([leaf.points for leaf in leaves]).astype(float) if leaves else np.zeros((0, 3))
+        self.point_owner = np.repeat(owner, sizes)
+        centers = np.array([mob.get_center() for mob in self.mobjects]).reshape(-1, 3)
+        self.point_centers = centers[self.point_owner]
+        self.points = self.p0.copy()
+        for leaf, a, b in zip(leaves, bounds[:-1], bounds[1:]):
+            leaf.points = self.points[a:b]
+
+        self.alphas = []
+        vleaves = [(i, leaf) for i, leaf in enumerate(leaves) if isinstance(leaf, VMobject)]
+        for name in self._ALPHA_ARRAYS:
+            arrays = [np.array(getattr(leaf, name), dtype=float) for _, leaf in vleaves]
+            if not arrays:
+                continue
+            lens = np.array([len(a) for a in arrays], dtype=int)
+            data = np.concatenate(arrays)
+            cuts = np.concatenate([[0], np.cumsum(lens)]).astype(int)
+            for (_, leaf), a, b in zip(vleaves, cuts[:-1], cuts[1:]):
+                setattr(leaf, name, data[a:b])
+            leaf_owner = owner[[i for i, _ in vleaves]]
+            self.alphas.append((data, data[:, 3].copy(), np.repeat(leaf_owner, lens)))
+
+        self.lut_x = np.linspace(0.0, 1.0, _RATE_LUT_SAMPLES)
+        self.lut_y = np.array([self.rate_func(x) for x in self.lut_x], dtype=float)
+
+    def apply(self, t: float):
+        if not self.leaves:
+            return
+        if self.cell_time > 0:
+            u = np.clip((t - self.starts) / self.cell_time, 0.0, 1.0)
+        else:
+            u = (t >= self.starts).astype(float)
+        r = np.interp(u, self.lut_x, self.lut_y)
+        s = (self.scale + (1.0 - self.scale) * r)[self.point_owner, None]
+        scaled = self.point_centers + s * (self.p0 - self.point_centers)
+        self.points[:] = np.where(s >= 1.0, self.p0, scaled)
+        for data, base, owner in self.alphas:
+            data[:, 3] = base * r[owner]
+
+    def finish(self):
+        # 断开缓冲区视图，之后的 set_fill / shift 只作用于各自物体
+        for leaf in self.leaves:
+            leaf.points = np.array(leaf.points)
+            if isinstance(leaf, VMobject):
+                for name in self._ALPHA_ARRAYS:
+                    setattr(leaf, name, np.array(getattr(leaf, name)))
+
+
+class TimelineAnimation(Animation):
+    """
+    Timeline.compile() 的产物：线性时间，每帧按绝对时刻驱动处于生效区间内的轨道。
+
+    - 轨道按 t0 排序，游标推进到 t 时纳入；t ≥ t1 时最后执行一次（终态）后移出，
+      每帧代价与同时生效的轨道数成正比，而非轨道总数；
+    - Cairo 渲染时，生效轨道集合一变就按 manim 的规则（场景顺序中第一个变化物体起的后缀）
+      重算 moving / static 并重烘静态底图：已完成的格子进底图，尚未开始的 reveal 完全透明，
+      两边都不画。
+    """
+
+    def __init__(self, timeline: "Timeline", **kwargs):
+        self.timeline = timeline
+        self.tracks = timeline.tracks()
+        kwargs.update(run_time=timeline.duration, rate_func=linear)
+        super().__init__(Group(*timeline.mobjects()), **kwargs)
+        self._scene = None
+        self._blank = VMobject()  # moving 为空时的占位：update_frame 收到空列表会重画整个场景
+
+    def create_starting_mobject(self) -> Mobject:
+        # 各轨道自行记录起始状态，无需整组深拷贝
+        return self.mobject
+
+    def _setup_scene(self, scene) -> None:
+        super()._setup_scene(scene)
+        self._scene = scene
+
+    def _rewind(self) -> None:
+        for track in self.tracks:
+            track.apply(0.0)
+        self._next, self._active, self._time = 0, [], 0.0
+        self._layer_key = None
+
+    def begin(self) -> None:
+        for track in self.tracks:
+            track.begin()
+        self._order = sorted(self.tracks, key=lambda track: track.t0)
+        self._rewind()
+        # begin 之后 scene 会按整组重算一次 moving / static，首帧再接管分层
+        self._layering = False
+        super().begin()
+        self._layering = True
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = alpha * self.timeline.duration
+        if t < self._time - 1e-9:
+            self._rewind()
+        self._time = t
+        while self._next < len(self._order) and self._order[self._next].t0 <= t:
+            self._active.append(self._order[self._next])
+            self._next += 1
+        for track in self._active:
+            track.apply(t)
+        self._active = [track for track in self._active if t < track.t1]
+        if self._layering:
+            self._update_layers()
+
+    def _update_layers(self) -> None:
+        scene = self._scene
+        renderer = getattr(scene, "renderer", None)
+        if renderer is None or renderer.skip_animations or not hasattr(renderer, "save_static_frame_data"):
+            return
+        key = (self._next, tuple(id(track) for track in self._active))
+        if key == self._layer_key:
+            return
+        self._layer_key = key
+
+        hidden = {
+            id(m)
+            for track in self._order[self._next:]
+            if track.hidden_until_start
+            for mob in track.mobjects
+            for m in mob.get_family()
+        }
+        changing = {id(mob) for track in self._active for mob in track.mobjects}
+        changing.update(id(anim.mobject) for anim in scene.animations if anim is not self)
+        foreground = {id(mob) for mob in scene.foreground_mobjects}
+
+        use_z_index = renderer.camera.use_z_index
+        families = [mob for mob in scene.get_mobject_family_members() if id(mob) not in hidden]
+        moving: List[Mobject] = []
+        for i, mob in enumerate(families):
+            if id(mob) in changing or id(mob) in foreground or mob.get_family_updaters():
+                moving = families[i:]
+                break
+        moving = [m for m in extract_mobject_family_members(moving, use_z_index=use_z_index) if id(m) not in hidden]
+        moving_ids = {id(m) for m in moving}
+        static = [
+            m
+            for m in extract_mobject_family_members(
+                list_update(scene.mobjects, scene.foreground_mobjects),
+                use_z_index=use_z_index,
+                only_those_with_points=True,
+            )
+            if id(m) not in moving_ids and id(m) not in hidden
+        ]
+        scene.moving_mobjects = moving or [self._blank]
+        scene.static_mobjects = static
+        renderer.save_static_frame_data(scene, static)
+
+    def finish(self) -> None:
+        self._layering = False
+        super().finish()
+        for track in self.tracks:
+            track.finish()
+
+
+class Timeline:
+    """
+    关键步骤时间线：步骤默认首尾相接（游标推进），也可用 at= 指定绝对起点。
+
+    用法：
+        tl = Timeline()
+        for pos, value, cell in steps:
+            tl.set_value(tracker, value)
+            tl.move(window, pos, run_time=0.25)
+            tl.reveal(cell, run_time=0.15, scale=0.3)
+        tl.wipe(rest_cells, run_time=3.0)   # 其余步骤快进为一次向量化扫掠
+        tl.play(self)   # 一次 self.play，时长为各步骤之和
+    """
+
+    def __init__(self):
+        self.cursor = 0.0
+        self.duration = 0.0
+        self._moves: Dict[int, _MoveTrack] = {}
+        self._reveals: list = []
+        self._trackers: Dict[int, _TrackerTrack] = {}
+        self._mobjects: Dict[int, Mobject] = {}
+
+    def _span(self, run_time: float, at: Optional[float]) -> Tuple[float, float]:
+        t0 = self.cursor if at is None else float(at)
+        t1 = t0 + float(run_time)
+        self.cursor = t1
+        self.duration = max(self.duration, t1)
+        return t0, t1
+
+    def move(self, mobject: Mobject, point, run_time: float = 0.25, rate_func: RateFunc = smooth, at: Optional[float] = None):
+        t0, t1 = self._span(run_time, at)
+        if id(mobject) not in self._moves:
+            self._moves[id(mobject)] = _MoveTrack(mobject)
+        self._moves[id(mobject)].add(t0, t1, point, rate_func)
+        self._mobjects.setdefault(id(mobject), mobject)
+        return self
+
+    def reveal(self, mobject: Mobject, run_time: float = 0.15, scale: float = 0.3, rate_func: RateFunc = smooth, at: Optional[float] = None):
+        t0, t1 = self._span(run_time, at)
+        self._reveals.append(_RevealTrack(mobject, t0, t1, scale, rate_func))
+        self._mobjects.setdefault(id(mobject), mobject)
+        return self
+
+    def wipe(
+        self,
+        mobjects: Sequence[Mobject],
+        run_time: float = 3.0,
+        cell_time: float = 0.15,
+        scale: float = 0.3,
+        rate_func: RateFunc = smooth,
+        tracker: Optional[ValueTracker] = None,
+        values: Optional[Sequence[float]] = None,
+        mover: Optional[Mobject] = None,
+        points: Optional[Sequence[np.ndarray]] = None,
+        at: Optional[float] = None,
+    ):
+        """
+        快进扫掠：n 个物体的 reveal 起点均匀铺满 run_time（每个持续 cell_time），
+        整体一条向量化轨道，代价与 n 基本无关。
+        可选 tracker/values 在各起点同步读数，mover/points 让窗口逐格跟随。
+        """
+        mobjects = list(mobjects)
+        t0, t1 = self._span(run_time, at)
+        if not mobjects:
+            return self
+        cell_time = min(cell_time, t1 - t0)
+        stride = (t1 - t0 - cell_time) / max(len(mobjects) - 1, 1)
+        starts = t0 + stride * np.arange(len(mobjects))
+        self._reveals.append(_WipeTrack(mobjects, starts, cell_time, scale, rate_func))
+        for mob in mobjects:
+            self._mobjects.setdefault(id(mob), mob)
+        if tracker is not None and values is not None:
+            for start, value in zip(starts, values):
+                self.set_value(tracker, value, at=start)
+        if mover is not None and points is not None:
+            # 每格在其 reveal 时段内到位，末格恰好于扫掠结束时抵达
+            step_time = min(stride, cell_time)
+            for start, point in zip(starts, points):
+                self.move(mover, point, run_time=step_time, rate_func=smooth, at=start)
+        self.cursor = t1
+        return self
+
+    def set_value(self, tracker: ValueTracker, value: float, at: Optional[float] = None):
+        t0 = self.cursor if at is None else float(at)
+        if id(tracker) not in self._trackers:
+            self._trackers[id(tracker)] = _TrackerTrack(tracker)
+        self._trackers[id(tracker)].add(t0, float(value))
+        return self
+
+    def wait(self, run_time: float):
+        self._span(run_time, None)
+        return self
+
+    def mobjects(self) -> List[Mobject]:
+        return list(self._mobjects.values())
+
+    def tracks(self) -> list:
+        return [*self._trackers.values(), *self._moves.values(), *self._reveals]
+
+    def compile(self, **kwargs) -> TimelineAnimation:
+        return TimelineAnimation(self, **kwargs)
+
+    def play(self, scene, **kwargs):
+        """编译并以单个 play 播放；零时长时间线不进 play，直接落到终态（同样执行 finish）。"""
+        if self.duration > 0:
+            scene.play(self.compile(**kwargs))
+            return
+        for track in self.tracks():
+            track.begin()
+            track.apply(self.duration)
+            track.finish()
+
+
+__all__ = ["Timeline", "TimelineAnimation"]
@@ -2,7 +2,9 @@
 通用工具函数，已去版本化并自包含。
 """
 
-from typing import Optional, Literal
+from typing import Callable, Optional, Literal, Sequence, Union
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 import textwrap
 import re
@@ -13,6 +15,7 @@ from manim import (
     Matrix,
     Scene,
     Mobject,
+    ValueTracker,
     MathTex as _OriginalMathTex,
     interpolate_color,
     LaggedStart,
@@ -32,14 +35,58 @@ from manim_lib.layout import SAFE_RECT
 # 文本与样式工具
 # =============================================================================
 
-def safer_text(s: str, font_size: float = 30, color= "WHITE") -> Text:
+# 中文字体候选（按优先级）；进程内只探测一次，避免每个标签都做一次失败的字体查找
+PREFERRED_FONTS = ("SimHei",)
+TEXT_CACHE_SIZE = 256
+
+
+def _probe_font(candidates=PREFERRED_FONTS) -> Optional[str]:
+    try:
+        import manimpango
+
+        available = set(manimpango.list_fonts())
+    except Exception:
+        # 无法枚举字体时沿用旧行为：直接交给 Pango 处理首选字体
+        return candidates[0] if candidates else None
+    for name in candidates:
+        if name in available:
+            return name
+    return None
+
+
+RESOLVED_FONT: Optional[str] = _probe_font()
+
+
+def _color_key(color):
+    # ManimColor 等不可哈希的颜色统一转成字符串作为缓存键
+    try:
+        hash(color)
+        return color
+    except TypeError:
+        return str(color)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _build_text(s: str, font_size: float, color, font: Optional[str], line_spacing: float) -> Text:
     # Emoji 在多数 Linux 环境下字体缺失，给出警告，避免“空白/透明”渲染
     if re.search(r'[\U0001F300-\U0001FAFF]', s):
         print("[warn] 检测到 Emoji，Linux 默认字体可能无法渲染，建议改用文字或几何图形替代。", file=sys.stderr)
-    try:
-        return Text(s, font_size=font_size, color=color, font="SimHei")
-    except Exception:
-        return Text(s, font_size=font_size, color=color)
+    if font is not None:
+        try:
+            return Text(s, font_size=font_size, color=color, font=font, line_spacing=line_spacing)
+        except Exception:
+            pass
+    return Text(s, font_size=font_size, color=color, line_spacing=line_spacing)
+
+
+def cached_text(s: str, font_size: float = 30, color="WHITE", line_spacing: float = -1, font: Optional[str] = None) -> Text:
+    """按 (文本, 字号, 颜色, 字体, 行距) 缓存 Text，返回副本，调用方可随意变换。"""
+    font = RESOLVED_FONT if font is None else font
+    return _build_text(s, font_size, _color_key(color), font, line_spacing).copy()
+
+
+def safer_text(s: str, font_size: float = 30, color= "WHITE") -> Text:
+    return cached_text(s, font_size=font_size, color=color)
 
 
 def make_highlight_rect(
@@ -124,6 +171,58 @@ def wiggle_effect(scene: Scene, mobject: Mobject, scale_value: float = 1.05, run
     scene.play(Wiggle(mobject, scale_value=scale_value), run_time=run_time)
 
 
+# =============================================================================
+# 增量重绘：always_redraw 的记忆化替代
+# =============================================================================
+def redraw_on_change(
+    builder: Callable[..., Mobject],
+    *trackers: ValueTracker,
+    quantum: Union[float, Sequence[float]] = 1e-3,
+    cache_size: int = 32,
+) -> Mobject:
+    """
+    只在显式依赖的 tracker 变化超过量化步长时重建，且以量化值为键保留小型 LRU。
+    静止等待零开销；来回扫动命中缓存，只做一次 become。
+
+    builder 接收各 tracker 向下量化后的取值（与 trackers 顺序一致）：
+        tan_dot = redraw_on_change(lambda x: Dot(axes.c2p(x, f(x))), t, quantum=0.005)
+    """
+    quanta = np.broadcast_to(np.asarray(quantum, dtype=float), (len(trackers),))
+    cache: "OrderedDict[tuple, Mobject]" = OrderedDict()
+
+    def key_of() -> tuple:
+        key = []
+        for tracker, q in zip(trackers, quanta):
+            v = tracker.get_value()
+            # 向下取整（与调用方原先的 int(x) 截断一致）；1e-9 吸收 0.3 / 0.1 这类浮点误差
+            key.append(int(np.floor(v / q + 1e-9)) if q > 0 else float(v))
+        return tuple(key)
+
+    def fetch(key: tuple) -> Mobject:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        values = [k * q if q > 0 else k for k, q in zip(key, quanta)]
+        built = builder(*values)
+        cache[key] = built
+        if len(cache) > cache_size:
+            cache.popitem(last=False)
+        return built
+
+    state = {"key": key_of()}
+    mob = fetch(state["key"]).copy()
+
+    def _update(m):
+        key = key_of()
+        if key == state["key"]:
+            return
+        state["key"] = key
+        m.become(fetch(key))
+
+    mob.add_updater(_update)
+    return mob
+
+
 # =============================================================================
 # 安全 MathTex 工具：防止中文/Emoji 直接进 MathTex 触发 LaTeX 报错
 # =============================================================================
@@ -153,6 +252,8 @@ def MathTexSafe(*tex_strings: str, **kwargs):
 
 __all__ = [
     "safer_text",
+    "cached_text",
+    "RESOLVED_FONT",
     "make_highlight_rect",
     "get_quality_config",
     "apply_wave_effect",
@@ -160,6 +261,7 @@ __all__ = [
     "gradient_color",
     "lagged_fade_in",
     "wiggle_effect",
+    "redraw_on_change",
     "QUALITY_CONFIG",
     "DEFAULT_QUALITY",
     "Quality",
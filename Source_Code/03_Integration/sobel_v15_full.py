@@ -23,6 +23,7 @@ from manim_lib import (
     NeonLine,
     BaseScene,
     BaseThreeDScene,
+    CompositeScene,
     COLOR_CONTINUOUS,
     COLOR_DISCRETE,
     COLOR_DIFF,
@@ -39,6 +40,17 @@ from manim_lib import (
     show_solution,
     show_validation,
     ensure_safe_bounds,
+    StaggeredReveal,
+    TraceCurve,
+    redraw_on_change,
+    NumericLabel,
+    Timeline,
+    HeightField,
+    LODSurface,
+    GradientColoring,
+    axes_grid_func,
+    convolve_normalized,
+    pixel_grid,
 )
 
 # -----------------------------------------------------------------------------
@@ -71,7 +83,8 @@ class Scene0Intro(BaseThreeDScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene0Intro))
 
         # ====================================================================
         # V14 叙事重构 Part 1: 设问（Intuition）
@@ -137,9 +150,7 @@ class Scene0Intro(BaseThreeDScene):
             noise_positions.append((x, y, val))
         
         # 分批显示噪声点（每批显示多个点，加快速度）
-        # 使用 LaggedStart 让噪声点更自然地出现
         batch_size = 10
-        all_batch_dots = []
         
         for i in range(0, num_noise_points, batch_size):
             batch_dots = VGroup()
@@ -153,32 +164,14 @@ class Scene0Intro(BaseThreeDScene):
                 )
                 batch_dots.add(dot)
             
-            all_batch_dots.append(batch_dots)
-            noise_dots.add(*batch_dots)
+            noise_dots.add(batch_dots)
         
-        # 使用 LaggedStart 批量显示，更流畅，同时逐步降低清晰图的不透明度，制造“污染”感
-        steps = len(all_batch_dots)
-        animations = []
-        for idx, batch in enumerate(all_batch_dots):
-            # 清晰图逐步淡出，噪声逐步浮现
-            fade_clean = clean_group.animate.set_opacity(max(0.15, 1 - 0.85 * (idx + 1) / steps))
-            animations.append(
-                LaggedStart(
-                    FadeIn(batch, scale=0.3),
-                    fade_clean,
-                    lag_ratio=0.0,
-                    run_time=0.45
-                )
-            )
-
+        # 按批错峰显示（一次向量化插值），同时降低清晰图的不透明度，制造“污染”感
         # V14 节奏控制：慢动作展示噪声生成过程
         self.play(
-            LaggedStart(
-                *animations,
-                lag_ratio=0.12,
-                run_time=2.8 * PacingController.SLOW_MOTION_FACTOR,  # 慢动作
-                rate_func=smooth
-            )
+            StaggeredReveal(noise_dots, lag_ratio=0.12, start_scale=0.3),
+            clean_group.animate.set_opacity(0.15),
+            run_time=2.8 * PacingController.SLOW_MOTION_FACTOR,  # 慢动作
         )
         # V14 节奏控制：3秒法则
         slow_wait(self, 1.5)
@@ -206,18 +199,8 @@ class Scene0Intro(BaseThreeDScene):
             line.set_color(PALETTE["EDGE"])
         # V14 节奏控制：慢动作展示边缘提取
         self.play(
-            LaggedStart(
-                *[
-                    Succession(
-                        line.animate.set_opacity(0.6).set_stroke(width=2.5),
-                        line.animate.set_opacity(0.85).set_stroke(width=line.stroke_width or 3.2)
-                    )
-                    for line in edge_preview
-                ],
-                lag_ratio=0.12,
-                run_time=3.0 * PacingController.SLOW_MOTION_FACTOR,  # 慢动作
-                rate_func=smooth
-            )
+            StaggeredReveal(edge_preview, lag_ratio=0.12, target_opacity=0.85, target_width=3.2),
+            run_time=3.0 * PacingController.SLOW_MOTION_FACTOR,  # 慢动作
         )
         # V14 节奏控制：3秒法则
         slow_wait(self, 2.0)
@@ -432,11 +415,12 @@ if __name__ == "__main__":
 # =============================================================================
 # Full video wrapper：串联各分场景（便于一次渲染）
 # =============================================================================
-class FullSobelVideo(BaseThreeDScene):
+class FullSobelVideo(CompositeScene):
     """
     一次性串联全部分场景。
     由于各分场景内部用到的私有 helper 方法定义在各类中，
     这里提供轻量包装器把相关 helper 委托回对应类，避免 AttributeError。
+    2D 分场景走平面相机，仅 Scene0Intro / Scene4Vision 使用 3D 相机（见 CompositeScene）。
     """
 
     # --- helper proxies for Scene0Intro ---
@@ -471,30 +455,20 @@ class FullSobelVideo(BaseThreeDScene):
         return Scene4_5Applications._make_threshold_triplet(self)
 
     def construct(self):
-        # 0. 开场
-        Scene0Intro.construct(self)
-        # 1. 连续→离散
-        Scene1Discrete.construct(self)
-        # 1.5 极限困境
-        Scene1_5Limits.construct(self)
-        # 2. 泰勒抵消
-        Scene2Taylor.construct(self)
-        # 2.5 差分对比
-        Scene2_5Comparison.construct(self)
-        # 3. Sobel 诞生
-        Scene3SobelConstruct.construct(self)
-        # 3.5 卷积可视化
-        Scene3_5Convolution.construct(self)
-        # 4.2 多尺度对比
-        Scene4_2MultiScale.construct(self)
-        # 4. 3D 扫描
-        Scene4Vision.construct(self)
-        # 4.6 真实图像流程
-        Scene4_6RealImage.construct(self)
-        # 4.5 应用对照
-        Scene4_5Applications.construct(self)
-        # 5. 收尾
-        Scene5Outro.construct(self)
+        self.run_sub_scenes(
+            Scene0Intro,  # 0. 开场
+            Scene1Discrete,  # 1. 连续→离散
+            Scene1_5Limits,  # 1.5 极限困境
+            Scene2Taylor,  # 2. 泰勒抵消
+            Scene2_5Comparison,  # 2.5 差分对比
+            Scene3SobelConstruct,  # 3. Sobel 诞生
+            Scene3_5Convolution,  # 3.5 卷积可视化
+            Scene4_2MultiScale,  # 4.2 多尺度对比
+            Scene4Vision,  # 4. 3D 扫描
+            Scene4_6RealImage,  # 4.6 真实图像流程
+            Scene4_5Applications,  # 4.5 应用对照
+            Scene5Outro,  # 5. 收尾
+        )
 
 
 # =============================================================================
@@ -512,7 +486,8 @@ class Scene1Discrete(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene1Discrete))
 
         # V14 极简主义：低饱和度坐标轴
         axes_config = MinimalismHelper.create_focus_axes(stroke_opacity=0.3)
@@ -560,14 +535,14 @@ class Scene1Discrete(BaseScene):
             dot = Dot(axes.c2p(tx, f(tx)), color=PALETTE["MATH_ERROR"], radius=0.08)
             tangents.add(line, dot)
         # V14 节奏控制：慢动作展示
-        self.play(LaggedStart(*[Create(t) for t in tangents], lag_ratio=0.2, run_time=1.8 * PacingController.SLOW_MOTION_FACTOR))
+        self.play(StaggeredReveal(tangents, lag_ratio=0.2, draw=True, start_opacity=None), run_time=1.8 * PacingController.SLOW_MOTION_FACTOR)
         slow_wait(self, 1.0)
         slow_play(self, FadeOut(tangents, shift=DOWN * 0.2), base_run_time=0.8)
 
         # 动态切线演示
         t = ValueTracker(2.0)
-        def tangent():
-            x = t.get_value(); dx = 0.01
+        def tangent(x):
+            dx = 0.01
             dy = (f(x + dx) - f(x - dx)) / (2 * dx)
             # V13: 使用语义化颜色
             return Line(
@@ -576,12 +551,15 @@ class Scene1Discrete(BaseScene):
                 color=PALETTE["MATH_ERROR"],
                 stroke_width=3,
             )
-        tan_line = always_redraw(tangent)
-        tan_dot = always_redraw(lambda: Dot(axes.c2p(t.get_value(), f(t.get_value())), color=PALETTE["MATH_ERROR"], radius=0.08))
-        slope_text = always_redraw(lambda: MathTex(
-            rf"f'({t.get_value():.1f}) \approx {((f(t.get_value()+0.01)-f(t.get_value()-0.01))/0.02):.2f}",
-            font_size=28, color=PALETTE["MATH_ERROR"]
-        ).to_edge(UR, buff=0.8))
+        # 按 tracker 量化重建：静止等待不重建，回扫命中缓存
+        tan_line = redraw_on_change(tangent, t, quantum=0.005)
+        tan_dot = redraw_on_change(lambda x: Dot(axes.c2p(x, f(x)), color=PALETTE["MATH_ERROR"], radius=0.08), t, quantum=0.005)
+        # 字形图集读数：逐帧更新不再触发 LaTeX 编译
+        slope_text = NumericLabel(
+            "f'(", "{:.1f}", r") \approx ", "{:.2f}",
+            font_size=28, color=PALETTE["MATH_ERROR"], align=RIGHT,
+        ).to_edge(UR, buff=0.8)
+        slope_text.track(t, mapping=lambda x: (x, (f(x + 0.01) - f(x - 0.01)) / 0.02))
 
         self.add(tan_line, tan_dot, slope_text)
         # V14 节奏控制：慢动作展示动态切线
@@ -669,8 +647,8 @@ class Scene1Discrete(BaseScene):
             label = MathTex(rf"\Delta x = {dx}", font_size=26, color=PALETTE["MATH_ERROR"]).next_to(line, DOWN, buff=0.25)
             dx_lines.add(line); dx_labels.add(label)
         # V14 节奏控制：慢动作展示
-        self.play(LaggedStart(*[Create(line) for line in dx_lines], lag_ratio=0.2, run_time=1.2 * PacingController.SLOW_MOTION_FACTOR))
-        self.play(LaggedStart(*[FadeIn(lbl) for lbl in dx_labels], lag_ratio=0.2, run_time=1.0 * PacingController.SLOW_MOTION_FACTOR))
+        self.play(StaggeredReveal(dx_lines, lag_ratio=0.2, draw=True, start_opacity=None), run_time=1.2 * PacingController.SLOW_MOTION_FACTOR)
+        self.play(StaggeredReveal(dx_labels, lag_ratio=0.2), run_time=1.0 * PacingController.SLOW_MOTION_FACTOR)
         # V14 节奏控制：复杂图形变化后必须等待2秒
         slow_wait(self, 2.0)
 
@@ -758,7 +736,8 @@ class Scene1_5Limits(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene1_5Limits))
 
         # V14 叙事重构：设问
         hud.show("当微积分的'无限细分'撞上像素的'颗粒感'，导数还存在吗？", wait_after=1.5)
@@ -797,11 +776,11 @@ class Scene1_5Limits(BaseScene):
         
         # V13: 单一信源驱动（解决 #10）
         dx_tracker = ValueTracker(0)
-        approx_label = always_redraw(lambda: MathTex(
-            rf"\Delta x = {dx_values[int(dx_tracker.get_value())]:.3g},\; f'(x_0)\approx {slopes[int(dx_tracker.get_value())]:.2f}",
-            font_size=28,
-            color=WHITE
-        ).to_edge(RIGHT, buff=0.8).shift(UP * 1.5))
+        approx_label = NumericLabel(
+            r"\Delta x = ", "{:.3g}", r",\; f'(x_0)\approx ", "{:.2f}",
+            font_size=28, color=WHITE, align=RIGHT,
+        ).to_edge(RIGHT, buff=0.8).shift(UP * 1.5)
+        approx_label.track(dx_tracker, mapping=lambda i: (dx_values[int(i)], slopes[int(i)]))
         self.add_to_math_group(approx_label)
         # V13: 使用语义化颜色
         x0_dot = Dot(axes.c2p(x0, f(x0)), color=PALETTE["MATH_ERROR"], radius=0.08)
@@ -904,7 +883,8 @@ class Scene2Taylor(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene2Taylor))
 
         # V14 叙事重构：设问
         # V14 新文案：解释"为什么"要用泰勒
@@ -1187,7 +1167,8 @@ class Scene2_5Comparison(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene2_5Comparison))
 
         # V14 叙事重构：设问
         hud.show("三种差分：前向、后向、中心 —— 谁的误差更小？", wait_after=1.5)
@@ -1204,11 +1185,8 @@ class Scene2_5Comparison(BaseScene):
         axes_backward = axes_forward.copy()
         axes_center = axes_forward.copy()
         axes_group = VGroup(axes_forward, axes_backward, axes_center).arrange(RIGHT, buff=0.7).to_edge(UP, buff=0.6)
+        # 分层：坐标轴压到背景（整组一次完成）
         LayerManager.set_layer(axes_group, LayerManager.L_BG)
-        # 分层：坐标轴压到背景
-        LayerManager.set_layer(axes_forward, LayerManager.L_BG)
-        LayerManager.set_layer(axes_backward, LayerManager.L_BG)
-        LayerManager.set_layer(axes_center, LayerManager.L_BG)
 
         # V13: 使用语义化差分颜色（解决 #16）
         labels = VGroup(
@@ -1247,12 +1225,11 @@ class Scene2_5Comparison(BaseScene):
         backward_dots = scatter(backward_points, axes_backward, PALETTE["DIFF_BWD"])
         center_dots = scatter(center_points, axes_center, PALETTE["DIFF_CTR"])
         self.add_to_math_group(forward_dots, backward_dots, center_dots)
-        LayerManager.set_layer(forward_dots, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(backward_dots, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(center_dots, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(forward_dots, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(backward_dots, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(center_dots, LayerManager.L_ACTIVE)
+        LayerManager.set_layers([
+            (forward_dots, LayerManager.L_ACTIVE),
+            (backward_dots, LayerManager.L_ACTIVE),
+            (center_dots, LayerManager.L_ACTIVE),
+        ])
 
         # V14 节奏控制：慢动作展示
         self.play(
@@ -1280,7 +1257,6 @@ class Scene2_5Comparison(BaseScene):
         bars_cen = VGroup(*[error_bar(cen[1]) for cen in center_points]).arrange(RIGHT, buff=0.05)
         heatmap = VGroup(bars_fwd, bars_bwd, bars_cen).arrange(DOWN, buff=0.3).to_edge(DOWN, buff=0.9)
         LayerManager.set_layer(heatmap, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(heatmap, LayerManager.L_ACTIVE)
 
         heat_labels = VGroup(
             safer_text("误差强度（示意）", font_size=24, color=WHITE).next_to(heatmap, UP, buff=0.25),
@@ -1302,7 +1278,6 @@ class Scene2_5Comparison(BaseScene):
             tips=False,
         ).to_edge(DOWN, buff=0.35)
         LayerManager.set_layer(axes_real, LayerManager.L_BG)
-        LayerManager.set_layer(axes_real, LayerManager.L_BG)
         # V13: 使用语义化差分颜色
         fwd_graph = axes_real.plot(lambda x: (f(x + dx) - f(x)) / dx, x_range=[1, 7], color=PALETTE["DIFF_FWD"], stroke_width=2.5, stroke_opacity=0.8)
         bwd_graph = axes_real.plot(lambda x: (f(x) - f(x - dx)) / dx, x_range=[1, 7], color=PALETTE["DIFF_BWD"], stroke_width=2.5, stroke_opacity=0.65)
@@ -1314,14 +1289,12 @@ class Scene2_5Comparison(BaseScene):
         )
         legend.arrange(RIGHT, buff=0.6).to_corner(UR, buff=0.2)
         self.add_to_math_group(axes_real, fwd_graph, bwd_graph, cen_graph, legend)
-        LayerManager.set_layer(fwd_graph, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(bwd_graph, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(cen_graph, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(legend, LayerManager.L_LABEL)
-        LayerManager.set_layer(fwd_graph, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(bwd_graph, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(cen_graph, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(legend, LayerManager.L_LABEL)
+        LayerManager.set_layers([
+            (fwd_graph, LayerManager.L_ACTIVE),
+            (bwd_graph, LayerManager.L_ACTIVE),
+            (cen_graph, LayerManager.L_ACTIVE),
+            (legend, LayerManager.L_LABEL),
+        ])
 
         # V14 节奏控制：慢动作展示
         slow_play(self, Create(axes_real), base_run_time=1.0)
@@ -1354,7 +1327,8 @@ class Scene3SobelConstruct(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene3SobelConstruct))
 
         # V14 叙事重构：设问
         # V14 新文案：解释 Sobel 的构造逻辑
@@ -1588,9 +1562,15 @@ class Scene3_5Convolution(BaseScene):
     - 极简主义：静态展示，删除装饰性动画
     """
 
+    # 细节预算：前 DETAIL_STEPS 个窗口位置逐步演示，其余在 WIPE_TIME 秒内向量化扫掠补完，
+    # 场景时长与渲染量不随图像尺寸增长（8×8 演示共 36 步，恰好全部逐步播放；扫掠分支见 tests/test_timeline.py）
+    DETAIL_STEPS = 36
+    WIPE_TIME = 3.0
+
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene3_5Convolution))
 
         # V14 叙事重构：设问
         hud.show("卷积 = 滑动窗口的加权求和。看看 Sobel 如何工作。", wait_after=1.5)
@@ -1681,7 +1661,6 @@ class Scene3_5Convolution(BaseScene):
                 cell_rect.set_fill(color)
                 cell_rect.move_to(result_group[(i * size) + j].get_center())
                 fill_group.add(cell_rect)
-                LayerManager.set_layer(cell_rect, LayerManager.L_ACTIVE)
 
                 pos = window_pos(i, j)
                 animations.append((
@@ -1689,21 +1668,40 @@ class Scene3_5Convolution(BaseScene):
                     conv_val,
                     cell_rect
                 ))
+        LayerManager.set_layer(fill_group, LayerManager.L_ACTIVE)
 
         # 逐步播放扫描和填充（窗口旁实时显示局部卷积值）
         conv_tracker = ValueTracker(0.0)
-        readout = always_redraw(lambda: DecimalNumber(
-            conv_tracker.get_value(),
+        readout = redraw_on_change(lambda v: DecimalNumber(
+            v,
             num_decimal_places=2,
             font_size=26,
             color=PALETTE["MATH_ERROR"]
-        ).next_to(window, UP, buff=0.2))
+        ), conv_tracker, quantum=0.005)
+        readout.add_updater(lambda m: m.next_to(window, UP, buff=0.2))
+        LayerManager.set_layer(readout, LayerManager.L_LABEL)
         self.add_to_math_group(readout)
 
-        for step, (pos, conv_val, cell_rect) in enumerate(animations):
-            conv_tracker.set_value(conv_val)
-            self.play(window.animate.move_to(image_full.get_center() + pos), run_time=0.25, rate_func=smooth)
-            self.play(FadeIn(cell_rect, scale=0.3), run_time=0.15)
+        # 全部扫描步骤编译为一条时间线，单次 play 完成（时长与逐步播放一致）
+        self.add_to_math_group(fill_group)
+        timeline = Timeline()
+        budget = Scene3_5Convolution.DETAIL_STEPS
+        for pos, conv_val, cell_rect in animations[:budget]:
+            timeline.set_value(conv_tracker, conv_val)
+            timeline.move(window, image_full.get_center() + pos, run_time=0.25, rate_func=smooth)
+            timeline.reveal(cell_rect, run_time=0.15, scale=0.3)
+        rest = animations[budget:]
+        if rest:
+            # 超出预算的步骤：窗口逐格跟随、读数同步，填充一次扫掠完成
+            timeline.wipe(
+                [cell_rect for _, _, cell_rect in rest],
+                run_time=Scene3_5Convolution.WIPE_TIME,
+                tracker=conv_tracker,
+                values=[conv_val for _, conv_val, _ in rest],
+                mover=window,
+                points=[image_full.get_center() + pos for pos, _, _ in rest],
+            )
+        timeline.play(self)
         slow_wait(self, 0.6)  # V14 节奏控制：所有等待时间使用 slow_wait
 
         hud.show("卷积结果逐步填充：红=强边缘，蓝绿=弱。", wait_after=1.2)
@@ -1728,7 +1726,8 @@ class Scene4_2MultiScale(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene4_2MultiScale))
 
         # V14 叙事重构：设问
         hud.show("尺度决定细节：小核抓细纹，大核抓粗轮廓。", wait_after=1.5)
@@ -1749,18 +1748,7 @@ class Scene4_2MultiScale(BaseScene):
         img_vals = np.clip(img_vals, 0, 1)
 
         def make_image(vals, with_box=True):
-            g = VGroup()
-            rows, cols = vals.shape
-            for i in range(rows):
-                for j in range(cols):
-                    sq = Square(side_length=cell, stroke_width=0, fill_opacity=1)
-                    sq.set_fill(interpolate_color(BLACK, WHITE, vals[i, j]))
-                    sq.move_to(RIGHT * (j - cols / 2) * cell + UP * (rows / 2 - i) * cell)
-                    g.add(sq)
-            if with_box:
-                box = SurroundingRectangle(g, color=GREY_B, stroke_width=1, stroke_opacity=0.3)
-                return VGroup(box, g)
-            return g
+            return pixel_grid(vals, cell, with_box=with_box)
 
         raw_img = make_image(img_vals)
 
@@ -1784,23 +1772,9 @@ class Scene4_2MultiScale(BaseScene):
             ]),
         }
 
-        def convolve(vals, kernel):
-            h, w = vals.shape
-            kh, kw = kernel.shape
-            pad = kh // 2
-            padded = np.pad(vals, pad, mode="edge")
-            out = np.zeros_like(vals)
-            for i in range(h):
-                for j in range(w):
-                    patch = padded[i:i + kh, j:j + kw]
-                    out[i, j] = np.sum(patch * kernel)
-            m = np.max(np.abs(out)) or 1.0
-            out = (out / m + 1) / 2  # 归一化 0-1
-            return out
-
         results = []
         for k in ["3×3", "5×5", "7×7"]:
-            vals = convolve(img_vals, kernels[k])
+            vals = convolve_normalized(img_vals, kernels[k])
             res_img = make_image(vals)
             # V13: 使用语义化颜色
             label = safer_text(f"Sobel {k}", font_size=22, color=PALETTE["MATH_ERROR"]).next_to(res_img, DOWN, buff=0.2)
@@ -1817,7 +1791,7 @@ class Scene4_2MultiScale(BaseScene):
 
         hud.show("3×3 抓细节，7×7 更平滑、边缘更粗。", wait_after=1.4)
 
-        fused_vals = 0.4 * convolve(img_vals, kernels["3×3"]) + 0.35 * convolve(img_vals, kernels["5×5"]) + 0.25 * convolve(img_vals, kernels["7×7"])
+        fused_vals = 0.4 * convolve_normalized(img_vals, kernels["3×3"]) + 0.35 * convolve_normalized(img_vals, kernels["5×5"]) + 0.25 * convolve_normalized(img_vals, kernels["7×7"])
         fused_img = make_image(fused_vals)
         # V13: 使用语义化颜色
         fused_label = safer_text("多尺度融合", font_size=24, color=PALETTE["MATH_FUNC"]).next_to(fused_img, DOWN, buff=0.2)
@@ -1849,7 +1823,8 @@ class Scene4Vision(BaseThreeDScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene4Vision))
 
         hud.show("把亮度映射为高度，图像变成 3D 地形。", wait_after=1.8)
 
@@ -1862,6 +1837,9 @@ class Scene4Vision(BaseThreeDScene):
             bump = 0.25 * np.exp(-30 * ((u_n - 0.5)**2 + (v_n - 0.5)**2))
             return 0.6 * ridge + bump
 
+        # 单一信源：高度及其导数只采样一次，曲面 / 扫描框 / 示波器统一查表
+        field = HeightField(height, u_range=[0, cols], v_range=[0, rows])
+
         axes3d = ThreeDAxes(
             x_range=[0, cols, 5],
             y_range=[0, rows, 5],
@@ -1872,11 +1850,14 @@ class Scene4Vision(BaseThreeDScene):
             axis_config={"include_tip": False, "stroke_opacity": 0.85, "stroke_width": 2, "stroke_color": GREY_B},
         )
 
-        surface = Surface(
-            lambda u, v: axes3d.c2p(u, v, height(u, v) * 2.2),
+        # 网格按高度场内容缓存；扫描运动段用粗网格，静止段用细网格
+        surface = LODSurface(
+            lambda u, v: axes3d.c2p(u, v, field(u, v) * 2.2),
             u_range=[0, cols - 1],
             v_range=[0, rows - 1],
             resolution=q["surface_resolution"],
+            grid_func=axes_grid_func(axes3d, lambda U, V: field(U, V) * 2.2),
+            cache_key=("scene4_terrain", field.key),
             should_make_jagged=False,
         )
         # V13: 使用语义化颜色
@@ -1886,6 +1867,8 @@ class Scene4Vision(BaseThreeDScene):
             stroke_width=q["stroke_width"] * 0.35,
             fill_color=PALETTE["MATH_FUNC"],
         )
+        # 地形按梯度大小着色：平坦处为逻辑蓝，边缘处过渡到琥珀金
+        GradientColoring(surface, field).apply()
         self.add_to_math_group(axes3d, surface)
 
         self.set_camera_orientation(phi=60 * DEGREES, theta=-45 * DEGREES)
@@ -1897,9 +1880,7 @@ class Scene4Vision(BaseThreeDScene):
         # V13: 单一信源驱动 - 先定义 get_scan_data 函数
         def get_scan_data(t):
             """统一的扫描数据函数，确保扫描框和示波器数据一致"""
-            delta = 0.1
-            deriv = (height(t + delta, rows / 2) - height(t - delta, rows / 2)) / (2 * delta)
-            return deriv
+            return field.du(t, rows / 2)
 
         scan_tracker = ValueTracker(2)
         box_w, box_h = 1.4, 1.4
@@ -1914,7 +1895,7 @@ class Scene4Vision(BaseThreeDScene):
         def update_scanner(mob):
             u = scan_tracker.get_value()
             v = rows / 2
-            z = height(u, v) * 2.2
+            z = field(u, v) * 2.2
             pos = axes3d.c2p(u, v, z + 0.8)
             mob.move_to(pos)
             ground = axes3d.c2p(u, v, z)
@@ -1945,27 +1926,30 @@ class Scene4Vision(BaseThreeDScene):
         def deriv_func(x):
             return get_scan_data(x)
 
-        graph = always_redraw(lambda: hud_axes.plot(
-            deriv_func,
-            x_range=[0, scan_tracker.get_value() + 0.001],
-            color=scanner_group[0].get_color(),
-            stroke_width=3,
-        ))
-        dot = always_redraw(lambda: Dot(
-            hud_axes.c2p(scan_tracker.get_value(), deriv_func(scan_tracker.get_value())),
+        # 增量轨迹：每帧只补采样新扫过的区间，颜色随扫描框同步
+        graph = TraceCurve(hud_axes, deriv_func, x_start=0, stroke_width=3).track(
+            scan_tracker, color_source=scanner_group[0]
+        )
+        dot = redraw_on_change(lambda x: Dot(
+            hud_axes.c2p(x, deriv_func(x)),
             color=WHITE,
             radius=0.06,
-        ))
+        ), scan_tracker, quantum=0.01)
         self.add_fixed_in_frame_mobjects(hud_group, graph, dot)
 
+        surface.use("coarse")
         self.play(scan_tracker.animate.set_value(cols - 2), run_time=12.0, rate_func=smooth)
+        surface.use("fine")
         slow_wait(self, 3.0)  # V14 节奏控制：所有等待时间使用 slow_wait
 
         scanner_group.remove_updater(update_scanner)
+        graph.clear_updaters()
         # V13: 使用生命周期管理
         self.add_to_math_group(scanner_group, hud_group, graph, dot)
         hud.clear()
         self.clear_scene(fade_out=True, run_time=1.2)
+        # 画面已清空后复位机位：总场景中后续 2D 分场景与单独渲染时一致（见 CompositeScene）
+        self.set_camera_orientation(phi=0, theta=-90 * DEGREES)
         slow_wait(self, 0.6)  # V14 节奏控制：所有等待时间使用 slow_wait
 
 
@@ -1986,7 +1970,8 @@ class Scene4_6RealImage(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene4_6RealImage))
 
         hud.show("真实流程：原图 → 灰度 → Sobel X/Y → 梯度幅值 → 阈值。", wait_after=1.2)
 
@@ -2010,16 +1995,7 @@ class Scene4_6RealImage(BaseScene):
         base = np.clip(base, 0, 1)
 
         def make_image(vals, box_color=GREY_B):
-            g = VGroup()
-            h, w = vals.shape
-            for i in range(h):
-                for j in range(w):
-                    sq = Square(side_length=cell, stroke_width=0, fill_opacity=1)
-                    sq.set_fill(interpolate_color(BLACK, WHITE, vals[i, j]))
-                    sq.move_to(RIGHT * (j - w / 2) * cell + UP * (h / 2 - i) * cell)
-                    g.add(sq)
-            box = SurroundingRectangle(g, color=box_color, stroke_width=1, stroke_opacity=0.3)
-            return VGroup(box, g)
+            return pixel_grid(vals, cell, box_color=box_color)
 
         raw_img = make_image(base)
         gray_img = raw_img.copy()  # 已是灰度示意
@@ -2028,21 +2004,8 @@ class Scene4_6RealImage(BaseScene):
         sobel_x = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]])
         sobel_y = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]])
 
-        def convolve(vals, kernel):
-            h, w = vals.shape
-            pad = kernel.shape[0] // 2
-            padded = np.pad(vals, pad, mode="edge")
-            out = np.zeros_like(vals)
-            for i in range(h):
-                for j in range(w):
-                    patch = padded[i:i + kernel.shape[0], j:j + kernel.shape[1]]
-                    out[i, j] = np.sum(patch * kernel)
-            m = np.max(np.abs(out)) or 1.0
-            out = (out / m + 1) / 2
-            return out
-
-        gx = convolve(base, sobel_x)
-        gy = convolve(base, sobel_y)
+        gx = convolve_normalized(base, sobel_x)
+        gy = convolve_normalized(base, sobel_y)
         grad_mag = np.sqrt((gx - 0.5) ** 2 + (gy - 0.5) ** 2)
         if np.max(grad_mag) > 0:
             grad_mag /= np.max(grad_mag)
@@ -2108,7 +2071,8 @@ class Scene4_5Applications(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene4_5Applications))
 
         hud.show("看看现实画面：左侧原图，右侧边缘提取。", wait_after=1.6)
 
@@ -2134,8 +2098,10 @@ class Scene4_5Applications(BaseScene):
         thresh_triplet = self._make_threshold_triplet()
         thresh_triplet.to_edge(DOWN, buff=0.4)
         thresh_title = safer_text("阈值影响：低/中/高", font_size=24, color=WHITE).next_to(thresh_triplet, UP, buff=0.25)
-        LayerManager.set_layer(thresh_triplet, LayerManager.L_ACTIVE)
-        LayerManager.set_layer(thresh_title, LayerManager.L_LABEL)
+        LayerManager.set_layers([
+            (thresh_triplet, LayerManager.L_ACTIVE),
+            (thresh_title, LayerManager.L_LABEL),
+        ])
         self.play(FadeIn(VGroup(thresh_triplet, thresh_title), shift=UP * 0.2), run_time=1.0)
         slow_wait(self, 1.4)  # V14 节奏控制：所有等待时间使用 slow_wait
 
@@ -2380,7 +2346,8 @@ class Scene5Outro(BaseScene):
 
     def construct(self):
         self.camera.background_color = BG_COLOR
-        hud = SubtitleManager(self)
+        hud = self.subtitles
+        hud.prerender(SubtitleManager.collect_texts(Scene5Outro))
 
         hud.show("从连续导数到离散差分，从噪声到轮廓，我们看见了什么。", wait_after=2.0)
 
@@ -2429,7 +2396,7 @@ class Scene5Outro(BaseScene):
         ).arrange(DOWN, buff=0.35, aligned_edge=LEFT)
         # 确保y坐标 > -2.0，避免进入字幕禁飞区
         credits.move_to(ORIGIN + DOWN * 1.5).shift(RIGHT * 0.5)
-        self.play(LaggedStart(*[FadeIn(line, shift=UP * 0.2) for line in credits], lag_ratio=0.2, run_time=2.2))
+        self.play(StaggeredReveal(credits, lag_ratio=0.2, shift=UP * 0.2), run_time=2.2)
         slow_wait(self, 4.0)  # V14 节奏控制：所有等待时间使用 slow_wait
 
         # V13: 使用生命周期管理
@@ -0,0 +1,73 @@
+"""
+tools/profiling.py 的耗时类别归属：用构造的调用栈（根 → 叶）检查 StackSampler._category。
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from profiling import SCENE_CATEGORY, StackSampler  # noqa: E402
+
+SITE = os.path.join(os.sep, "venv", "lib", "site-packages")
+SCENE_FILE = os.path.join(os.sep, "repo", "sobel_v15_full.py")
+
+
+def frame(*parts: str, name: str = "f"):
+    return (name, os.path.join(*parts), 1)
+
+
+MANIM_SCENE = frame(SITE, "manim", "scene", "scene.py", name="play_internal")
+CAIRO_RENDERER = frame(SITE, "manim", "renderer", "cairo_renderer.py", name="play")
+USER_CONSTRUCT = frame(SCENE_FILE, name="construct")
+
+
+def category(*stack):
+    return StackSampler._category(list(stack), SCENE_FILE)
+
+
+def test_interpolation_under_cairo_renderer_is_not_cairo():
+    stack = (
+        USER_CONSTRUCT,
+        CAIRO_RENDERER,
+        MANIM_SCENE,
+        frame(SITE, "manim", "animation", "transform.py", name="interpolate_mobject"),
+        frame(SITE, "manim", "mobject", "mobject.py", name="interpolate"),
+    )
+    assert category(*stack) == "Mobject 运算"
+    assert category(*stack[:-1]) == "动画插值"
+
+
+def test_camera_frames_are_cairo():
+    stack = (
+        USER_CONSTRUCT,
+        CAIRO_RENDERER,
+        frame(SITE, "manim", "camera", "camera.py", name="display_vectorized"),
+    )
+    assert category(*stack) == "Cairo 光栅化"
+    assert category(*stack, frame(SITE, "cairo", "__init__.py")) == "Cairo 光栅化"
+
+
+def test_bezier_wins_over_calling_mobject():
+    stack = (
+        USER_CONSTRUCT,
+        CAIRO_RENDERER,
+        frame(SITE, "manim", "mobject", "types", "vectorized_mobject.py"),
+        frame(SITE, "manim", "utils", "bezier.py", name="partial_bezier_points"),
+    )
+    assert category(*stack) == "贝塞尔"
+
+
+def test_updater_lambda_in_scene_file():
+    stack = (USER_CONSTRUCT, CAIRO_RENDERER, MANIM_SCENE, frame(SCENE_FILE, name="<lambda>"))
+    assert category(*stack) == SCENE_CATEGORY
+
+
+def test_manim_lib_helper():
+    stack = (USER_CONSTRUCT, frame(os.sep, "repo", "manim_lib", "utils.py", name="safer_text"))
+    assert category(*stack) == "manim_lib"
+
+
+def test_renderer_alone_is_other():
+    assert StackSampler._category([CAIRO_RENDERER, MANIM_SCENE]) == "其他"
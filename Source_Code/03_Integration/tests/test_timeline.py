@@ -0,0 +1,104 @@
+"""
+manim_lib.timeline：按 Scene 3.5 的用法（逐步预算 + 扫掠补完）驱动时间线，不经渲染器逐帧插值。
+8×8 演示恰好全部逐步播放，扫掠分支只能在这里覆盖。
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from manim import RIGHT, UP, Square, ValueTracker  # noqa: E402
+
+from manim_lib.timeline import Timeline  # noqa: E402
+
+STEPS, BUDGET = 10, 4
+
+
+def build():
+    cells = [Square(side_length=0.5, fill_opacity=0.9).move_to(RIGHT * i) for i in range(STEPS)]
+    window = Square(side_length=0.6)
+    tracker = ValueTracker(0.0)
+    points = [RIGHT * i + UP for i in range(STEPS)]
+    values = [float(i) for i in range(STEPS)]
+
+    timeline = Timeline()
+    for cell, point, value in list(zip(cells, points, values))[:BUDGET]:
+        timeline.set_value(tracker, value)
+        timeline.move(window, point, run_time=0.25)
+        timeline.reveal(cell, run_time=0.15, scale=0.3)
+    timeline.wipe(
+        cells[BUDGET:],
+        run_time=3.0,
+        tracker=tracker,
+        values=values[BUDGET:],
+        mover=window,
+        points=points[BUDGET:],
+    )
+    return timeline, cells, window, tracker, points
+
+
+def run(timeline, frames=60):
+    animation = timeline.compile()
+    animation.begin()
+    for alpha in np.linspace(0.0, 1.0, frames):
+        animation.interpolate(alpha)
+    animation.finish()
+    return animation
+
+
+def test_wipe_reaches_final_state():
+    timeline, cells, window, tracker, points = build()
+    originals = [cell.points.copy() for cell in cells]
+    run(timeline)
+
+    for cell, original in zip(cells, originals):
+        np.testing.assert_allclose(cell.points, original)
+        np.testing.assert_allclose(cell.fill_rgbas[:, 3], 0.9)
+    np.testing.assert_allclose(window.get_center(), points[-1])
+    assert tracker.get_value() == STEPS - 1
+
+
+def test_wipe_hides_cells_until_their_start():
+    timeline, cells, _, _, _ = build()
+    detail_end = BUDGET * 0.4
+    animation = timeline.compile()
+    animation.begin()
+    animation.interpolate(detail_end / timeline.duration)
+    assert cells[BUDGET - 1].fill_rgbas[0, 3] == pytest.approx(0.9)
+    assert all(cell.fill_rgbas[0, 3] == 0.0 for cell in cells[BUDGET + 1:])
+    animation.finish()
+
+
+def test_finish_unbinds_wipe_buffers():
+    timeline, cells, _, _, _ = build()
+    run(timeline)
+    wiped = cells[BUDGET:]
+    wiped[0].shift(UP)
+    for other in wiped[1:]:
+        assert not np.shares_memory(wiped[0].points, other.points)
+        assert other.get_center()[1] == pytest.approx(0.0)
+
+
+def test_rewind_restores_hidden_state():
+    timeline, cells, _, _, _ = build()
+    animation = timeline.compile()
+    animation.begin()
+    animation.interpolate(1.0)
+    animation.interpolate(0.0)
+    assert all(cell.fill_rgbas[0, 3] == 0.0 for cell in cells)
+    animation.finish()
+
+
+def test_zero_duration_timeline_finishes_tracks():
+    cells = [Square(fill_opacity=1).move_to(RIGHT * i) for i in range(3)]
+    timeline = Timeline().wipe(cells, run_time=0.0)
+    timeline.play(scene=None)
+    cells[0].shift(UP)
+    assert cells[1].get_center()[1] == pytest.approx(0.0)
+    assert cells[1].fill_rgbas[0, 3] == pytest.approx(1.0)
@@ -0,0 +1,251 @@
+"""
+渲染基准：以固定低分辨率 / 帧率渲染一组代表性场景，记录每帧秒数、construct 用时与峰值内存，并与基线比较。
+
+用法（在 03_Integration 下执行）:
+    python tools/benchmark.py
+    # 每个场景跑 3 次取最好成绩，容差 15%
+    python tools/benchmark.py --repeat 3 --tolerance 0.15
+    # 首次使用 / 确认性能变化符合预期后，在参考机器上记录基线（随代码一起提交 tools/benchmark_baseline.json）
+    python tools/benchmark.py --update-baseline
+
+参数：
+    --file        Manim 源文件，默认 sobel_v15_full.py
+    --scene       可多次指定，默认 BENCH_SCENES
+    --baseline    基线 JSON，默认 tools/benchmark_baseline.json
+    --tolerance   相对容差，默认 0.10；超出容差且超出该指标噪声下限记为回归
+    --repeat      每个场景重复次数，用时取最小值、内存取最大值，默认 1
+    --timeout     每次运行超时秒数，默认 900
+    --report-json 本次结果输出路径
+    --update-baseline 把本次结果写为新基线，不做比较
+
+指标：
+    sec_per_frame   正常渲染（含写视频）用时 / 输出帧数
+    construct_time  空跑用时：skip_animations + 空跑渲染器下执行 construct，不光栅化（同 smoke_render.py --dry-run）
+    peak_rss_mb     子进程峰值内存（wait4 ru_maxrss）
+
+说明：
+    - 每个场景在独立子进程中串行运行，并固定绑定一个 CPU 核（复用 smoke_all.SmokeScheduler）；
+    - 分辨率与帧率写死在 BENCH_CONFIG 中，与质量标识无关；基线记录了该配置，不一致时不比较；
+    - 媒体输出写到临时目录：每次都从冷的 LaTeX 缓存开始，空跑阶段承担 LaTeX 编译，
+      渲染阶段的每帧秒数因此不含 LaTeX 编译；
+    - 基线与机器相关：基线中记录了机器信息，不一致时只提示，仍照常比较；
+    - 尚未记录基线（文件不存在或没有任何指标）时不运行、不比较，提示先 --update-baseline，返回 2；
+    - 基线中某场景 / 指标为 null（如新加的场景）或本次缺少该指标，记为 missing 并判失败；
+      有回归或缺失返回 1。
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from smoke_all import JobResult, SmokeScheduler
+from smoke_render import dry_run_scene, load_scene_class, render_options
+
+BENCH_SCENES = ["Scene3_5Convolution", "Scene4Vision", "Scene4_6RealImage", "Scene0Intro"]
+
+# 直接指定像素与帧率：不能同时传 quality，manim 会在像素之后应用 quality 并覆盖它们
+BENCH_CONFIG = {"pixel_width": 480, "pixel_height": 270, "frame_rate": 15}
+
+# 指标 → 噪声下限（与基线的差值不超过该值时不算回归）
+METRICS = {
+    "sec_per_frame": 0.002,
+    "construct_time": 0.25,
+    "peak_rss_mb": 25.0,
+}
+
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+
+
+def machine_info() -> dict:
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def measure(file: Path, scene: str) -> dict:
+    """子进程内执行：先空跑计 construct 用时，再正常渲染计每帧秒数。"""
+    from manim import tempconfig
+
+    scene_class = load_scene_class(file, scene)
+    with tempfile.TemporaryDirectory(prefix="bench_media_") as media_dir:
+
+        def options(dry_run: bool) -> dict:
+            result = {k: v for k, v in render_options("ql", dry_run).items() if k != "quality"}
+            result.update(BENCH_CONFIG, media_dir=media_dir)
+            return result
+
+        with tempconfig(options(dry_run=True)):
+            started = time.perf_counter()
+            dry_run_scene(scene_class).render()
+            construct_time = time.perf_counter() - started
+
+        with tempconfig(options(dry_run=False)):
+            instance = scene_class()
+            started = time.perf_counter()
+            instance.render()
+            render_time = time.perf_counter() - started
+
+    frames = int(round(instance.renderer.time * BENCH_CONFIG["frame_rate"]))
+    return {
+        "frames": frames,
+        "plays": instance.renderer.num_plays,
+        "render_time": render_time,
+        "construct_time": construct_time,
+        "sec_per_frame": render_time / frames if frames else None,
+    }
+
+
+def worker_command(file: Path, scene: str, result_json: str) -> List[str]:
+    return [sys.executable, str(Path(__file__).resolve()), "--file", str(file), "--worker", scene, result_json]
+
+
+def run_benchmarks(file: Path, scenes: List[str], repeat: int, timeout: int) -> Dict[str, dict]:
+    """串行运行各场景 repeat 次；用时取最小值，内存取最大值。"""
+    results: Dict[str, dict] = {}
+    scheduler = SmokeScheduler(jobs=1, timeout=timeout, pin=True)
+    with tempfile.TemporaryDirectory(prefix="bench_") as scratch:
+        for scene in scenes:
+            runs = []
+            for index in range(repeat):
+                result_json = str(Path(scratch) / f"{scene}.{index}.json")
+                job = scheduler.run(JobResult(str(file), scene, command=worker_command(file, scene, result_json)))
+                if job.status != "ok" or not Path(result_json).exists():
+                    runs = []
+                    break
+                run = json.loads(Path(result_json).read_text(encoding="utf-8"))
+                run["peak_rss_mb"] = job.peak_rss_mb
+                runs.append(run)
+            if not runs:
+                results[scene] = {"status": "fail"}
+                continue
+            best = min(runs, key=lambda r: r["render_time"])
+            results[scene] = {
+                "status": "ok",
+                "frames": best["frames"],
+                "plays": best["plays"],
+                "sec_per_frame": min(r["sec_per_frame"] for r in runs) if best["sec_per_frame"] else None,
+                "construct_time": min(r["construct_time"] for r in runs),
+                "peak_rss_mb": max((r["peak_rss_mb"] for r in runs if r["peak_rss_mb"] is not None), default=None),
+            }
+    return results
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.4g}"
+
+
+def compare(results: Dict[str, dict], baseline: dict, tolerance: float) -> List[str]:
+    """打印对比表，返回回归项与缺失项（"场景.指标"）。"""
+    regressions = []
+    print(f"{'scene':<22}{'metric':<16}{'baseline':>10}{'current':>10}{'change':>9}  status")
+    for scene, current in results.items():
+        if current["status"] != "ok":
+            print(f"{scene:<22}{'-':<16}{'':>10}{'':>10}{'':>9}  fail")
+            regressions.append(f"{scene}（运行失败）")
+            continue
+        base = baseline.get("scenes", {}).get(scene, {})
+        for metric, floor in METRICS.items():
+            old, new = base.get(metric), current.get(metric)
+            if old is None or new is None:
+                change, status = "", "MISSING"
+                regressions.append(f"{scene}.{metric}（{'基线' if old is None else '本次'}缺失）")
+            else:
+                delta = new - old
+                change = f"{delta / old:+.1%}" if old else ""
+                if delta > max(old * tolerance, floor):
+                    status = "REGRESSION"
+                    regressions.append(f"{scene}.{metric}")
+                elif -delta > max(old * tolerance, floor):
+                    status = "faster"
+                else:
+                    status = "ok"
+            print(f"{scene:<22}{metric:<16}{_fmt(old):>10}{_fmt(new):>10}{change:>9}  {status}")
+    return regressions
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def baseline_recorded(baseline: Optional[dict]) -> bool:
+    """基线文件存在且至少记录了一个指标值。"""
+    if not baseline:
+        return False
+    return any(run.get(metric) is not None for run in baseline.get("scenes", {}).values() for metric in METRICS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="代表性场景渲染基准 + 基线回归检查")
+    parser.add_argument("--file", default="sobel_v15_full.py", help="Manim 源文件")
+    parser.add_argument("--scene", action="append", help="场景名，可多次指定")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="基线 JSON 路径")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="相对容差，默认 0.10")
+    parser.add_argument("--repeat", type=int, default=1, help="每个场景重复次数")
+    parser.add_argument("--timeout", type=int, default=900, help="每次运行超时时间（秒）")
+    parser.add_argument("--report-json", help="本次结果输出路径")
+    parser.add_argument("--update-baseline", action="store_true", help="把本次结果写为新基线")
+    parser.add_argument("--worker", nargs=2, metavar=("SCENE", "RESULT_JSON"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    file = Path(args.file)
+    if not file.exists():
+        print(f"[error] 文件不存在: {file}")
+        sys.exit(1)
+
+    if args.worker:
+        scene, result_json = args.worker
+        Path(result_json).write_text(json.dumps(measure(file, scene)), encoding="utf-8")
+        return
+
+    # 遥测会给每个 play 增加额外开销，基准中一律关闭
+    os.environ.pop("SOBEL_TELEMETRY", None)
+    scenes = args.scene or BENCH_SCENES
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    if not args.update_baseline and not baseline_recorded(baseline):
+        print(f"[error] 尚未记录基线: {baseline_path}")
+        print("[hint] 在参考机器上运行 python tools/benchmark.py --update-baseline，并把生成的基线随代码提交")
+        sys.exit(2)
+    if not args.update_baseline and baseline.get("config") != BENCH_CONFIG:
+        print(f"[error] 基线配置 {baseline.get('config')} 与当前 {BENCH_CONFIG} 不一致，请先 --update-baseline")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    results = run_benchmarks(file, scenes, max(1, args.repeat), args.timeout)
+    payload = {"file": file.name, "config": BENCH_CONFIG, "machine": machine_info(), "scenes": results}
+    if args.report_json:
+        Path(args.report_json).write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.update_baseline:
+        failed = [s for s, r in results.items() if r["status"] != "ok"]
+        if failed:
+            print(f"[fail] {', '.join(failed)} 运行失败，未更新基线")
+            sys.exit(1)
+        baseline_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"[ok] 基线已写入 {baseline_path}（用时 {time.perf_counter() - started:.1f}s）")
+        return
+
+    if baseline.get("machine") and baseline["machine"] != payload["machine"]:
+        print(f"[warn] 基线机器 {baseline.get('machine')} 与当前机器不同，结果仅供参考")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"[fail] {len(regressions)} 项回归或缺失（容差 {args.tolerance:.0%}）: {', '.join(regressions)}")
+        if any("缺失" in r for r in regressions):
+            print("[hint] 新增场景或指标需在参考机器上 --update-baseline 后随代码提交")
+        sys.exit(1)
+    print(f"[ok] 无回归（容差 {args.tolerance:.0%}，用时 {time.perf_counter() - started:.1f}s）")
+
+
+if __name__ == "__main__":
+    main()
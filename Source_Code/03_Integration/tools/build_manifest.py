@@ -0,0 +1,142 @@
+"""
+增量渲染清单：按内容哈希判断哪些场景需要重渲，其余直接复用已有分段视频。
+
+用法（在 03_Integration 下执行）:
+    python tools/build_manifest.py sobel_v15_full.py --quality qh
+    # 只看指定场景
+    python tools/build_manifest.py sobel_v15_full.py --scene Scene4Vision --scene Scene5Outro
+
+参数：
+    file         Manim 源文件
+    --scene      可多次指定，默认取总场景 run_sub_scenes(...) 中的全部分场景
+    --composite  总场景类名，默认 FullSobelVideo
+    --quality    manim 质量标识，默认 qh
+    --media-dir  manim 输出根目录（清单存放于 <media-dir>/render_manifest.json），默认 media
+
+哈希输入（任一变化即视为需要重渲）：
+    - 场景类源码，以及它引用到的同文件其他类的源码（传递闭包）；
+    - 源文件中的模块级代码（import、常量、顶层函数）；
+    - 源文件 import 的本地模块 / 包（如 manim_lib）的全部 .py 源码；
+    - 质量标识与 manim 版本。
+源码均以 ast 静态截取，无需导入 manim 即可判断。
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+def manim_version() -> str:
+    try:
+        return version("manim")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _local_sources(file: Path, tree: ast.Module) -> List[Path]:
+    """源文件 import 的本地模块 / 包所包含的 .py 文件（按路径排序，保证哈希稳定）。"""
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    sources = []
+    for name in sorted(names):
+        package = file.parent / name
+        if (package / "__init__.py").exists():
+            sources.extend(sorted(package.rglob("*.py")))
+        elif (file.parent / f"{name}.py").exists():
+            sources.append(file.parent / f"{name}.py")
+    return sources
+
+
+def scene_fingerprints(file: Path, scenes: Iterable[str], quality: str) -> Dict[str, str]:
+    text = file.read_text(encoding="utf-8")
+    tree = ast.parse(text, filename=str(file))
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    shared = hashlib.blake2b(digest_size=16)
+    shared.update(f"{quality.lstrip('p')}\0{manim_version()}\0".encode())
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            shared.update((ast.get_source_segment(text, node) or "").encode())
+    for source in _local_sources(file, tree):
+        shared.update(str(source.relative_to(file.parent)).encode())
+        shared.update(source.read_bytes())
+
+    result = {}
+    for scene in scenes:
+        if scene not in classes:
+            raise SystemExit(f"[error] {file} 中没有场景类 {scene}")
+        # 传递闭包：场景引用到的同文件类（基类、被委托的 helper 所在类）一并计入
+        pending, seen = [scene], set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            for node in ast.walk(classes[name]):
+                if isinstance(node, ast.Name) and node.id in classes:
+                    pending.append(node.id)
+        digest = shared.copy()
+        for name in sorted(seen):
+            digest.update(ast.get_source_segment(text, classes[name]).encode())
+        result[scene] = digest.hexdigest()
+    return result
+
+
+class RenderManifest:
+    """JSON 清单：键为 "<文件>:<场景>:<质量>"，值记录内容哈希与分段视频路径。"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, dict] = {}
+        if path.exists():
+            self.entries = json.loads(path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def key(file: Path, scene: str, quality: str) -> str:
+        return f"{file.name}:{scene}:{quality.lstrip('p')}"
+
+    def is_fresh(self, key: str, digest: str) -> bool:
+        entry = self.entries.get(key)
+        return bool(entry) and entry["hash"] == digest and Path(entry["segment"]).exists()
+
+    def segment(self, key: str) -> Optional[Path]:
+        entry = self.entries.get(key)
+        return Path(entry["segment"]) if entry else None
+
+    def record(self, key: str, digest: str, segment: Path):
+        self.entries[key] = {"hash": digest, "segment": str(segment)}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+
+
+def main():
+    from render_segments import sub_scenes
+
+    parser = argparse.ArgumentParser(description="查看各场景内容哈希与增量渲染状态")
+    parser.add_argument("file", help="Manim 源文件，如 sobel_v15_full.py")
+    parser.add_argument("--scene", action="append", help="场景名，可多次指定")
+    parser.add_argument("--composite", default="FullSobelVideo", help="总场景类名")
+    parser.add_argument("--quality", default="qh", help="manim 质量标识，默认 qh")
+    parser.add_argument("--media-dir", default="media", help="manim 输出根目录")
+    args = parser.parse_args()
+
+    file = Path(args.file)
+    scenes = args.scene or sub_scenes(file, args.composite)
+    manifest = RenderManifest(Path(args.media_dir) / "render_manifest.json")
+    for scene, digest in scene_fingerprints(file, scenes, args.quality).items():
+        state = "cached" if manifest.is_fresh(manifest.key(file, scene, args.quality), digest) else "stale"
+        print(f"[{state}] {scene} {digest}")
+
+
+if __name__ == "__main__":
+    main()
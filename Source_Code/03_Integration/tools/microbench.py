@@ -0,0 +1,248 @@
+"""
+manim_lib 微基准：不渲染视频，直接计时库函数与数值内核，按输入规模输出 ops/s 与扩展曲线。
+
+用法（在 03_Integration 下执行）:
+    python tools/microbench.py
+    # 只跑名称包含关键字的用例
+    python tools/microbench.py --filter convolve --filter pixel_grid
+    # 结果写入 JSON，便于优化前后对比
+    python tools/microbench.py --json bench/before.json
+
+参数：
+    --filter  可多次指定，只跑名称包含该子串的用例
+    --repeat  每个规模重复计时轮数，取最快一轮，默认 5
+    --json    结果输出路径
+    --list    只列出用例
+
+用例（见 BENCHMARKS）：
+    safer_text[冷/热]            文本缓存未命中（Pango 排版）/ 命中（只拷贝）
+    SubtitleManager.show[普通/常驻条]  空场景：play / wait 不渲染，只计字幕构建、背景条与注册开销
+    LayerManager.set_layer      大型 VGroup 分层（整族遍历 + 写 z_index）
+    ensure_safe_bounds          大型 VGroup 求包围盒（已在安全区内的稳态）
+    convolve_normalized[图像/核] Scene 3.5 / 4.6 的示意卷积
+    pixel_grid                  Scene 3.5 / 4.6 的像素方块图构建
+
+说明：
+    - 每个规模先由 timeit.autorange 标定循环次数（单轮 ≥ 0.2s），再重复 --repeat 轮取最快；
+    - 扩展指数 = log(耗时比) / log(规模比)：≈1 线性，≈2 平方（如卷积随图像边长）；
+    - 计时期间 timeit 会关闭 GC，冷启动类用例（safer_text[冷]）的数值偏乐观。
+"""
+
+import argparse
+import json
+import math
+import sys
+import timeit
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+from manim import Square, VGroup  # noqa: E402
+
+from manim_lib import (  # noqa: E402
+    LayerManager,
+    SubtitleManager,
+    convolve_normalized,
+    ensure_safe_bounds,
+    pixel_grid,
+    safer_text,
+)
+from manim_lib.utils import _build_text  # noqa: E402
+
+SOBEL_X = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]])
+
+
+@dataclass
+class Bench:
+    name: str
+    setup: Callable[[int], Callable[[], object]]  # 规模 → 待计时的无参函数
+    sizes: Sequence[int]
+    unit: str
+
+
+@dataclass
+class Point:
+    size: int
+    ops_per_sec: float
+    us_per_op: float
+    scaling: Optional[float] = None
+
+
+@dataclass
+class BenchResult:
+    name: str
+    unit: str
+    points: List[Point] = field(default_factory=list)
+
+
+class NullScene:
+    """只记账不渲染的场景替身：满足 SubtitleManager 用到的 play / wait / add / remove 接口。"""
+
+    def __init__(self):
+        self.mobjects = []
+        self.plays = 0
+
+    def add(self, *mobjects):
+        self.mobjects.extend(m for m in mobjects if m not in self.mobjects)
+
+    def remove(self, *mobjects):
+        self.mobjects = [m for m in self.mobjects if m not in mobjects]
+
+    def play(self, *animations, **kwargs):
+        self.plays += 1
+
+    def wait(self, duration=1.0, **kwargs):
+        pass
+
+
+def _sample_text(length: int) -> str:
+    base = "梯度衡量亮度变化的快慢，Sobel 核在两个方向上求导。"
+    return (base * (length // len(base) + 1))[:length]
+
+
+def _square_group(count: int) -> VGroup:
+    group = VGroup(*[Square(side_length=0.2) for _ in range(count)])
+    return group.arrange_in_grid(cols=max(1, int(math.sqrt(count))), buff=0.05)
+
+
+# ---------------------------------------------------------------------- 用例
+def setup_safer_text_cold(length: int):
+    text = _sample_text(length)
+
+    def run():
+        _build_text.cache_clear()
+        safer_text(text, font_size=28)
+
+    return run
+
+
+def setup_safer_text_warm(length: int):
+    text = _sample_text(length)
+    safer_text(text, font_size=28)
+    return lambda: safer_text(text, font_size=28)
+
+
+def _setup_subtitle(length: int, persistent_bar: bool):
+    # 两条字幕交替显示：每次都走替换旧字幕的路径
+    texts = [_sample_text(length), _sample_text(length)[::-1]]
+    manager = SubtitleManager(NullScene(), persistent_bar=persistent_bar)
+    manager.prerender(texts)
+    state = {"index": 0}
+
+    def run():
+        state["index"] ^= 1
+        manager.show(texts[state["index"]], wait_after=0)
+
+    return run
+
+
+def setup_subtitle_show(length: int):
+    return _setup_subtitle(length, persistent_bar=False)
+
+
+def setup_subtitle_show_bar(length: int):
+    return _setup_subtitle(length, persistent_bar=True)
+
+
+def setup_set_layer(count: int):
+    group = _square_group(count)
+    LayerManager.set_layer(group, LayerManager.L_PASSIVE)
+    return lambda: LayerManager.set_layer(group, LayerManager.L_ACTIVE)
+
+
+def setup_ensure_safe_bounds(count: int):
+    group = _square_group(count)
+    ensure_safe_bounds(group.scale_to_fit_width(20))
+    return lambda: ensure_safe_bounds(group)
+
+
+def setup_convolve_image(size: int):
+    vals = np.random.default_rng(0).random((size, size))
+    return lambda: convolve_normalized(vals, SOBEL_X)
+
+
+def setup_convolve_kernel(ksize: int):
+    vals = np.random.default_rng(0).random((10, 10))
+    kernel = np.tile(np.arange(ksize) - ksize // 2, (ksize, 1))  # 水平差分核，与 Sobel X 同向
+    return lambda: convolve_normalized(vals, kernel)
+
+
+def setup_pixel_grid(size: int):
+    vals = np.random.default_rng(0).random((size, size))
+    return lambda: pixel_grid(vals, cell=0.22)
+
+
+BENCHMARKS = [
+    Bench("safer_text[冷]", setup_safer_text_cold, (8, 32, 128), "字符"),
+    Bench("safer_text[热]", setup_safer_text_warm, (8, 32, 128), "字符"),
+    Bench("SubtitleManager.show[普通]", setup_subtitle_show, (8, 24, 48), "字符"),
+    Bench("SubtitleManager.show[常驻条]", setup_subtitle_show_bar, (8, 24, 48), "字符"),
+    Bench("LayerManager.set_layer", setup_set_layer, (100, 1000, 5000), "物体"),
+    Bench("ensure_safe_bounds", setup_ensure_safe_bounds, (100, 1000, 5000), "物体"),
+    Bench("convolve_normalized[图像]", setup_convolve_image, (10, 20, 40, 80), "图像边长"),
+    Bench("convolve_normalized[核]", setup_convolve_kernel, (3, 5, 7), "核边长"),
+    Bench("pixel_grid", setup_pixel_grid, (5, 10, 20), "网格边长"),
+]
+
+
+# ---------------------------------------------------------------------- 计时与输出
+def measure(bench: Bench, repeat: int) -> BenchResult:
+    result = BenchResult(bench.name, bench.unit)
+    for size in bench.sizes:
+        timer = timeit.Timer(bench.setup(size))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        point = Point(size, 1.0 / best, best * 1e6)
+        if result.points:
+            prev = result.points[-1]
+            point.scaling = math.log(point.us_per_op / prev.us_per_op) / math.log(size / prev.size)
+        result.points.append(point)
+    return result
+
+
+def format_result(result: BenchResult, width: int = 30) -> str:
+    lines = [f"== {result.name}（规模：{result.unit}） ==", f"{'size':>8}{'ops/s':>12}{'us/op':>12}{'scaling':>9}"]
+    slowest = max(p.us_per_op for p in result.points)
+    for p in result.points:
+        scaling = "-" if p.scaling is None else f"{p.scaling:.2f}"
+        bar = "█" * max(1, round(width * p.us_per_op / slowest))
+        lines.append(f"{p.size:>8}{p.ops_per_sec:>12.1f}{p.us_per_op:>12.1f}{scaling:>9}  {bar}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="manim_lib 微基准（不渲染）")
+    parser.add_argument("--filter", action="append", help="只跑名称包含该子串的用例，可多次指定")
+    parser.add_argument("--repeat", type=int, default=5, help="每个规模重复计时轮数")
+    parser.add_argument("--json", help="结果输出路径")
+    parser.add_argument("--list", action="store_true", help="只列出用例")
+    args = parser.parse_args()
+
+    selected = [b for b in BENCHMARKS if not args.filter or any(f in b.name for f in args.filter)]
+    if args.list:
+        for b in selected:
+            print(f"{b.name:<32}{b.unit}: {', '.join(map(str, b.sizes))}")
+        return
+    if not selected:
+        print(f"[error] 没有匹配的用例: {args.filter}")
+        sys.exit(1)
+
+    results = []
+    for bench in selected:
+        print(f"[run] {bench.name}", flush=True)
+        results.append(measure(bench, max(1, args.repeat)))
+        print(format_result(results[-1]) + "\n", flush=True)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(
+            json.dumps([asdict(r) for r in results], indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+        print(f"[ok] {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+采样分析器：后台线程定时抓取主线程调用栈，导出火焰图并按场景行 / manim_lib 函数 / 耗时类别聚合。
+
+由 smoke_render.py --profile 调用；也可单独使用：
+    with StackSampler(interval=0.005) as sampler:
+        scene.render()
+    sampler.export("prof/scene4", scene_file=Path("sobel_v15_full.py"))
+
+输出：
+    PREFIX.speedscope.json  speedscope 采样格式（https://www.speedscope.app）
+    PREFIX.collapsed.txt    折叠栈（flamegraph.pl / inferno 通用格式）
+    PREFIX.summary.txt      汇总表：场景源码行、manim_lib 函数、类别（Cairo / 贝塞尔 / 文本 / LaTeX …）
+
+说明：
+    - 场景文件中的栈帧按“当前行号”标注，always_redraw 的 lambda、updater 等会直接落到源码行；
+      其余栈帧按函数（定义行）标注，保证火焰图可合并；
+    - 采样依赖 GIL 切换（采样期间切换间隔缩短为采样间隔的 1/4），长时间持有 GIL 的 C 调用
+      （如单次 Cairo 绘制）仍会略微偏向其后的 Python 帧；
+      秒数按墙钟 / 样本数均摊。
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+Frame = Tuple[str, str, int]  # (函数名, 文件, 行号)
+
+
+def _package(*parts: str) -> str:
+    """路径片段 → 目录匹配串（如 /manim/camera/），避免 cairo_renderer.py 之类的文件名误中。"""
+    return os.sep + os.sep.join(parts) + os.sep
+
+
+SCENE_CATEGORY = "场景代码"
+
+# 由叶向根找到第一个命中的类别；同一帧命中多个类别时顺序即优先级。
+# 场景文件的帧单独归为 SCENE_CATEGORY（见 StackSampler._category）。
+CATEGORIES = [
+    ("LaTeX", ("tex_file_writing", "tex_templates")),
+    ("文本 / Pango", ("manimpango", "text_mobject", _package("text"))),
+    ("SVG 解析", ("svg_mobject", "svgelements")),
+    ("贝塞尔", ("bezier.py", "space_ops.py")),
+    ("Cairo 光栅化", (_package("manim", "camera"), _package("cairo"))),
+    ("视频编码", ("scene_file_writer", _package("av"))),
+    ("manim_lib", (_package("manim_lib"),)),
+    ("动画插值", (_package("manim", "animation"),)),
+    ("Mobject 运算", (_package("manim", "mobject"),)),
+    ("numpy", (_package("numpy"),)),
+]
+
+
+class StackSampler:
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._switch_interval = sys.getswitchinterval()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def start(self):
+        # 缩短 GIL 切换间隔，让采样线程能按时打断长时间运行的纯 Python 代码
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 4))
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, os.path.abspath(code.co_filename), frame.f_lineno, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    @property
+    def seconds_per_sample(self) -> float:
+        """按墙钟均摊：GIL 争用会让实际采样数少于 墙钟 / 间隔。"""
+        total = sum(self.samples.values())
+        return self.duration / total if total else self.interval
+
+    # ------------------------------------------------------------------ 标注
+    @staticmethod
+    def _label(frame, scene_file: Optional[str]) -> Frame:
+        name, filename, line, first_line = frame
+        # 场景文件按当前行，其余按函数定义行
+        return (name, filename, line if filename == scene_file else first_line)
+
+    def stacks(self, scene_file: Optional[Path] = None) -> Counter:
+        target = str(scene_file.resolve()) if scene_file else None
+        merged: Counter = Counter()
+        for stack, count in self.samples.items():
+            merged[tuple(self._label(f, target) for f in stack)] += count
+        return merged
+
+    # ------------------------------------------------------------------ 导出
+    @staticmethod
+    def _name(frame: Frame) -> str:
+        name, filename, line = frame
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def write_collapsed(self, path: Path, stacks: Counter):
+        lines = [";".join(self._name(f).replace(";", ":") for f in stack) + f" {count}" for stack, count in stacks.items()]
+        path.write_text("\n".join(sorted(lines)) + "\n", encoding="utf-8")
+
+    def write_speedscope(self, path: Path, stacks: Counter, name: str):
+        index = {}
+        frames = []
+        samples, weights = [], []
+        for stack, count in stacks.items():
+            ids = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                ids.append(index[frame])
+            samples.append(ids)
+            weights.append(count * self.seconds_per_sample)
+        payload = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "name": name,
+            "exporter": "calculus-of-vision tools/profiling.py",
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    def export(self, prefix: str, scene_file: Optional[Path] = None, name: str = "render") -> List[Path]:
+        base = Path(prefix)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        stacks = self.stacks(scene_file)
+        paths = [
+            base.with_name(base.name + ".speedscope.json"),
+            base.with_name(base.name + ".collapsed.txt"),
+            base.with_name(base.name + ".summary.txt"),
+        ]
+        self.write_speedscope(paths[0], stacks, name)
+        self.write_collapsed(paths[1], stacks)
+        paths[2].write_text(self.report(scene_file, top=None) + "\n", encoding="utf-8")
+        return paths
+
+    # ------------------------------------------------------------------ 汇总
+    @staticmethod
+    def _innermost(stack, predicate) -> Optional[Frame]:
+        for frame in reversed(stack):
+            if predicate(frame[1]):
+                return frame
+        return None
+
+    @staticmethod
+    def _category(stack, scene_file: Optional[str] = None) -> str:
+        for _, filename, _ in reversed(stack):
+            if filename == scene_file:
+                return SCENE_CATEGORY
+            for category, needles in CATEGORIES:
+                if any(n in filename for n in needles):
+                    return category
+        return "其他"
+
+    def _table(self, title: str, counts: Counter, total: int, top: Optional[int]) -> List[str]:
+        lines = [f"== {title} ==", f"{'samples':>8}{'seconds':>10}{'share':>8}  location"]
+        for label, count in counts.most_common(top):
+            lines.append(f"{count:>8}{count * self.seconds_per_sample:>10.2f}{count / total:>8.1%}  {label}")
+        return lines + [""]
+
+    def report(self, scene_file: Optional[Path] = None, top: Optional[int] = 15) -> str:
+        stacks = self.stacks(scene_file)
+        total = sum(stacks.values()) or 1
+        target = str(scene_file.resolve()) if scene_file else None
+        lib_dir = os.sep + "manim_lib" + os.sep
+
+        by_line: Counter = Counter()
+        by_lib: Counter = Counter()
+        by_category: Counter = Counter()
+        for stack, count in stacks.items():
+            if target:
+                frame = self._innermost(stack, lambda f: f == target)
+                by_line[self._name(frame) if frame else "(场景代码之外)"] += count
+            frame = self._innermost(stack, lambda f: lib_dir in f)
+            if frame:
+                by_lib[self._name(frame)] += count
+            by_category[self._category(stack, target)] += count
+
+        lines = [f"采样 {total} 次，间隔 {self.interval * 1000:.1f}ms，墙钟 {self.duration:.1f}s", ""]
+        if target:
+            lines += self._table("场景源码行（含下层调用）", by_line, total, top)
+        lines += self._table("manim_lib 函数（含下层调用）", by_lib, total, top)
+        lines += self._table("耗时类别", by_category, total, None)
+        return "\n".join(lines)
+
+
+__all__ = ["StackSampler", "CATEGORIES", "SCENE_CATEGORY"]
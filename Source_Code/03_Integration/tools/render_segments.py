@@ -0,0 +1,197 @@
+"""
+分段并行渲染：把总场景（如 FullSobelVideo）拆成各分场景，各自独立进程渲染，再用 ffmpeg concat 无损拼接。
+
+用法（在 03_Integration 下执行）:
+    python tools/render_segments.py sobel_v15_full.py
+    # 指定并行数与质量，输出到自定义文件
+    python tools/render_segments.py sobel_v15_full.py --jobs 6 --quality qh --output renders/full.mp4
+
+参数：
+    file         Manim 源文件
+    --composite  总场景类名，默认 FullSobelVideo；分场景列表取自其 run_sub_scenes(...) 调用
+    --scene      可多次指定，只渲染/拼接这些分场景（按总场景中的顺序）
+    --jobs       并行进程数，默认 CPU 核数
+    --quality    manim 质量标识，默认 qh（各段同一质量 → 分辨率、帧率、编码参数一致）
+    --media-dir  manim 输出根目录，默认 media
+    --output     拼接结果，默认与分段同目录的 <总场景>_segments.mp4
+    --timeout    每段超时秒数，默认不限
+    --force      忽略增量清单，全部重渲
+
+说明：
+    - 各段与总场景使用同一 manim 配置与编码器（libx264 / yuv420p），可直接 -c copy 拼接，不重新编码；
+    - 任一段失败则不拼接，返回非零；已成功的段保留在 media 目录，修好后可只重渲失败的段（--scene）；
+    - 拼接前逐段核对清单：任一段（包括 --scene 之外的段）内容哈希已变或视频缺失，列出这些段并拒绝拼接；
+    - 增量：内容哈希未变（见 build_manifest.py）且分段视频仍在的场景直接复用，不再启动 manim；
+    - 与总场景画面一致的前提：每个分场景结束时清空自己的物体，3D 分场景把机位复位到默认
+      （Scene4Vision 已复位）；总场景中 3D 相机未复位时 CompositeScene 会记警告；
+    - 各段使用按场景固定的 LaTeX / 文本缓存目录（<media-dir>/Tex/segments/<场景>、texts/segments/<场景>），
+      并行进程不会同时写同一缓存文件，重跑时仍可复用。
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from build_manifest import RenderManifest, scene_fingerprints
+
+
+def sub_scenes(file: Path, composite: str = "FullSobelVideo") -> List[str]:
+    """静态解析总场景 construct 中 run_sub_scenes(...) 的分场景名（不导入 manim）。"""
+    tree = ast.parse(file.read_text(encoding="utf-8"), filename=str(file))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == composite:
+            for call in ast.walk(node):
+                if (
+                    isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Attribute)
+                    and call.func.attr == "run_sub_scenes"
+                ):
+                    return [arg.id for arg in call.args if isinstance(arg, ast.Name)]
+    raise SystemExit(f"[error] {file} 中未找到 {composite}.run_sub_scenes(...)")
+
+
+# manim 质量标识 → 输出子目录（分辨率 + 帧率）
+QUALITY_DIRS = {"ql": "480p15", "qm": "720p30", "qh": "1080p60", "qp": "1440p60", "qk": "2160p60"}
+
+
+def segment_path(media_dir: Path, file: Path, scene: str, quality: str) -> Optional[Path]:
+    """manim 输出位于 videos/<文件名>/<质量目录>/<场景>.mp4；只取同一质量，避免混拼不同编码参数。"""
+    subdir = QUALITY_DIRS.get(quality.lstrip("p"), "*")
+    found = sorted(
+        (media_dir / "videos" / file.stem).glob(f"{subdir}/{scene}.mp4"),
+        key=lambda p: p.stat().st_mtime,
+    )
+    return found[-1] if found else None
+
+
+def segment_config(media_dir: Path, scene: str, scratch: Path) -> Path:
+    """写出该段的 manim 配置文件：只覆盖 tex_dir / text_dir，其余沿用默认与命令行参数。"""
+    config = scratch / f"{scene}.cfg"
+    config.write_text(
+        "[CLI]\n"
+        f"tex_dir = {(media_dir / 'Tex' / 'segments' / scene).resolve()}\n"
+        f"text_dir = {(media_dir / 'texts' / 'segments' / scene).resolve()}\n",
+        encoding="utf-8",
+    )
+    return config
+
+
+def render_segment(file: Path, scene: str, quality: str, media_dir: Path, timeout: Optional[int], scratch: Path) -> int:
+    cmd = [
+        "manim",
+        f"-{quality}",
+        "--write_to_movie",
+        "--media_dir",
+        str(media_dir),
+        "--config_file",
+        str(segment_config(media_dir, scene, scratch)),
+        str(file),
+        scene,
+    ]
+    print(f"[run] {' '.join(cmd)}", flush=True)
+    started = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        print(f"[timeout] {scene} 超时 {timeout}s", flush=True)
+        return 124
+    status = "ok" if proc.returncode == 0 else "fail"
+    print(f"[{status}] {scene} {time.perf_counter() - started:.1f}s", flush=True)
+    return proc.returncode
+
+
+def concat_segments(segments: List[Path], output: Path) -> int:
+    """ffmpeg concat demuxer + 流复制：不解码、不重编码。"""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as listing:
+        for seg in segments:
+            path = str(seg.resolve()).replace("'", "'\\''")
+            listing.write(f"file '{path}'\n")
+    try:
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-loglevel", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", listing.name,
+            "-c", "copy",
+            "-movflags", "+faststart",
+            str(output),
+        ]
+        print(f"[run] {' '.join(cmd)}", flush=True)
+        return subprocess.call(cmd)
+    finally:
+        os.unlink(listing.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="分场景并行渲染 + 无损拼接")
+    parser.add_argument("file", help="Manim 源文件，如 sobel_v15_full.py")
+    parser.add_argument("--composite", default="FullSobelVideo", help="总场景类名")
+    parser.add_argument("--scene", action="append", help="只处理这些分场景，可多次指定")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="并行进程数")
+    parser.add_argument("--quality", default="qh", help="manim 质量标识，默认 qh")
+    parser.add_argument("--media-dir", default="media", help="manim 输出根目录")
+    parser.add_argument("--output", help="拼接输出文件")
+    parser.add_argument("--timeout", type=int, default=None, help="每段超时时间（秒）")
+    parser.add_argument("--force", action="store_true", help="忽略增量清单，全部重渲")
+    args = parser.parse_args()
+
+    file = Path(args.file)
+    if not file.exists():
+        print(f"[error] 文件不存在: {file}")
+        sys.exit(1)
+    media_dir = Path(args.media_dir)
+    scenes = sub_scenes(file, args.composite)
+    requested = [s for s in scenes if not args.scene or s in args.scene]
+    manifest = RenderManifest(media_dir / "render_manifest.json")
+    digests = scene_fingerprints(file, scenes, args.quality)
+    todo = []
+    for scene in requested:
+        if not args.force and manifest.is_fresh(manifest.key(file, scene, args.quality), digests[scene]):
+            print(f"[cached] {scene}")
+        else:
+            todo.append(scene)
+
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="segments_") as scratch, ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        codes = dict(zip(todo, pool.map(
+            lambda s: render_segment(file, s, args.quality, media_dir, args.timeout, Path(scratch)), todo
+        )))
+    for scene, rc in codes.items():
+        segment = segment_path(media_dir, file, scene, args.quality)
+        if rc == 0 and segment is not None:
+            manifest.record(manifest.key(file, scene, args.quality), digests[scene], segment)
+    manifest.save()
+    failed = [s for s, rc in codes.items() if rc != 0]
+    if failed:
+        print(f"[fail] {len(failed)} 段失败: {', '.join(failed)}；未拼接")
+        sys.exit(1)
+
+    # 拼接列表中的每一段都必须与当前源码一致：过期或缺失的段不拼，避免把旧画面混进成片
+    keys = {s: manifest.key(file, s, args.quality) for s in scenes}
+    stale = [s for s in scenes if not manifest.is_fresh(keys[s], digests[s])]
+    if stale:
+        print(f"[fail] 分段视频缺失或已过期: {', '.join(stale)}；未拼接")
+        print(f"[hint] 先重渲这些场景: {' '.join(f'--scene {s}' for s in stale)}")
+        sys.exit(1)
+    segments = [manifest.segment(keys[s]) for s in scenes]
+
+    output = Path(args.output) if args.output else segments[0].parent / f"{args.composite}_segments.mp4"
+    rc = concat_segments(segments, output)
+    if rc != 0:
+        print(f"[fail] 拼接失败，退出码 {rc}")
+        sys.exit(rc)
+    print(f"[ok] {output}（{len(scenes)} 段，用时 {time.perf_counter() - started:.1f}s）")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,35 +5,240 @@
     python tools/smoke_all.py --file sobel_v15_full.py --scene FullSobelVideo
     # 或多文件多场景
     python tools/smoke_all.py --file sobel_v14_full.py --scene FullSobelVideo --scene Scene0Intro
+    # 4 个进程并行，输出 JSON 与 JUnit 报告
+    python tools/smoke_all.py --jobs 4 --report-json smoke.json --report-junit smoke.xml
+    # 空跑全部场景：只执行 construct，数秒内暴露导入 / NameError / LaTeX 错误
+    python tools/smoke_all.py --dry-run --all-scenes --jobs 8
 
 参数：
     --file   可多次指定，默认自动匹配 sobel_v*.py
     --scene  可多次指定，若未指定场景则默认只跑 FullSobelVideo（若存在）
     --quality pql/pqh 等，默认 pql
     --timeout 每个任务超时秒数，默认 120
+    --jobs   并行任务数，默认 1（串行）
+    --fail-fast 任一任务失败即取消其余任务
+    --report-json / --report-junit 结构化结果（每项：耗时、峰值内存、退出码）
+    --dry-run 空跑（见 smoke_render.py --dry-run），报告额外包含 play 数、名义总时长与错误信息
+    --all-scenes 跑文件中所有 Scene* / *Video 场景类（静态解析），代替 --scene
 
-实现：调用本目录的 smoke_render.py 逐个执行，任一失败返回非零。
+实现：
+    - 每个 (文件, 场景) 直接启动 manim（命令同 smoke_render.py），独立进程组，超时或取消时整组终止；
+    - 有界进程池：同时最多 --jobs 个 manim；Linux 下 --jobs 不少于可用核数时按槽位把各任务绑定到不同 CPU 核
+      （少于核数时不绑定，manim 的 ffmpeg / LaTeX 子进程可用空闲核）；亲和性在父进程中于启动后设置；
+    - 峰值内存取自 wait4 的 ru_maxrss（含子进程），不支持的平台记为 null；
+    - 任一失败返回非零。
 """
 
 import argparse
+import ast
+import json
+import os
+import queue
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import List, Optional
 
+from smoke_render import smoke_command
 
-def run_one(file: Path, scene: str, quality: str, timeout: int) -> int:
-    cmd = [
+TIMEOUT_EXIT = 124
+CANCELLED_EXIT = 130
+
+
+@dataclass
+class JobResult:
+    file: str
+    scene: str
+    status: str = "pending"  # ok / fail / timeout / cancelled
+    exit_code: Optional[int] = None
+    wall_time: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    cpu: Optional[int] = None
+    plays: Optional[int] = None
+    nominal_duration: Optional[float] = None
+    error: Optional[str] = None
+    command: List[str] = field(default_factory=list)
+
+
+class SmokeScheduler:
+    """
+    有界进程池：槽位决定 CPU 亲和性，支持逐任务超时与整体取消。
+
+    pin=None 时仅在 jobs ≥ 可用核数时绑核；pin=True 总是绑核（基准测试需要稳定的单核计时）。
+    """
+
+    def __init__(self, jobs: int, timeout: int, fail_fast: bool = False, pin: Optional[bool] = None):
+        self.jobs = max(1, jobs)
+        self.timeout = timeout
+        self.fail_fast = fail_fast
+        self.cancelled = threading.Event()
+        self._slots: "queue.Queue[int]" = queue.Queue()
+        for slot in range(self.jobs):
+            self._slots.put(slot)
+        self._running = {}
+        self._lock = threading.Lock()
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        if pin is None:
+            pin = self.jobs >= len(cpus)
+        self._cpus = cpus if pin and len(cpus) > 1 else []
+
+    @staticmethod
+    def _pin(proc: subprocess.Popen, cpu: Optional[int]):
+        # 在父进程中设置：工作线程里用 preexec_fn 可能让子进程在 exec 前死锁。
+        # 子进程此时仍在解释器启动阶段，之后派生的线程与 ffmpeg / LaTeX 进程都会继承该亲和性
+        if cpu is None:
+            return
+        try:
+            os.sched_setaffinity(proc.pid, {cpu})
+        except ProcessLookupError:
+            pass
+
+    def _kill(self, proc: subprocess.Popen):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _wait(self, proc: subprocess.Popen):
+        """等待进程结束，返回 (退出码, 峰值 RSS MB)。"""
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") else (
+                -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+            )
+            # Linux 下 ru_maxrss 单位为 KB，macOS 为字节
+            scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+            return proc.returncode, usage.ru_maxrss / scale
+        return proc.wait(), None
+
+    def run(self, job: JobResult) -> JobResult:
+        slot = self._slots.get()
+        try:
+            if self.cancelled.is_set():
+                job.status, job.exit_code = "cancelled", CANCELLED_EXIT
+                return job
+            job.cpu = self._cpus[slot % len(self._cpus)] if self._cpus else None
+            print(f"[run] {job.file}:{job.scene} (cpu {job.cpu if job.cpu is not None else '-'})", flush=True)
+            started = time.perf_counter()
+            proc = subprocess.Popen(
+                job.command,
+                stdout=subprocess.DEVNULL,
+                start_new_session=hasattr(os, "killpg"),
+            )
+            self._pin(proc, job.cpu)
+            timed_out = threading.Event()
+
+            def _expire():
+                timed_out.set()
+                self._kill(proc)
+
+            timer = threading.Timer(self.timeout, _expire)
+            timer.start()
+            with self._lock:
+                self._running[proc.pid] = proc
+            try:
+                job.exit_code, job.peak_rss_mb = self._wait(proc)
+            finally:
+                timer.cancel()
+                with self._lock:
+                    self._running.pop(proc.pid, None)
+            job.wall_time = time.perf_counter() - started
+            if timed_out.is_set():
+                job.status, job.exit_code = "timeout", TIMEOUT_EXIT
+            elif self.cancelled.is_set() and job.exit_code != 0:
+                job.status, job.exit_code = "cancelled", CANCELLED_EXIT
+            else:
+                job.status = "ok" if job.exit_code == 0 else "fail"
+            if job.status != "ok" and self.fail_fast:
+                self.cancel()
+            print(f"[{job.status}] {job.file}:{job.scene} {job.wall_time:.1f}s 退出码 {job.exit_code}", flush=True)
+            return job
+        finally:
+            self._slots.put(slot)
+
+    def cancel(self):
+        self.cancelled.set()
+        with self._lock:
+            running = list(self._running.values())
+        for proc in running:
+            self._kill(proc)
+
+    def run_all(self, jobs: List[JobResult]) -> List[JobResult]:
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = [pool.submit(self.run, job) for job in jobs]
+            try:
+                return [f.result() for f in futures]
+            except KeyboardInterrupt:
+                print("[cancel] 中断，终止所有任务", flush=True)
+                self.cancel()
+                return [f.result() for f in futures]
+
+
+def scene_classes(file: Path) -> List[str]:
+    """静态列出文件中的场景类（Scene 开头或 Video 结尾），不导入 manim。"""
+    tree = ast.parse(file.read_text(encoding="utf-8"), filename=str(file))
+    return [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and (node.name.startswith("Scene") or node.name.endswith("Video"))
+    ]
+
+
+def dry_run_command(file: Path, scene: str, quality: str, timeout: int, result_json: str) -> List[str]:
+    return [
         sys.executable,
         str(Path(__file__).parent / "smoke_render.py"),
         str(file),
         scene,
-        "--quality",
-        quality,
-        "--timeout",
-        str(timeout),
+        "--quality", quality,
+        "--timeout", str(timeout),
+        "--dry-run",
+        "--result-json", result_json,
     ]
-    print(f"[run] {' '.join(cmd)}")
-    return subprocess.call(cmd)
+
+
+def write_json(results: List[JobResult], path: Path, wall_time: float):
+    payload = {
+        "wall_time": wall_time,
+        "failures": sum(r.status != "ok" for r in results),
+        "jobs": [asdict(r) for r in results],
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def write_junit(results: List[JobResult], path: Path, wall_time: float):
+    suite = ET.Element(
+        "testsuite",
+        name="smoke_all",
+        tests=str(len(results)),
+        failures=str(sum(r.status in ("fail", "timeout") for r in results)),
+        skipped=str(sum(r.status == "cancelled" for r in results)),
+        time=f"{wall_time:.3f}",
+    )
+    for r in results:
+        case = ET.SubElement(suite, "testcase", classname=Path(r.file).stem, name=r.scene, time=f"{r.wall_time:.3f}")
+        if r.status == "cancelled":
+            ET.SubElement(case, "skipped", message="cancelled")
+        elif r.status != "ok":
+            ET.SubElement(case, "failure", message=f"{r.status}, exit code {r.exit_code}")
+        rss = "n/a" if r.peak_rss_mb is None else f"{r.peak_rss_mb:.1f}"
+        out = f"peak_rss_mb={rss} cpu={r.cpu}"
+        if r.plays is not None:
+            out += f" plays={r.plays} nominal_duration={r.nominal_duration:.1f}"
+        if r.error:
+            out += f"\n{r.error}"
+        ET.SubElement(case, "system-out").text = out
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
 
 
 def main():
@@ -42,6 +247,12 @@ def main():
     parser.add_argument("--scene", action="append", help="场景名，可多次指定")
     parser.add_argument("--quality", default="pql", help="manim 质量，默认 pql")
     parser.add_argument("--timeout", type=int, default=120, help="每个任务超时时间（秒）")
+    parser.add_argument("--jobs", type=int, default=1, help="并行任务数，默认 1")
+    parser.add_argument("--fail-fast", action="store_true", help="任一失败即取消其余任务")
+    parser.add_argument("--report-json", help="JSON 报告输出路径")
+    parser.add_argument("--report-junit", help="JUnit XML 报告输出路径")
+    parser.add_argument("--dry-run", action="store_true", help="空跑：只执行 construct，不光栅化、不写帧")
+    parser.add_argument("--all-scenes", action="store_true", help="跑文件中的全部场景类")
     args = parser.parse_args()
 
     files = args.file
@@ -49,26 +260,50 @@ def main():
         files = [str(p) for p in Path(".").glob("sobel_v*.py")]
     scenes = args.scene or ["FullSobelVideo"]
 
-    failures = 0
+    jobs, result_files = [], {}
+    scratch = tempfile.TemporaryDirectory(prefix="smoke_dry_")
     for f in files:
         fpath = Path(f)
         if not fpath.exists():
             print(f"[skip] 文件不存在: {fpath}")
             continue
-        for scene in scenes:
-            rc = run_one(fpath, scene, args.quality, args.timeout)
-            if rc != 0:
-                print(f"[fail] {fpath}:{scene} 退出码 {rc}")
-                failures += 1
+        for scene in scene_classes(fpath) if args.all_scenes else scenes:
+            if args.dry_run:
+                result_json = str(Path(scratch.name) / f"{len(jobs)}.json")
+                command = dry_run_command(fpath, scene, args.quality, args.timeout, result_json)
+                result_files[len(jobs)] = Path(result_json)
             else:
-                print(f"[ok] {fpath}:{scene}")
+                command = smoke_command(fpath, scene, args.quality)
+            jobs.append(JobResult(str(fpath), scene, command=command))
+
+    started = time.perf_counter()
+    results = SmokeScheduler(args.jobs, args.timeout, args.fail_fast).run_all(jobs)
+    wall_time = time.perf_counter() - started
 
+    for index, path in result_files.items():
+        if path.exists():
+            detail = json.loads(path.read_text(encoding="utf-8"))
+            job = results[index]
+            job.plays, job.nominal_duration, job.error = detail["plays"], detail["nominal_duration"], detail["error"]
+    scratch.cleanup()
+    if args.dry_run:
+        for r in results:
+            if r.error:
+                print(f"[{r.status}] {r.file}:{r.scene} {r.error}")
+        total = sum(r.nominal_duration or 0.0 for r in results)
+        print(f"空跑 {len(results)} 项，合计 {sum(r.plays or 0 for r in results)} 次 play，名义时长 {total:.1f}s")
+
+    if args.report_json:
+        write_json(results, Path(args.report_json), wall_time)
+    if args.report_junit:
+        write_junit(results, Path(args.report_junit), wall_time)
+
+    failures = sum(r.status != "ok" for r in results)
     if failures:
-        print(f"总计失败 {failures} 项")
+        print(f"总计失败 {failures} 项（用时 {wall_time:.1f}s）")
         sys.exit(1)
-    print("全部通过")
+    print(f"全部通过（用时 {wall_time:.1f}s）")
 
 
 if __name__ == "__main__":
     main()
-
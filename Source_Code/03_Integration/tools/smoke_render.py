@@ -4,26 +4,53 @@
 用法（在 03_Integration 下执行）:
     python tools/smoke_render.py sobel_v15_full.py FullSobelVideo
     # 仅低质量预览，超时自动中断（默认 120s）
+    python tools/smoke_render.py sobel_v15_full.py FullSobelVideo --dry-run
+    # 只执行 construct，不光栅化、不写帧，数秒内报告导入/NameError/LaTeX 错误
+    python tools/smoke_render.py sobel_v15_full.py Scene4Vision --profile prof/scene4
+    # 采样分析：火焰图可拖入 https://www.speedscope.app 查看
 
 参数：
     file        Manim 源文件
     scene       场景类名
     --quality   manim 质量标识，默认 pql
     --timeout   超时时间秒，默认 120
+    --dry-run   空跑：跳过动画渲染，只构建物体、每个 play 调用一次更新器
+    --result-json 空跑结果（状态、play 数、名义总时长、错误）写入该文件
+    --profile PREFIX 在本进程内用采样分析器渲染，写出 PREFIX.speedscope.json / PREFIX.collapsed.txt /
+                PREFIX.summary.txt（按场景行、manim_lib 函数、耗时类别聚合）
+    --profile-interval 采样间隔秒，默认 0.005
 
 说明：
     - 使用 subprocess 调用 manim，质量低、禁用缓存，便于快速发现导入/资源/MathTex 报错。
-    - 不做并行，避免占满显存；如需批量可自行编排循环。
+    - 空跑在本进程内以 skip_animations + 空跑渲染器（manim_lib.DryRunRenderer）实例化场景：
+      每个 play 直接跳到终态（更新器执行一次），静态底图、终态帧与静帧等待都不光栅化，
+      不写帧、不编码，也不创建 media 目录。
+    - 单个场景串行执行；批量并行见 smoke_all.py --jobs。
 """
 
 import argparse
+import importlib.util
+import json
+import signal
 import subprocess
 import sys
+import time
+import traceback
 from pathlib import Path
+from typing import List, Optional
 
+# 质量标识（去掉预览前缀 p）→ manim 质量名
+QUALITY_NAMES = {
+    "ql": "low_quality",
+    "qm": "medium_quality",
+    "qh": "high_quality",
+    "qp": "production_quality",
+    "qk": "fourk_quality",
+}
 
-def run_smoke(file: Path, scene: str, quality: str, timeout: int) -> int:
-    cmd = [
+
+def smoke_command(file: Path, scene: str, quality: str) -> List[str]:
+    return [
         "manim",
         f"-{quality}",
         "--disable_caching",
@@ -31,6 +58,10 @@ def run_smoke(file: Path, scene: str, quality: str, timeout: int) -> int:
         str(file),
         scene,
     ]
+
+
+def run_smoke(file: Path, scene: str, quality: str, timeout: int) -> int:
+    cmd = smoke_command(file, scene, quality)
     print(f"[run] {' '.join(cmd)} (timeout {timeout}s)")
     try:
         proc = subprocess.run(cmd, timeout=timeout)
@@ -40,12 +71,107 @@ def run_smoke(file: Path, scene: str, quality: str, timeout: int) -> int:
     return proc.returncode
 
 
+def render_options(quality: str, dry_run: bool = False) -> dict:
+    """本进程内渲染用的 manim 配置（与 smoke_command 的命令行参数对应）。"""
+    options = {
+        "disable_caching": True,
+        "preview": False,
+        "quality": QUALITY_NAMES.get(quality.lstrip("p"), "low_quality"),
+    }
+    if dry_run:
+        options.update({"dry_run": True, "write_to_movie": False, "save_last_frame": False})
+    else:
+        options["write_to_movie"] = True
+    return options
+
+
+def load_scene_class(file: Path, scene: str):
+    """按路径导入场景文件（同目录的 manim_lib 可被找到），返回场景类。"""
+    sys.path.insert(0, str(file.resolve().parent))
+    spec = importlib.util.spec_from_file_location(file.stem.replace(".", "_"), file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, scene)
+
+
+def dry_run_scene(scene_class):
+    """
+    以空跑渲染器实例化场景。BaseScene / BaseThreeDScene 在 config.dry_run 下自行换用
+    DryRunRenderer（保留各自的相机类）；其余场景按其 __init__ 默认的 camera_class 显式传入。
+    """
+    import inspect
+
+    from manim import Camera
+    from manim_lib.renderer import DryRunRenderer
+
+    if getattr(scene_class, "hold_static_frames", False):
+        return scene_class(skip_animations=True)
+    parameter = inspect.signature(scene_class.__init__).parameters.get("camera_class")
+    camera_class = Camera if parameter is None or parameter.default is inspect.Parameter.empty else parameter.default
+    return scene_class(renderer=DryRunRenderer(camera_class=camera_class), skip_animations=True)
+
+
+def profile_render(file: Path, scene: str, quality: str, prefix: str, interval: float) -> int:
+    """在采样分析器下正常渲染场景，导出 speedscope / collapsed / 汇总表（见 profiling.py）。"""
+    from manim import tempconfig
+    from profiling import StackSampler
+
+    sampler = StackSampler(interval=interval)
+    rc = 0
+    try:
+        with tempconfig(render_options(quality)), sampler:
+            load_scene_class(file, scene)().render()
+    except Exception:
+        traceback.print_exc()
+        rc = 1
+    for path in sampler.export(prefix, scene_file=file, name=f"{file.name}:{scene}"):
+        print(f"[profile] {path}")
+    print(sampler.report(scene_file=file))
+    return rc
+
+
+def dry_run(file: Path, scene: str, quality: str, timeout: Optional[int] = None) -> dict:
+    """在本进程内空跑场景，返回 {status, plays, nominal_duration, wall_time, error}。"""
+    result = {"status": "ok", "plays": 0, "nominal_duration": 0.0, "wall_time": 0.0, "error": None}
+    started = time.perf_counter()
+    if timeout and hasattr(signal, "SIGALRM"):
+
+        def _expire(signum, frame):
+            raise TimeoutError(f"超时 {timeout}s")
+
+        signal.signal(signal.SIGALRM, _expire)
+        signal.alarm(timeout)
+    instance = None
+    try:
+        from manim import tempconfig
+
+        with tempconfig(render_options(quality, dry_run=True)):
+            instance = dry_run_scene(load_scene_class(file, scene))
+            instance.render()
+    except Exception as exc:
+        result["status"] = "timeout" if isinstance(exc, TimeoutError) else "fail"
+        result["error"] = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+        traceback.print_exc()
+    finally:
+        if timeout and hasattr(signal, "SIGALRM"):
+            signal.alarm(0)
+    renderer = getattr(instance, "renderer", None)
+    result["plays"] = getattr(renderer, "num_plays", 0)
+    result["nominal_duration"] = float(getattr(renderer, "time", 0.0))
+    result["wall_time"] = time.perf_counter() - started
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(description="Manim 场景低质量冒烟测试")
     parser.add_argument("file", help="Manim 源文件，如 sobel_v15_full.py")
     parser.add_argument("scene", help="场景类名，如 FullSobelVideo")
     parser.add_argument("--quality", default="pql", help="manim 质量标识，默认 pql")
     parser.add_argument("--timeout", type=int, default=120, help="超时时间（秒）")
+    parser.add_argument("--dry-run", action="store_true", help="空跑：不光栅化、不写帧")
+    parser.add_argument("--result-json", help="空跑结果输出路径")
+    parser.add_argument("--profile", metavar="PREFIX", help="采样分析渲染，输出文件前缀")
+    parser.add_argument("--profile-interval", type=float, default=0.005, help="采样间隔（秒）")
     args = parser.parse_args()
 
     file = Path(args.file)
@@ -53,6 +179,20 @@ def main():
         print(f"[error] 文件不存在: {file}")
         sys.exit(1)
 
+    if args.profile:
+        sys.exit(profile_render(file, args.scene, args.quality, args.profile, args.profile_interval))
+
+    if args.dry_run:
+        result = dry_run(file, args.scene, args.quality, args.timeout)
+        if args.result_json:
+            Path(args.result_json).write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        summary = f"{result['plays']} 次 play，名义时长 {result['nominal_duration']:.1f}s，用时 {result['wall_time']:.1f}s"
+        if result["status"] == "ok":
+            print(f"[ok] 空跑通过：{summary}")
+            sys.exit(0)
+        print(f"[{result['status']}] 空跑失败：{result['error']}（{summary}）")
+        sys.exit(124 if result["status"] == "timeout" else 1)
+
     rc = run_smoke(file, args.scene, args.quality, args.timeout)
     if rc == 0:
         print("[ok] 渲染成功")